@@ -11,5 +11,9 @@ setup(
         "tabulate>=0.9.0",
         "rich>=13.0.0",
     ],
+    extras_require={
+        # Parquet input files and --export-format parquet
+        "parquet": ["pyarrow>=10.0.0"],
+    },
     python_requires=">=3.8",
 ) 
\ No newline at end of file
@@ -0,0 +1,226 @@
+import random
+from typing import Callable, Dict, List, Optional, Sequence, Set
+from models.schedule import Schedule, TimeSlot, ScheduleEntry
+from models.subject import Subject
+from models.lecturer import Lecturer
+from models.group import Group
+from models.classroom import Classroom
+from models.time_grid import TimeGrid
+from .constraints import ConstraintViolation
+from .evaluator import ScheduleEvaluator, Move
+from .problem_index import ProblemIndex
+from .validator import HardConstraintValidator
+
+ProgressCallback = Callable[[int, float], None]
+
+class SchedulerBase:
+    """Problem setup, evaluation and schedule construction shared by the schedulers.
+    
+    Builds the static problem index, the hard constraint validator and the
+    evaluator, and holds the helpers that build random valid schedules and
+    apply moves to them. Subclasses add the search itself.
+    """
+    
+    def __init__(self,
+                 subjects: List[Subject],
+                 lecturers: List[Lecturer],
+                 groups: List[Group],
+                 classrooms: List[Classroom],
+                 legacy_scoring: bool = False,
+                 seed: Optional[int] = None,
+                 rng: Optional[random.Random] = None,
+                 time_grid: Optional[TimeGrid] = None):
+        """Initialize the scheduler.
+        
+        With ``legacy_scoring`` violations are counted once per entry of the
+        affected lecturer or group, as ``calculate_quality_score`` does.
+        
+        All random choices are drawn from ``rng``, or from a new generator
+        seeded with ``seed``, so several schedulers can run in one process.
+        
+        Classes are placed on ``time_grid`` (5 days of 4 periods by default).
+        """
+        self.subjects = subjects
+        self.lecturers = lecturers
+        self.groups = groups
+        self.classrooms = classrooms
+        self.legacy_scoring = legacy_scoring
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.time_grid = time_grid or TimeGrid()
+        
+        # Static lookups shared by all operators
+        self.problem_index = ProblemIndex.build(subjects, lecturers, groups, classrooms)
+        self.validator = HardConstraintValidator(self.problem_index)
+        self.evaluator = ScheduleEvaluator(
+            legacy_scoring=legacy_scoring, time_grid=self.time_grid, validator=self.validator
+        )
+        
+        # Track best solutions
+        self.best_fitness_history: List[float] = []
+        self.best_schedule: Optional[Schedule] = None
+        self.best_fitness: float = 0.0
+    
+    def get_violations(self, schedule: Schedule) -> List[ConstraintViolation]:
+        """Get all constraint violations for a schedule."""
+        return self.evaluator.evaluate(schedule).violations
+    
+    def evaluate_schedule(self, schedule: Schedule) -> float:
+        """Evaluate the quality of a schedule."""
+        fitness = schedule.cached_fitness(self.evaluator)
+        if fitness is None:
+            fitness = self.evaluator.calculate_score(schedule)
+            schedule.remember_fitness(self.evaluator, fitness)
+        return fitness
+    
+    def _generate_random_schedule(self) -> Schedule:
+        """Generate a random valid schedule."""
+        schedule = Schedule()
+        
+        # Create a list of all required classes
+        required_classes = list(self.problem_index.required_classes)
+        
+        # Shuffle the classes
+        self.rng.shuffle(required_classes)
+        
+        # Try to schedule each class
+        for group, subject, is_lecture in required_classes:
+            self._schedule_class(schedule, group, subject, is_lecture)
+        
+        return schedule
+    
+    def _schedule_class(self,
+                       schedule: Schedule,
+                       group: Group,
+                       subject: Subject,
+                       is_lecture: bool,
+                       max_attempts: int = 20) -> bool:
+        """Schedule a single class with multiple attempts."""
+        # Find suitable lecturers
+        suitable_lecturers = self.problem_index.eligible_lecturers(subject.subject_id, is_lecture)
+        if not suitable_lecturers:
+            return False
+        
+        # Try different combinations
+        for _ in range(max_attempts):
+            lecturer = self.rng.choice(suitable_lecturers)
+            time_slot = self._find_available_slot(schedule, group, lecturer)
+            if not time_slot:
+                continue
+            
+            classroom = self._find_suitable_classroom(
+                schedule, time_slot, group.student_count, is_lecture and subject.requires_subgroups
+            )
+            if not classroom:
+                continue
+            
+            # Create and add schedule entry
+            entry = ScheduleEntry(
+                subject=subject,
+                lecturer=lecturer,
+                classroom=classroom,
+                groups=[group],
+                is_lecture=is_lecture
+            )
+            
+            schedule.add_entry(time_slot, entry)
+            return True
+        
+        return False
+    
+    def _find_available_slot(self,
+                           schedule: Schedule,
+                           group: Group,
+                           lecturer: Lecturer,
+                           other_groups: Sequence[Group] = ()) -> Optional[TimeSlot]:
+        """Find an available time slot for a class.
+        
+        ``other_groups`` are further groups attending the class, which must
+        be free too; gaps are only measured in the timetable of ``group``.
+        """
+        # Get occupied slots
+        group_slots = schedule.get_group_slots(group)
+        lecturer_slots = schedule.get_lecturer_slots(lecturer)
+        other_slots = [schedule.get_group_slots(other) for other in other_groups]
+        
+        # Get slots by day for the group
+        slots_by_day: Dict[int, Set[int]] = {}
+        for slot in group_slots:
+            if slot.day not in slots_by_day:
+                slots_by_day[slot.day] = set()
+            slots_by_day[slot.day].add(slot.period)
+        
+        # Try to find a slot that minimizes gaps
+        available_slots = []
+        for slot in self.time_grid.slots:
+            if slot in group_slots or slot in lecturer_slots or any(slot in busy for busy in other_slots):
+                continue
+            
+            # Calculate gap penalty
+            day_slots = slots_by_day.get(slot.day)
+            if not day_slots:
+                gap_penalty = 0
+            else:
+                min_period = min(day_slots)
+                max_period = max(day_slots)
+                if slot.period < min_period:
+                    gap_penalty = min_period - slot.period
+                elif slot.period > max_period:
+                    gap_penalty = slot.period - max_period
+                else:
+                    gap_penalty = 1
+            available_slots.append((slot, gap_penalty))
+        
+        if not available_slots:
+            return None
+        
+        # Sort by gap penalty and randomly choose from the best options
+        available_slots.sort(key=lambda x: x[1])
+        best_penalty = available_slots[0][1]
+        best_slots = [slot for slot, penalty in available_slots if penalty == best_penalty]
+        return self.rng.choice(best_slots)
+    
+    def _find_suitable_classroom(self,
+                               schedule: Schedule,
+                               time_slot: TimeSlot,
+                               student_count: int,
+                               requires_lab: bool) -> Optional[Classroom]:
+        """Find a suitable classroom for a class."""
+        # Get occupied classrooms
+        occupied_classrooms = schedule.get_slot_classrooms(time_slot)
+        
+        # Prefer classrooms that are closer to the required capacity
+        for classroom in self.problem_index.candidate_classrooms(student_count, requires_lab):
+            if classroom not in occupied_classrooms:
+                return classroom
+        
+        return None
+    
+    @staticmethod
+    def _fits(schedule: Schedule, entry: ScheduleEntry, slot: TimeSlot,
+              leaving: Optional[ScheduleEntry] = None) -> bool:
+        """Whether ``entry`` can join ``slot`` once ``leaving`` has left it."""
+        lecturers = schedule.get_slot_lecturers(slot)
+        groups = schedule.get_slot_groups(slot)
+        classrooms = schedule.get_slot_classrooms(slot)
+        if entry.lecturer in lecturers and (leaving is None or entry.lecturer != leaving.lecturer):
+            return False
+        if entry.classroom in classrooms and (leaving is None or entry.classroom != leaving.classroom):
+            return False
+        return all(
+            group not in groups or (leaving is not None and group in leaving.groups)
+            for group in entry.groups
+        )
+    
+    @staticmethod
+    def _apply_moves(schedule: Schedule, moves: List[Move]) -> None:
+        """Apply (entry, old slot, new slot) moves to a schedule."""
+        for entry, old_slot, new_slot in moves:
+            if old_slot is not None:
+                schedule.remove_entry(old_slot, entry)
+            if new_slot is not None:
+                schedule.add_entry(new_slot, entry)
+    
+    @classmethod
+    def _undo_moves(cls, schedule: Schedule, moves: List[Move]) -> None:
+        """Revert moves applied by ``_apply_moves``."""
+        cls._apply_moves(schedule, [(entry, new_slot, old_slot) for entry, old_slot, new_slot in reversed(moves)])
\ No newline at end of file
@@ -0,0 +1,43 @@
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
+
+class FitnessCache:
+    """Bounded least-recently-used cache of fitness values."""
+    
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._values: "OrderedDict[Hashable, float]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[float]:
+        """Get a cached fitness, counting the hit or miss."""
+        value = self._values.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._values.move_to_end(key)
+        return value
+    
+    def put(self, key: Hashable, value: float) -> None:
+        """Cache a fitness, evicting the least recently used one if full."""
+        if self.max_size <= 0:
+            return
+        self._values[key] = value
+        self._values.move_to_end(key)
+        if len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+    
+    def items(self) -> List[Tuple[Hashable, float]]:
+        """Cached values, least recently used first."""
+        return list(self._values.items())
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def __len__(self) -> int:
+        return len(self._values)
\ No newline at end of file
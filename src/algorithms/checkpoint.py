@@ -0,0 +1,106 @@
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+FORMAT_VERSION = 1
+
+@dataclass
+class Checkpoint:
+    """State of an ``evolve`` run between two generations.
+    
+    Schedules are kept in their chromosome encoding and the fitness cache in
+    least-recently-used order. The breakdowns used for delta evaluation are
+    not kept: they only save recomputing scores, and evaluations are counted
+    against the fitness cache. A run resumed from a checkpoint therefore
+    continues exactly like the run that wrote it, evaluation counts included.
+    """
+    generation: int  # next generation to run
+    population: List[np.ndarray]
+    rng_state: tuple
+    best_genes: Optional[np.ndarray]
+    best_fitness: float
+    best_fitness_history: List[float]
+    last_best: float
+    stale_generations: int
+    evaluations: int
+    seconds: float
+    cache: List[Tuple[bytes, float]] = field(default_factory=list)
+    counters: Dict[str, int] = field(default_factory=dict)
+    
+    def save(self, path: str) -> None:
+        """Write the checkpoint to a compressed .npz file, atomically.
+        
+        The data goes to a temporary file in the same directory, which then
+        replaces ``path``, so a crash never leaves a partial checkpoint.
+        """
+        version, state, gauss_next = self.rng_state
+        keys = [key for key, _ in self.cache]
+        key_size = len(keys[0]) if keys else 0
+        arrays = {
+            "format_version": np.array(FORMAT_VERSION),
+            "generation": np.array(self.generation),
+            "gene_rows": np.array([len(genes) for genes in self.population], dtype=np.int64),
+            "genes": np.concatenate(self.population) if self.population else np.empty((0, 4), dtype=np.int32),
+            "rng_version": np.array(version),
+            "rng_state": np.array(state, dtype=np.uint32),
+            "rng_gauss": np.array(np.nan if gauss_next is None else gauss_next),
+            "best_genes": self.best_genes if self.best_genes is not None else np.empty((0, 4), dtype=np.int32),
+            "has_best": np.array(self.best_genes is not None),
+            "best_fitness": np.array(self.best_fitness),
+            "best_fitness_history": np.array(self.best_fitness_history, dtype=np.float64),
+            "last_best": np.array(self.last_best),
+            "stale_generations": np.array(self.stale_generations),
+            "evaluations": np.array(self.evaluations),
+            "seconds": np.array(self.seconds),
+            "cache_keys": np.frombuffer(b"".join(keys), dtype=np.uint8).reshape(len(keys), key_size),
+            "cache_values": np.array([value for _, value in self.cache], dtype=np.float64),
+            "counter_names": np.array(list(self.counters), dtype=str),
+            "counter_values": np.array(list(self.counters.values()), dtype=np.int64)
+        }
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+        try:
+            os.chmod(temp_path, 0o644)
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **arrays)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        """Read a checkpoint written by ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["format_version"]) != FORMAT_VERSION:
+                raise ValueError(f"Unsupported checkpoint format {int(data['format_version'])}")
+            
+            offsets = np.cumsum(data["gene_rows"])[:-1]
+            gauss = float(data["rng_gauss"])
+            cache_keys = data["cache_keys"]
+            return cls(
+                generation=int(data["generation"]),
+                population=np.split(data["genes"], offsets) if len(data["gene_rows"]) else [],
+                rng_state=(
+                    int(data["rng_version"]),
+                    tuple(data["rng_state"].tolist()),
+                    None if np.isnan(gauss) else gauss
+                ),
+                best_genes=data["best_genes"] if bool(data["has_best"]) else None,
+                best_fitness=float(data["best_fitness"]),
+                best_fitness_history=data["best_fitness_history"].tolist(),
+                last_best=float(data["last_best"]),
+                stale_generations=int(data["stale_generations"]),
+                evaluations=int(data["evaluations"]),
+                seconds=float(data["seconds"]),
+                cache=[
+                    (key.tobytes(), value)
+                    for key, value in zip(cache_keys, data["cache_values"].tolist())
+                ],
+                counters=dict(zip(data["counter_names"].tolist(), data["counter_values"].tolist()))
+            )
\ No newline at end of file
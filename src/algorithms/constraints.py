@@ -3,6 +3,7 @@ from typing import Dict, List, Set
 from models.schedule import Schedule, TimeSlot, ScheduleEntry
 from models.lecturer import Lecturer
 from models.group import Group
+from models.time_grid import TimeGrid, DEFAULT_TIME_GRID
 
 @dataclass
 class ConstraintViolation:
@@ -15,13 +16,15 @@ class ScheduleConstraints:
     """Handles schedule constraints and quality metrics."""
     
     @staticmethod
-    def check_lecturer_hours(schedule: Schedule, lecturer: Lecturer) -> List[ConstraintViolation]:
+    def check_lecturer_hours(schedule: Schedule,
+                             lecturer: Lecturer,
+                             time_grid: TimeGrid = DEFAULT_TIME_GRID) -> List[ConstraintViolation]:
         """Check if lecturer's teaching hours are within limits."""
         violations = []
         slots = schedule.get_lecturer_slots(lecturer)
         
         # Check weekly hours
-        weekly_hours = len(slots) * 1.5  # Each slot is 1.5 hours
+        weekly_hours = len(slots) * time_grid.slot_hours
         for subject_id, constraints in lecturer.subject_constraints.items():
             if weekly_hours > constraints.max_hours_per_week:
                 violations.append(
@@ -36,7 +39,9 @@ class ScheduleConstraints:
         return violations
     
     @staticmethod
-    def check_daily_load(schedule: Schedule, group: Group) -> List[ConstraintViolation]:
+    def check_daily_load(schedule: Schedule,
+                         group: Group,
+                         time_grid: TimeGrid = DEFAULT_TIME_GRID) -> List[ConstraintViolation]:
         """Check if daily class load is reasonable."""
         violations = []
         slots_by_day: Dict[int, List[TimeSlot]] = {}
@@ -49,8 +54,8 @@ class ScheduleConstraints:
         
         # Check each day's load
         for day, slots in slots_by_day.items():
-            daily_hours = len(slots) * 1.5
-            if daily_hours > 6.0:  # More than 4 periods (6 hours) per day
+            daily_hours = len(slots) * time_grid.slot_hours
+            if daily_hours > time_grid.max_daily_hours:
                 violations.append(
                     ConstraintViolation(
                         constraint_type="daily_load",
@@ -145,7 +150,7 @@ class ScheduleConstraints:
         return violations
     
     @staticmethod
-    def calculate_quality_score(schedule: Schedule) -> float:
+    def calculate_quality_score(schedule: Schedule, time_grid: TimeGrid = DEFAULT_TIME_GRID) -> float:
         """Calculate overall schedule quality score."""
         if not schedule.validate_hard_constraints():
             return 0.0
@@ -158,12 +163,12 @@ class ScheduleConstraints:
             for entry in entries:
                 # Check lecturer constraints
                 violations.extend(
-                    ScheduleConstraints.check_lecturer_hours(schedule, entry.lecturer)
+                    ScheduleConstraints.check_lecturer_hours(schedule, entry.lecturer, time_grid)
                 )
                 
                 # Check group constraints
                 for group in entry.groups:
-                    violations.extend(ScheduleConstraints.check_daily_load(schedule, group))
+                    violations.extend(ScheduleConstraints.check_daily_load(schedule, group, time_grid))
                     violations.extend(ScheduleConstraints.check_schedule_gaps(schedule, group))
                     violations.extend(ScheduleConstraints.check_subject_distribution(schedule, group))
         
@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from models.schedule import Schedule, ScheduleEntry
+from models.subject import Subject
+from models.lecturer import Lecturer
+from models.group import Group
+from models.classroom import Classroom
+from models.time_grid import TimeGrid
+
+# Columns of the gene matrix
+CLASS, SLOT, LECTURER, CLASSROOM = 0, 1, 2, 3
+UNSCHEDULED = -1
+
+ClassRequirement = Tuple[Group, Subject, bool]
+
+def list_required_classes(groups: List[Group]) -> List[ClassRequirement]:
+    """List all classes to schedule as (group, subject, is_lecture)."""
+    required_classes = []
+    for group in groups:
+        for subject_id, subject in group.subjects.items():
+            # Add lectures
+            for _ in range(subject.lecture_hours):
+                required_classes.append((group, subject, True))
+            
+            # Add practicals
+            for _ in range(subject.practical_hours):
+                required_classes.append((group, subject, False))
+    return required_classes
+
+@dataclass
+class EncodedSchedule:
+    """Array-backed chromosome with one row per required class.
+    
+    Each row holds the required class index, time grid slot index, lecturer index and
+    classroom index of a class. Classes that are not placed have UNSCHEDULED
+    in the last three columns. Schedules produced by crossover may place a
+    class more than once; the extra placements follow as surplus rows.
+    """
+    genes: np.ndarray  # shape (rows, 4), int32
+    
+    @property
+    def classes(self) -> np.ndarray:
+        return self.genes[:, CLASS]
+    
+    @property
+    def slots(self) -> np.ndarray:
+        return self.genes[:, SLOT]
+    
+    @property
+    def lecturers(self) -> np.ndarray:
+        return self.genes[:, LECTURER]
+    
+    @property
+    def classrooms(self) -> np.ndarray:
+        return self.genes[:, CLASSROOM]
+    
+    def copy(self) -> "EncodedSchedule":
+        """Copy the chromosome."""
+        return EncodedSchedule(self.genes.copy())
+
+class ChromosomeEncoder:
+    """Converts schedules to and from their array encoding."""
+    
+    def __init__(self,
+                 lecturers: List[Lecturer],
+                 groups: List[Group],
+                 classrooms: List[Classroom],
+                 required_classes: List[ClassRequirement],
+                 time_grid: Optional[TimeGrid] = None):
+        self.lecturers = lecturers
+        self.groups = groups
+        self.classrooms = classrooms
+        self.required_classes = required_classes
+        self.time_grid = time_grid or TimeGrid()
+        
+        # Integer ids of every entity
+        self.lecturer_ids: Dict[Lecturer, int] = {l: i for i, l in enumerate(lecturers)}
+        self.group_ids: Dict[Group, int] = {g: i for i, g in enumerate(groups)}
+        self.classroom_ids: Dict[Classroom, int] = {c: i for i, c in enumerate(classrooms)}
+        
+        # Static per-row data
+        self.row_groups = np.array([self.group_ids[g] for g, _, _ in required_classes], dtype=np.int32)
+        self.row_is_lecture = np.array([is_lecture for _, _, is_lecture in required_classes], dtype=bool)
+        
+        # Rows of each (group, subject, is_lecture) class, used to place entries
+        self._rows_by_class: Dict[Tuple[str, str, bool], List[int]] = {}
+        for row, (group, subject, is_lecture) in enumerate(required_classes):
+            key = (group.group_id, subject.subject_id, is_lecture)
+            self._rows_by_class.setdefault(key, []).append(row)
+    
+    @property
+    def class_count(self) -> int:
+        return len(self.required_classes)
+    
+    def empty(self) -> EncodedSchedule:
+        """Chromosome with no classes scheduled."""
+        genes = np.full((self.class_count, 4), UNSCHEDULED, dtype=np.int32)
+        genes[:, CLASS] = np.arange(self.class_count, dtype=np.int32)
+        return EncodedSchedule(genes)
+    
+    def encode(self, schedule: Schedule) -> EncodedSchedule:
+        """Encode a schedule.
+        
+        Raises ValueError if the schedule holds entries that do not match a
+        required class (e.g. entries shared by several groups).
+        """
+        placements: Dict[Tuple[str, str, bool], List[Tuple[int, int, int]]] = {}
+        for slot, entries in schedule.entries.items():
+            slot_index = self.time_grid.slot_index(slot)
+            for entry in entries:
+                if len(entry.groups) != 1:
+                    raise ValueError(f"Cannot encode entry for {len(entry.groups)} groups")
+                key = (entry.groups[0].group_id, entry.subject.subject_id, entry.is_lecture)
+                placements.setdefault(key, []).append((
+                    slot_index,
+                    self.lecturer_ids[entry.lecturer],
+                    self.classroom_ids[entry.classroom]
+                ))
+        
+        # Identical classes are interchangeable, so their placements are sorted
+        # to give every schedule a single encoding
+        encoded = self.empty()
+        surplus: List[Tuple[int, int, int, int]] = []
+        for key, genes in placements.items():
+            rows = self._rows_by_class.get(key)
+            if not rows:
+                raise ValueError(f"Entry {key} is not a required class")
+            genes.sort()
+            placed = genes[:len(rows)]
+            encoded.genes[rows[:len(placed)], SLOT:] = placed
+            surplus.extend((rows[0],) + gene for gene in genes[len(rows):])
+        
+        if surplus:
+            surplus.sort()
+            encoded.genes = np.vstack([encoded.genes, np.array(surplus, dtype=np.int32)])
+        
+        return encoded
+    
+    def decode(self, encoded: EncodedSchedule) -> Schedule:
+        """Decode a chromosome into a schedule."""
+        schedule = Schedule()
+        genes = encoded.genes
+        scheduled = np.flatnonzero(genes[:, SLOT] != UNSCHEDULED)
+        
+        # Stable sort keeps row order within each slot
+        order = scheduled[np.argsort(genes[scheduled, SLOT], kind="stable")]
+        for row in order.tolist():
+            class_id, slot_index, lecturer_id, classroom_id = genes[row].tolist()
+            group, subject, is_lecture = self.required_classes[class_id]
+            schedule.add_entry(
+                self.time_grid.slot_at(slot_index),
+                ScheduleEntry(
+                    subject=subject,
+                    lecturer=self.lecturers[lecturer_id],
+                    classroom=self.classrooms[classroom_id],
+                    groups=[group],
+                    is_lecture=is_lecture
+                )
+            )
+        
+        return schedule
\ No newline at end of file
@@ -0,0 +1,391 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from models.schedule import Schedule, ScheduleEntry, TimeSlot
+from models.lecturer import Lecturer
+from models.group import Group
+from models.time_grid import TimeGrid
+from .constraints import ConstraintViolation
+from .validator import HardConstraintValidator
+
+# (entry, old slot, new slot); a new slot of None means the entry was removed,
+# an old slot of None that it was added
+Move = Tuple[ScheduleEntry, Optional[TimeSlot], Optional[TimeSlot]]
+
+def _popcount(mask: int) -> int:
+    """Number of set bits in a bitmap."""
+    return bin(mask).count("1")
+
+def _severity(violations: List[ConstraintViolation]) -> float:
+    """Total severity of a list of violations."""
+    return sum(violation.severity for violation in violations)
+
+@dataclass
+class EvaluationResult:
+    """Score and violations of a schedule."""
+    score: float
+    violations: List[ConstraintViolation]
+    is_valid: bool = True
+
+@dataclass
+class PenaltyBreakdown:
+    """Per-resource penalties of a schedule, used for delta evaluation."""
+    lecturer_penalties: Dict[Lecturer, float]
+    group_day_penalties: Dict[Tuple[Group, int], float]  # daily load and gaps
+    group_subject_penalties: Dict[Tuple[Group, str], float]  # subject distribution
+    room_penalty: float
+    total_penalty: float
+    is_valid: bool = True
+    
+    @property
+    def score(self) -> float:
+        """Quality score of the schedule."""
+        if not self.is_valid:
+            return 0.0
+        return max(0.0, 100.0 - self.total_penalty)
+    
+    def copy(self) -> "PenaltyBreakdown":
+        """Copy the breakdown so it can be updated independently."""
+        return PenaltyBreakdown(
+            lecturer_penalties=dict(self.lecturer_penalties),
+            group_day_penalties=dict(self.group_day_penalties),
+            group_subject_penalties=dict(self.group_subject_penalties),
+            room_penalty=self.room_penalty,
+            total_penalty=self.total_penalty,
+            is_valid=self.is_valid
+        )
+
+@dataclass
+class _GroupUsage:
+    """Per-group occupancy collected during the schedule walk."""
+    day_periods: Dict[int, int] = field(default_factory=dict)  # day -> period bitmap
+    subject_days: Dict[str, List[int]] = field(default_factory=dict)  # subject -> [count, day bitmap]
+    entry_count: int = 0
+
+@dataclass
+class _LecturerUsage:
+    """Per-lecturer occupancy collected during the schedule walk."""
+    day_periods: Dict[int, int] = field(default_factory=dict)  # day -> period bitmap
+    entry_count: int = 0
+
+class ScheduleEvaluator:
+    """Evaluates schedules in a single pass over their entries.
+    
+    Every soft constraint is checked exactly once per lecturer and group. With
+    ``legacy_scoring`` the per-resource violations are repeated once per entry
+    of the resource, which reproduces ``ScheduleConstraints.calculate_quality_score``.
+    """
+    
+    def __init__(self,
+                 legacy_scoring: bool = False,
+                 time_grid: Optional[TimeGrid] = None,
+                 validator: Optional[HardConstraintValidator] = None):
+        self.legacy_scoring = legacy_scoring
+        self.time_grid = time_grid or TimeGrid()
+        self.validator = validator
+    
+    def _is_valid(self, schedule: Schedule) -> bool:
+        """Check hard constraints, with the bitmask validator when there is one."""
+        if self.validator:
+            return self.validator.is_valid(schedule)
+        return schedule.validate_hard_constraints()
+    
+    def evaluate(self, schedule: Schedule) -> EvaluationResult:
+        """Calculate score and violations of a schedule."""
+        groups, lecturers, room_violations = self._collect_usage(schedule)
+        
+        # Evaluate each resource once
+        violations: List[ConstraintViolation] = []
+        if self.legacy_scoring:
+            lecturer_violations = {
+                lecturer: self._lecturer_violations(lecturer, usage)
+                for lecturer, usage in lecturers.items()
+            }
+            group_violations = {
+                group: self._group_violations(group, usage)
+                for group, usage in groups.items()
+            }
+            # Repeat resource violations once per entry, in schedule order
+            for entries in schedule.entries.values():
+                for entry in entries:
+                    violations.extend(lecturer_violations[entry.lecturer])
+                    for group in entry.groups:
+                        violations.extend(group_violations[group])
+        else:
+            for lecturer, usage in lecturers.items():
+                violations.extend(self._lecturer_violations(lecturer, usage))
+            for group, usage in groups.items():
+                violations.extend(self._group_violations(group, usage))
+        violations.extend(room_violations)
+        
+        if not self._is_valid(schedule):
+            return EvaluationResult(score=0.0, violations=violations, is_valid=False)
+        
+        total_penalty = _severity(violations)
+        return EvaluationResult(score=max(0.0, 100.0 - total_penalty), violations=violations)
+    
+    def calculate_score(self, schedule: Schedule) -> float:
+        """Calculate overall schedule quality score."""
+        return self.evaluate(schedule).score
+    
+    def breakdown(self, schedule: Schedule) -> PenaltyBreakdown:
+        """Calculate per-resource penalties of a schedule."""
+        groups, lecturers, room_violations = self._collect_usage(schedule)
+        
+        lecturer_penalties = {
+            lecturer: self._weight(usage.entry_count) * _severity(self._lecturer_violations(lecturer, usage))
+            for lecturer, usage in lecturers.items()
+        }
+        group_day_penalties: Dict[Tuple[Group, int], float] = {}
+        group_subject_penalties: Dict[Tuple[Group, str], float] = {}
+        for group, usage in groups.items():
+            weight = self._weight(usage.entry_count)
+            for day, mask in usage.day_periods.items():
+                load, gaps = self._day_violations(group, day, mask)
+                group_day_penalties[(group, day)] = weight * _severity(load + gaps)
+            for subject_id, (count, days) in usage.subject_days.items():
+                violation = self._subject_violation(group, subject_id, count, days)
+                group_subject_penalties[(group, subject_id)] = weight * violation.severity if violation else 0.0
+        room_penalty = _severity(room_violations)
+        
+        return PenaltyBreakdown(
+            lecturer_penalties=lecturer_penalties,
+            group_day_penalties=group_day_penalties,
+            group_subject_penalties=group_subject_penalties,
+            room_penalty=room_penalty,
+            total_penalty=(
+                sum(lecturer_penalties.values()) + sum(group_day_penalties.values()) +
+                sum(group_subject_penalties.values()) + room_penalty
+            ),
+            is_valid=self._is_valid(schedule)
+        )
+    
+    def evaluate_move(self,
+                      schedule: Schedule,
+                      breakdown: PenaltyBreakdown,
+                      entry: ScheduleEntry,
+                      old_slot: TimeSlot,
+                      new_slot: Optional[TimeSlot]) -> PenaltyBreakdown:
+        """Update a breakdown after ``entry`` was moved from ``old_slot`` to ``new_slot``.
+        
+        ``schedule`` must already contain the move and ``breakdown`` must describe
+        the schedule before it. A ``new_slot`` of None means the entry was removed.
+        Only the lecturer, the group days and the group subjects touched by the
+        move are re-evaluated.
+        """
+        return self.evaluate_moves(schedule, breakdown, [(entry, old_slot, new_slot)])
+    
+    def evaluate_moves(self,
+                       schedule: Schedule,
+                       breakdown: PenaltyBreakdown,
+                       moves: List[Move]) -> PenaltyBreakdown:
+        """Update a breakdown after several entries were moved, added or removed.
+        
+        Works as ``evaluate_move``; an entry with an old slot of None was
+        added. The schedule may be invalid between the moves (e.g. while two
+        entries swap slots); only the final state is checked.
+        """
+        adds_or_removes = any(old is None or new is None for _, old, new in moves)
+        if not breakdown.is_valid or (self.legacy_scoring and adds_or_removes):
+            # Invalid schedules and changing legacy weights need a full evaluation
+            return self.breakdown(schedule)
+        
+        result = breakdown.copy()
+        new_slots = {new_slot for _, _, new_slot in moves if new_slot is not None}
+        if self.validator:
+            result.is_valid = all(self.validator.slot_valid(schedule, slot) for slot in new_slots)
+        else:
+            result.is_valid = all(schedule.validate_slot(slot) for slot in new_slots)
+        if not result.is_valid:
+            return result
+        
+        def replace(penalties: Dict, key, value: float) -> None:
+            result.total_penalty += value - penalties.get(key, 0.0)
+            penalties[key] = value
+        
+        # Resources touched by the moves, in move order
+        lecturers: Dict[Lecturer, None] = {}
+        group_days: Dict[Group, Dict[int, None]] = {}
+        group_subjects: Dict[Group, Dict[str, None]] = {}
+        for entry, old_slot, new_slot in moves:
+            lecturers[entry.lecturer] = None
+            for group in entry.groups:
+                days = group_days.setdefault(group, {})
+                for slot in (old_slot, new_slot):
+                    if slot is not None:
+                        days[slot.day] = None
+                group_subjects.setdefault(group, {})[entry.subject.subject_id] = None
+            
+            # A practical dropped from or added to an unsuitable room
+            if (old_slot is None) != (new_slot is None) and \
+                    not entry.is_lecture and entry.subject.requires_subgroups and not entry.classroom.is_lab:
+                severity = self._room_violation(entry).severity
+                if new_slot is None:
+                    severity = -severity
+                result.room_penalty += severity
+                result.total_penalty += severity
+        
+        # Re-check the lecturers' weekly hours
+        for lecturer in lecturers:
+            lecturer_slots = schedule.get_lecturer_slots(lecturer)
+            lecturer_usage = _LecturerUsage(entry_count=len(lecturer_slots))
+            for slot in lecturer_slots:
+                lecturer_usage.day_periods[slot.day] = lecturer_usage.day_periods.get(slot.day, 0) | (1 << slot.period)
+            replace(result.lecturer_penalties, lecturer,
+                    self._weight(lecturer_usage.entry_count) *
+                    _severity(self._lecturer_violations(lecturer, lecturer_usage)))
+        
+        for group, days in group_days.items():
+            group_slots = schedule.get_group_slots(group)
+            weight = self._weight(len(group_slots))
+            
+            # Re-check the days the entries left and joined
+            for day in days:
+                mask = 0
+                for slot in group_slots:
+                    if slot.day == day:
+                        mask |= 1 << slot.period
+                load, gaps = self._day_violations(group, day, mask) if mask else ([], [])
+                replace(result.group_day_penalties, (group, day), weight * _severity(load + gaps))
+            
+            # Re-check the distribution of the entries' subjects
+            for subject_id in group_subjects[group]:
+                count, subject_days = 0, 0
+                for slot in group_slots:
+                    for other in schedule.entries[slot]:
+                        if other.subject.subject_id == subject_id and group in other.groups:
+                            count += 1
+                            subject_days |= 1 << slot.day
+                violation = self._subject_violation(group, subject_id, count, subject_days)
+                replace(result.group_subject_penalties, (group, subject_id),
+                        weight * violation.severity if violation else 0.0)
+        
+        return result
+    
+    def _weight(self, entry_count: int) -> int:
+        """How many times a resource's violations are counted."""
+        return entry_count if self.legacy_scoring else 1
+    
+    def _collect_usage(self, schedule: Schedule) -> Tuple[
+            Dict[Group, _GroupUsage], Dict[Lecturer, _LecturerUsage], List[ConstraintViolation]]:
+        """Walk the schedule once and build day/period bitmaps."""
+        groups: Dict[Group, _GroupUsage] = {}
+        lecturers: Dict[Lecturer, _LecturerUsage] = {}
+        room_violations: List[ConstraintViolation] = []
+        
+        for slot, entries in schedule.entries.items():
+            period_bit = 1 << slot.period
+            day_bit = 1 << slot.day
+            for entry in entries:
+                lecturer_usage = lecturers.get(entry.lecturer)
+                if lecturer_usage is None:
+                    lecturer_usage = lecturers[entry.lecturer] = _LecturerUsage()
+                lecturer_usage.day_periods[slot.day] = lecturer_usage.day_periods.get(slot.day, 0) | period_bit
+                lecturer_usage.entry_count += 1
+                
+                for group in entry.groups:
+                    group_usage = groups.get(group)
+                    if group_usage is None:
+                        group_usage = groups[group] = _GroupUsage()
+                    group_usage.day_periods[slot.day] = group_usage.day_periods.get(slot.day, 0) | period_bit
+                    group_usage.entry_count += 1
+                    
+                    subject_usage = group_usage.subject_days.get(entry.subject.subject_id)
+                    if subject_usage is None:
+                        group_usage.subject_days[entry.subject.subject_id] = [1, day_bit]
+                    else:
+                        subject_usage[0] += 1
+                        subject_usage[1] |= day_bit
+                
+                if not entry.is_lecture and entry.subject.requires_subgroups and not entry.classroom.is_lab:
+                    room_violations.append(self._room_violation(entry))
+        
+        return groups, lecturers, room_violations
+    
+    def _lecturer_violations(self, lecturer: Lecturer, usage: _LecturerUsage) -> List[ConstraintViolation]:
+        """Check if lecturer's teaching hours are within limits."""
+        violations = []
+        weekly_hours = sum(_popcount(mask) for mask in usage.day_periods.values()) * self.time_grid.slot_hours
+        for subject_id, constraints in lecturer.subject_constraints.items():
+            if weekly_hours > constraints.max_hours_per_week:
+                violations.append(
+                    ConstraintViolation(
+                        constraint_type="lecturer_hours",
+                        description=f"Lecturer {lecturer.name} exceeds maximum weekly hours "
+                                  f"({weekly_hours} > {constraints.max_hours_per_week})",
+                        severity=0.5
+                    )
+                )
+        return violations
+    
+    def _group_violations(self, group: Group, usage: _GroupUsage) -> List[ConstraintViolation]:
+        """Check daily load, gaps and subject distribution of a group."""
+        load_violations: List[ConstraintViolation] = []
+        gap_violations: List[ConstraintViolation] = []
+        for day, mask in usage.day_periods.items():
+            load, gaps = self._day_violations(group, day, mask)
+            load_violations.extend(load)
+            gap_violations.extend(gaps)
+        
+        distribution_violations = []
+        for subject_id, (count, days) in usage.subject_days.items():
+            violation = self._subject_violation(group, subject_id, count, days)
+            if violation:
+                distribution_violations.append(violation)
+        
+        return load_violations + gap_violations + distribution_violations
+    
+    def _day_violations(self, group: Group, day: int, mask: int) -> Tuple[
+            List[ConstraintViolation], List[ConstraintViolation]]:
+        """Check the load and the gaps of one day of a group."""
+        periods = _popcount(mask)
+        
+        # Check the day's load
+        load_violations = []
+        daily_hours = periods * self.time_grid.slot_hours
+        if daily_hours > self.time_grid.max_daily_hours:
+            load_violations.append(
+                ConstraintViolation(
+                    constraint_type="daily_load",
+                    description=f"Group {group.name} has too many classes on day {day} "
+                              f"({daily_hours} hours)",
+                    severity=0.3
+                )
+            )
+        
+        # Check for gaps between the first and the last class of the day
+        gap_violations = []
+        min_period = (mask & -mask).bit_length() - 1
+        max_period = mask.bit_length() - 1
+        gaps = max_period - min_period + 1 - periods
+        if gaps > 0:
+            gap_violations.append(
+                ConstraintViolation(
+                    constraint_type="schedule_gaps",
+                    description=f"Group {group.name} has {gaps} gap(s) on day {day}",
+                    severity=0.2 * gaps
+                )
+            )
+        
+        return load_violations, gap_violations
+    
+    @staticmethod
+    def _subject_violation(group: Group, subject_id: str, count: int, days: int) -> Optional[ConstraintViolation]:
+        """Check if all classes of a subject are on the same day."""
+        if count > 1 and _popcount(days) == 1:
+            return ConstraintViolation(
+                constraint_type="subject_distribution",
+                description=f"All classes of subject {subject_id} for group {group.name} "
+                          f"are on the same day",
+                severity=0.3
+            )
+        return None
+    
+    @staticmethod
+    def _room_violation(entry: ScheduleEntry) -> ConstraintViolation:
+        """Violation for a practical class held outside a lab."""
+        return ConstraintViolation(
+            constraint_type="room_suitability",
+            description=f"Practical class for {entry.subject.name} scheduled in "
+                      f"non-lab room {entry.classroom.name}",
+            severity=0.4
+        )
\ No newline at end of file
@@ -1,16 +1,98 @@
 import random
-from typing import List, Tuple, Optional, Dict, Set, Callable
-from copy import deepcopy
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, List, Tuple, Optional, Dict, Iterator
+import numpy as np
 from models.schedule import Schedule, TimeSlot, ScheduleEntry
 from models.subject import Subject
 from models.lecturer import Lecturer
 from models.group import Group
 from models.classroom import Classroom
-from .constraints import ScheduleConstraints, ConstraintViolation
+from models.time_grid import TimeGrid
+from .evaluator import PenaltyBreakdown, Move
+from .encoding import ChromosomeEncoder, EncodedSchedule
+from .vectorized import PopulationEvaluator
+from .parallel import WorkerPool, breed_genes, generate_genes, spawn_seeds
+from .cache import FitnessCache
+from .checkpoint import Checkpoint
+from .telemetry import Telemetry, PhaseTimer, GenerationRecord, NO_PHASE
+from .base import SchedulerBase, ProgressCallback
 
-ProgressCallback = Callable[[int, float], None]
+STOP_REASONS = ("generations", "target_fitness", "patience", "time_limit", "max_evaluations")
 
-class GeneticScheduler:
+@dataclass
+class OffspringStats:
+    """Counters of offspring creation."""
+    attempts: int = 0
+    repaired: int = 0
+    rejected: int = 0
+    filled: int = 0  # clones added after the attempt budget ran out
+    
+    def merge(self, other: "OffspringStats") -> None:
+        """Add the counters of another run."""
+        self.attempts += other.attempts
+        self.repaired += other.repaired
+        self.rejected += other.rejected
+        self.filled += other.filled
+
+@dataclass
+class PopulationStats:
+    """Counters of initial population generation."""
+    generated: int = 0
+    accepted: int = 0
+    seconds: float = 0.0
+    
+    @property
+    def acceptance_rate(self) -> float:
+        return self.accepted / self.generated if self.generated else 0.0
+    
+    @property
+    def seconds_per_individual(self) -> float:
+        return self.seconds / self.accepted if self.accepted else 0.0
+
+@dataclass
+class MemeticStats:
+    """Counters of elite polishing."""
+    evaluations: int = 0
+    improvements: int = 0
+
+@dataclass(frozen=True)
+class StoppingCriteria:
+    """Conditions that end a run before its last generation.
+    
+    A criterion set to None is not checked. ``patience`` is the number of
+    generations in a row without a better best fitness; ``time_limit`` is in
+    wall-clock seconds.
+    """
+    target_fitness: Optional[float] = None
+    patience: Optional[int] = None
+    time_limit: Optional[float] = None
+    max_evaluations: Optional[int] = None
+    
+    def reason(self, best_fitness: float, stale_generations: int, seconds: float, evaluations: int) -> Optional[str]:
+        """The first criterion that is met, if any."""
+        if self.target_fitness is not None and best_fitness >= self.target_fitness:
+            return "target_fitness"
+        if self.patience is not None and stale_generations >= self.patience:
+            return "patience"
+        if self.time_limit is not None and seconds >= self.time_limit:
+            return "time_limit"
+        if self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            return "max_evaluations"
+        return None
+
+@dataclass
+class EvolutionResult:
+    """Outcome of a run of ``evolve``; ``stop_reason`` is one of STOP_REASONS."""
+    best_schedule: Optional[Schedule] = None
+    best_fitness: float = 0.0
+    best_fitness_history: List[float] = field(default_factory=list)
+    generations: int = 0
+    evaluations: int = 0
+    seconds: float = 0.0
+    stop_reason: str = "generations"
+
+class GeneticScheduler(SchedulerBase):
     """Implements genetic algorithm for schedule generation."""
     
     def __init__(self, 
@@ -22,297 +104,647 @@ class GeneticScheduler:
                  elite_size: int = 10,
                  mutation_rate: float = 0.1,
                  crossover_rate: float = 0.8,
-                 tournament_size: int = 3):
-        """Initialize the genetic scheduler."""
-        self.subjects = subjects
-        self.lecturers = lecturers
-        self.groups = groups
-        self.classrooms = classrooms
+                 tournament_size: int = 3,
+                 legacy_scoring: bool = False,
+                 vectorized: bool = False,
+                 workers: Optional[int] = None,
+                 parallel_offspring: bool = False,
+                 fitness_cache_size: int = 10000,
+                 repair_offspring: bool = True,
+                 max_offspring_attempts: Optional[int] = None,
+                 seed: Optional[int] = None,
+                 rng: Optional[random.Random] = None,
+                 time_grid: Optional[TimeGrid] = None,
+                 memetic_budget: int = 0,
+                 telemetry: Optional[Telemetry] = None):
+        """Initialize the genetic scheduler.
+        
+        With ``legacy_scoring`` violations are counted once per entry of the
+        affected lecturer or group, as ``calculate_quality_score`` does.
+        With ``vectorized`` the population is scored in batched array
+        operations instead of one schedule at a time.
+        
+        ``workers`` evaluates fitness in a pool of that many processes. With
+        ``parallel_offspring`` every child is bred from its own seed drawn
+        from ``rng`` (in the pool when there is one), so a seeded run gives
+        the same result whatever the number of workers.
+        
+        Fitness values are cached by canonical schedule hash in an LRU cache of
+        ``fitness_cache_size`` entries (0 disables it).
+        
+        Children that break hard constraints are repaired by re-slotting the
+        clashing entries (unless ``repair_offspring`` is off) or rejected. At
+        most ``max_offspring_attempts`` children (default: 10 per individual)
+        are created per generation; the rest of the population is then filled
+        with clones of selected parents.
+        
+        All random choices are drawn from ``rng``, or from a new generator
+        seeded with ``seed``, so several schedulers can run in one process.
+        
+        Classes are placed on ``time_grid`` (5 days of 4 periods by default).
+        
+        With a ``memetic_budget``, the elites are polished every generation by
+        hill climbing, evaluating at most that many moves in total.
+        
+        A ``telemetry`` object receives a GenerationRecord after every
+        generation of ``evolve``, with the time spent in each phase.
+        """
+        super().__init__(subjects, lecturers, groups, classrooms,
+                         legacy_scoring=legacy_scoring, seed=seed, rng=rng, time_grid=time_grid)
         self.population_size = population_size
         self.elite_size = elite_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.tournament_size = tournament_size
         
-        # Track best solutions
-        self.best_fitness_history: List[float] = []
-        self.best_schedule: Optional[Schedule] = None
-        self.best_fitness: float = 0.0
+        # Compact array encoding of schedules (one row per required class)
+        self.encoder = ChromosomeEncoder(
+            lecturers, groups, classrooms, list(self.problem_index.required_classes), self.time_grid
+        )
+        self.vectorized = vectorized
+        self.population_evaluator = PopulationEvaluator(self.encoder, legacy_scoring=legacy_scoring)
+        self.workers = workers
+        self.parallel_offspring = parallel_offspring
+        self.fitness_cache = FitnessCache(fitness_cache_size)
+        self.repair_offspring = repair_offspring
+        self.max_offspring_attempts = (
+            max_offspring_attempts if max_offspring_attempts is not None else population_size * 10
+        )
+        self.offspring_stats = OffspringStats()
+        self.population_stats = PopulationStats()
+        self.memetic_budget = memetic_budget
+        self.memetic_stats = MemeticStats()
+        self.telemetry = telemetry
+        self._timer = PhaseTimer() if telemetry else None
+        
+        self.final_population: List[Schedule] = []
+        self.evaluations = 0
+        self.result: Optional[EvolutionResult] = None
+    
+    def worker_options(self) -> Dict[str, Any]:
+        """Constructor options for the copies of this scheduler in worker processes."""
+        return {
+            "population_size": self.population_size,
+            "elite_size": self.elite_size,
+            "mutation_rate": self.mutation_rate,
+            "crossover_rate": self.crossover_rate,
+            "tournament_size": self.tournament_size,
+            "legacy_scoring": self.legacy_scoring,
+            "vectorized": self.vectorized,
+            "fitness_cache_size": self.fitness_cache.max_size,
+            "repair_offspring": self.repair_offspring,
+            "max_offspring_attempts": self.max_offspring_attempts,
+            "time_grid": self.time_grid,
+            "memetic_budget": self.memetic_budget
+        }
     
-    def get_violations(self, schedule: Schedule) -> List[ConstraintViolation]:
-        """Get all constraint violations for a schedule."""
-        violations: List[ConstraintViolation] = []
+    def _evaluate_population(self,
+                             population: List[Schedule],
+                             breakdowns: Dict[int, PenaltyBreakdown],
+                             pool: Optional[WorkerPool] = None) -> List[float]:
+        """Score a population, reusing cached fitness and known breakdowns.
         
-        # Check all constraints for all groups and lecturers
-        for slot, entries in schedule.entries.items():
-            for entry in entries:
-                # Check lecturer constraints
-                violations.extend(
-                    ScheduleConstraints.check_lecturer_hours(schedule, entry.lecturer)
-                )
-                
-                # Check group constraints
-                for group in entry.groups:
-                    violations.extend(ScheduleConstraints.check_daily_load(schedule, group))
-                    violations.extend(ScheduleConstraints.check_schedule_gaps(schedule, group))
-                    violations.extend(ScheduleConstraints.check_subject_distribution(schedule, group))
+        Every schedule is looked up by content in the fitness cache, in
+        population order. Each distinct schedule missing from the cache
+        counts as one evaluation, whether its score comes from its breakdown,
+        the fitness stored on it, the pool or a full evaluation, so the count
+        and the cache do not depend on the workers or on a resume. The
+        scores are stored on the schedules.
         
-        # Check room suitability
-        violations.extend(ScheduleConstraints.check_room_suitability(schedule))
+        Breakdowns of schedules evaluated in full are added to
+        ``breakdowns`` unless the population is scored in vectorized form or
+        by a pool.
+        """
+        scores: Dict[int, float] = {}
         
-        return violations
+        # Schedules missing from the cache, one list per distinct content
+        unknown: Dict[bytes, List[Schedule]] = {}
+        for schedule in population:
+            key = schedule.canonical_hash()
+            cached = self.fitness_cache.get(key)
+            if cached is not None:
+                scores[id(schedule)] = cached
+                schedule.remember_fitness(self.evaluator, cached)
+            else:
+                unknown.setdefault(key, []).append(schedule)
+        self.evaluations += len(unknown)
+        
+        # Scores known without evaluating, then one schedule per content to score
+        fitness: Dict[bytes, float] = {}
+        to_score: Dict[bytes, Schedule] = {}
+        for key, schedules in unknown.items():
+            for schedule in schedules:
+                known = breakdowns[id(schedule)].score if id(schedule) in breakdowns else \
+                    schedule.cached_fitness(self.evaluator)
+                if known is not None:
+                    fitness[key] = known
+                    break
+            else:
+                to_score[key] = schedules[0]
+        
+        schedules = list(to_score.values())
+        if pool and schedules:
+            values = pool.evaluate(schedules)
+        elif self.vectorized and schedules:
+            values = self.population_evaluator.evaluate(
+                [self.encoder.encode(schedule) for schedule in schedules]
+            ).tolist()
+        else:
+            values = []
+            for schedule in schedules:
+                breakdowns[id(schedule)] = self.evaluator.breakdown(schedule)
+                values.append(breakdowns[id(schedule)].score)
+        fitness.update(zip(to_score, values))
+        
+        for key, schedules in unknown.items():
+            self.fitness_cache.put(key, fitness[key])
+            for schedule in schedules:
+                scores[id(schedule)] = fitness[key]
+                schedule.remember_fitness(self.evaluator, fitness[key])
+        
+        return [scores[id(schedule)] for schedule in population]
     
-    def evaluate_schedule(self, schedule: Schedule) -> float:
-        """Evaluate the quality of a schedule."""
-        return ScheduleConstraints.calculate_quality_score(schedule)
+    def _phase(self, name: str):
+        """Context manager timing a phase of the generation, if telemetry is on."""
+        return self._timer.phase(name) if self._timer else NO_PHASE
     
     def _tournament_select(self, population_fitness: List[Tuple[Schedule, float]]) -> Schedule:
         """Select a schedule using tournament selection."""
-        tournament = random.sample(population_fitness, self.tournament_size)
-        return max(tournament, key=lambda x: x[1])[0]
+        with self._phase("selection"):
+            tournament = self.rng.sample(population_fitness, self.tournament_size)
+            return max(tournament, key=lambda x: x[1])[0]
     
     def _crossover(self, parent1: Schedule, parent2: Schedule) -> Schedule:
         """Create a new schedule by combining two parent schedules."""
         child = Schedule()
         
-        # Get all time slots from both parents
-        all_slots = set(parent1.entries.keys()) | set(parent2.entries.keys())
+        # Get all time slots from both parents, in a fixed order so that the
+        # random draws do not depend on how the parents were built
+        all_slots = sorted(
+            set(parent1.entries.keys()) | set(parent2.entries.keys()),
+            key=lambda slot: (slot.day, slot.period)
+        )
         
         for slot in all_slots:
             # Randomly choose entries from either parent
             if slot in parent1.entries and slot in parent2.entries:
-                entries = parent1.entries[slot] if random.random() < 0.5 else parent2.entries[slot]
+                entries = parent1.entries[slot] if self.rng.random() < 0.5 else parent2.entries[slot]
             elif slot in parent1.entries:
                 entries = parent1.entries[slot]
             else:
                 entries = parent2.entries[slot]
             
-            # Deep copy the entries to avoid reference issues
-            child.entries[slot] = [deepcopy(entry) for entry in entries]
+            # Entries are immutable, so the child shares them with its parents
+            for entry in entries:
+                child.add_entry(slot, entry)
         
         return child
     
     def _mutate(self, schedule: Schedule) -> Schedule:
         """Apply mutation to a schedule."""
-        mutated = deepcopy(schedule)
+        return self._mutate_with_move(schedule)[0]
+    
+    def _mutate_with_move(self, schedule: Schedule) -> Tuple[Schedule, Optional[Move]]:
+        """Apply mutation to a schedule and report the move that was made.
+        
+        The move is (entry, old slot, new slot); the new slot is None when the
+        entry could not be rescheduled and was dropped.
+        """
+        mutated = schedule.copy()
         
         # Get all entries
-        entries = []
-        for slot, slot_entries in mutated.entries.items():
-            for entry in slot_entries:
-                entries.append((slot, entry))
+        entries = mutated.sorted_entries()
         
         if not entries:
-            return mutated
+            return mutated, None
         
         # Select a random entry to mutate
-        old_slot, entry = random.choice(entries)
-        mutated.entries[old_slot].remove(entry)
-        if not mutated.entries[old_slot]:
-            del mutated.entries[old_slot]
+        old_slot, entry = self.rng.choice(entries)
+        mutated.remove_entry(old_slot, entry)
         
         # Try to reschedule the entry
+        lecturer_slots = mutated.get_lecturer_slots(entry.lecturer)
+        group_slots = [mutated.get_group_slots(group) for group in entry.groups]
         for _ in range(10):  # Try up to 10 times
             new_slot = TimeSlot(
-                day=random.randint(0, 4),
-                period=random.randint(0, 3)
+                day=self.rng.randint(0, self.time_grid.days - 1),
+                period=self.rng.randint(0, self.time_grid.periods_per_day - 1)
             )
             
             # Check if the new slot is valid
-            lecturer_slots = mutated.get_lecturer_slots(entry.lecturer)
-            group_slots = set()
-            for group in entry.groups:
-                group_slots.update(mutated.get_group_slots(group))
-            
-            if new_slot not in lecturer_slots and new_slot not in group_slots:
-                if new_slot not in mutated.entries:
-                    mutated.entries[new_slot] = []
-                mutated.entries[new_slot].append(entry)
-                break
+            if new_slot not in lecturer_slots and not any(new_slot in slots for slots in group_slots):
+                mutated.add_entry(new_slot, entry)
+                return mutated, (entry, old_slot, new_slot)
         
-        return mutated
+        return mutated, (entry, old_slot, None)
     
     def generate_initial_population(self) -> List[Schedule]:
-        """Generate initial population of schedules."""
-        population = []
-        attempts = 0
-        max_attempts = self.population_size * 10
-        
-        while len(population) < self.population_size and attempts < max_attempts:
-            schedule = self._generate_random_schedule()
-            if schedule.validate_hard_constraints():
-                population.append(schedule)
-            attempts += 1
+        """Generate initial population of schedules.
         
-        if len(population) < self.population_size:
-            print(f"Warning: Could only generate {len(population)} valid schedules")
+        Every schedule is built from its own seed drawn from ``rng`` (in a
+        pool of ``workers`` processes when set), so a seeded run gives the
+        same population whatever the number of workers. Classes are only
+        placed where they fit, so every schedule is valid by construction.
+        """
+        start = time.perf_counter()
+        seeds = spawn_seeds(self.rng, self.population_size)
         
+        pool = WorkerPool(self, self.workers) if self.workers else None
+        try:
+            if pool:
+                schedules = pool.generate(seeds)
+            else:
+                # Go through the same encoding as the workers so results match
+                schedules = (
+                    self.encoder.decode(EncodedSchedule(genes))
+                    for genes in generate_genes(self, seeds)
+                )
+            
+            population = []
+            generated = 0
+            for schedule in schedules:
+                generated += 1
+                assert self.validator.is_valid(schedule), "Random schedule breaks hard constraints"
+                population.append(schedule)
+                if len(population) == self.population_size:
+                    break
+        finally:
+            if pool:
+                pool.close()
+        
+        self.population_stats = PopulationStats(
+            generated=generated,
+            accepted=len(population),
+            seconds=time.perf_counter() - start
+        )
         return population
     
-    def _generate_random_schedule(self) -> Schedule:
-        """Generate a random valid schedule."""
-        schedule = Schedule()
-        
-        # Create a list of all required classes
-        required_classes = []
-        for group in self.groups:
-            for subject_id, subject in group.subjects.items():
-                # Add lectures
-                for _ in range(subject.lecture_hours):
-                    required_classes.append((group, subject, True))
+    def _create_child(self,
+                      population_fitness: List[Tuple[Schedule, float]],
+                      breakdowns: Dict[int, PenaltyBreakdown]) -> Tuple[Schedule, Optional[PenaltyBreakdown]]:
+        """Create a child through crossover and mutation.
+        
+        Returns the child, which may violate hard constraints, and its penalty
+        breakdown when it can be derived from the parent's.
+        """
+        child_breakdown = None
+        if self.rng.random() < self.crossover_rate:
+            parent1 = self._tournament_select(population_fitness)
+            parent2 = self._tournament_select(population_fitness)
+            with self._phase("crossover"):
+                child = self._crossover(parent1, parent2)
+        else:
+            # If no crossover, clone a parent
+            parent = self._tournament_select(population_fitness)
+            child = parent.copy()
+            child_breakdown = breakdowns.get(id(parent))
+        
+        # Apply mutation
+        if self.rng.random() < self.mutation_rate:
+            with self._phase("mutation"):
+                child, move = self._mutate_with_move(child)
+                if child_breakdown is not None and move is not None:
+                    # Only re-score the resources touched by the move; the
+                    # evaluation is counted when the population is scored
+                    child_breakdown = self.evaluator.evaluate_move(child, child_breakdown, *move)
+        
+        return child, child_breakdown
+    
+    def _make_child(self,
+                    population_fitness: List[Tuple[Schedule, float]],
+                    breakdowns: Dict[int, PenaltyBreakdown],
+                    max_attempts: int) -> Tuple[Schedule, Optional[PenaltyBreakdown], int]:
+        """Create a valid child in at most ``max_attempts`` attempts.
+        
+        Invalid children are repaired or rejected. If every attempt fails, a
+        clone of a selected parent is returned. Also returns the number of
+        attempts used.
+        """
+        for attempt in range(1, max_attempts + 1):
+            attempt_start = time.perf_counter() if self._timer else 0.0
+            self.offspring_stats.attempts += 1
+            child, child_breakdown = self._create_child(population_fitness, breakdowns)
+            with self._phase("validation"):
+                valid = self.validator.is_valid(child)
+            if valid:
+                return child, child_breakdown, attempt
+            if self.repair_offspring:
+                with self._phase("repair"):
+                    repaired = self._repair(child)
+                if repaired:
+                    self.offspring_stats.repaired += 1
+                    return child, None, attempt
+            self.offspring_stats.rejected += 1
+            if self._timer:
+                self._timer.add("rejected", time.perf_counter() - attempt_start)
+        
+        self.offspring_stats.filled += 1
+        parent = self._tournament_select(population_fitness)
+        return parent.copy(), breakdowns.get(id(parent)), max_attempts
+    
+    def _entry_moves(self, schedule: Schedule, slot: TimeSlot, entry: ScheduleEntry) -> Iterator[List[Move]]:
+        """Moves of an entry to a free slot, or to another eligible lecturer free in its slot."""
+        for new_slot in self.time_grid.slots:
+            if new_slot != slot and self._fits(schedule, entry, new_slot):
+                yield [(entry, slot, new_slot)]
+        
+        busy_lecturers = schedule.get_slot_lecturers(slot)
+        for lecturer in self.problem_index.eligible_lecturers(entry.subject.subject_id, entry.is_lecture):
+            if lecturer != entry.lecturer and lecturer not in busy_lecturers:
+                yield [(entry, slot, None), (replace(entry, lecturer=lecturer), None, slot)]
+    
+    def _polish(self,
+                schedule: Schedule,
+                breakdown: PenaltyBreakdown,
+                budget: int) -> Tuple[PenaltyBreakdown, int]:
+        """Hill-climb a schedule in place with best-improvement moves.
+        
+        Entries are visited in random order and each one takes its best
+        improving move from ``_entry_moves``. Stops after ``budget`` move
+        evaluations or a pass over all entries without improvement. Returns
+        the new breakdown and the number of moves evaluated.
+        """
+        used = 0
+        improved = True
+        while improved and used < budget:
+            improved = False
+            entries = schedule.sorted_entries()
+            self.rng.shuffle(entries)
+            for slot, entry in entries:
+                if used >= budget:
+                    break
                 
-                # Add practicals
-                for _ in range(subject.practical_hours):
-                    required_classes.append((group, subject, False))
+                best_moves: Optional[List[Move]] = None
+                best = breakdown
+                for moves in self._entry_moves(schedule, slot, entry):
+                    if used >= budget:
+                        break
+                    used += 1
+                    self._apply_moves(schedule, moves)
+                    candidate = self.evaluator.evaluate_moves(schedule, breakdown, moves)
+                    self._undo_moves(schedule, moves)
+                    if candidate.is_valid and candidate.total_penalty < best.total_penalty - 1e-9:
+                        best_moves, best = moves, candidate
+                
+                if best_moves:
+                    self._apply_moves(schedule, best_moves)
+                    breakdown = best
+                    improved = True
+                    self.memetic_stats.improvements += 1
+        
+        self.memetic_stats.evaluations += used
+        self.evaluations += used
+        return breakdown, used
+    
+    def _polish_elites(self,
+                       population_fitness: List[Tuple[Schedule, float]],
+                       breakdowns: Dict[int, PenaltyBreakdown]) -> None:
+        """Polish copies of the elite schedules, sharing the memetic budget between them.
         
-        # Shuffle the classes
-        random.shuffle(required_classes)
+        An elite that improves is replaced by its polished copy, so schedules
+        referenced elsewhere are left as they are; the population is then
+        sorted by fitness again.
+        """
+        elites = population_fitness[:self.elite_size]
+        if not elites:
+            return
         
-        # Try to schedule each class
-        for group, subject, is_lecture in required_classes:
-            self._schedule_class(schedule, group, subject, is_lecture)
+        budget = max(1, self.memetic_budget // len(elites))
+        for i, (schedule, _) in enumerate(elites):
+            breakdown = breakdowns.get(id(schedule)) or self.evaluator.breakdown(schedule)
+            polished = schedule.copy()
+            polished_breakdown, _ = self._polish(polished, breakdown, budget)
+            if polished_breakdown.total_penalty >= breakdown.total_penalty:
+                continue
+            
+            breakdowns[id(polished)] = polished_breakdown
+            population_fitness[i] = (polished, polished_breakdown.score)
+            if polished_breakdown.score > self.best_fitness:
+                self.best_fitness = polished_breakdown.score
+                self.best_schedule = polished.copy()
         
-        return schedule
+        population_fitness.sort(key=lambda x: x[1], reverse=True)
     
-    def _schedule_class(self, 
-                       schedule: Schedule,
-                       group: Group,
-                       subject: Subject,
-                       is_lecture: bool,
-                       max_attempts: int = 20) -> bool:
-        """Schedule a single class with multiple attempts."""
-        # Find suitable lecturers
-        suitable_lecturers = [
-            l for l in self.lecturers
-            if l.can_teach_subject(subject.subject_id, is_lecture)
-        ]
-        if not suitable_lecturers:
-            return False
-        
-        # Try different combinations
-        for _ in range(max_attempts):
-            lecturer = random.choice(suitable_lecturers)
-            time_slot = self._find_available_slot(schedule, group, lecturer)
+    def _repair(self, schedule: Schedule) -> bool:
+        """Re-slot the entries that break hard constraints, in place.
+        
+        Returns whether the schedule is valid afterwards.
+        """
+        conflicting = self.validator.report(schedule).conflicting_entries()
+        for slot, entry in conflicting:
+            schedule.remove_entry(slot, entry)
+        
+        for _, entry in conflicting:
+            time_slot = self._find_available_slot(schedule, entry.groups[0], entry.lecturer, entry.groups[1:])
             if not time_slot:
-                continue
+                return False
             
             classroom = self._find_suitable_classroom(
-                schedule, time_slot, group.student_count, is_lecture and subject.requires_subgroups
+                schedule, time_slot,
+                sum(g.student_count for g in entry.groups),
+                entry.is_lecture and entry.subject.requires_subgroups
             )
             if not classroom:
-                continue
+                return False
             
-            # Create and add schedule entry
-            entry = ScheduleEntry(
-                subject=subject,
-                lecturer=lecturer,
-                classroom=classroom,
-                groups=[group],
-                is_lecture=is_lecture
-            )
-            
-            if time_slot not in schedule.entries:
-                schedule.entries[time_slot] = []
-            schedule.entries[time_slot].append(entry)
-            return True
+            schedule.add_entry(time_slot, replace(entry, classroom=classroom))
         
-        return False
-    
-    def _find_available_slot(self,
-                           schedule: Schedule,
-                           group: Group,
-                           lecturer: Lecturer) -> Optional[TimeSlot]:
-        """Find an available time slot for a class."""
-        # Get occupied slots
-        group_slots = schedule.get_group_slots(group)
-        lecturer_slots = schedule.get_lecturer_slots(lecturer)
-        occupied_slots = group_slots | lecturer_slots
-        
-        # Get slots by day for the group
-        slots_by_day: Dict[int, Set[int]] = {}
-        for slot in group_slots:
-            if slot.day not in slots_by_day:
-                slots_by_day[slot.day] = set()
-            slots_by_day[slot.day].add(slot.period)
-        
-        # Try to find a slot that minimizes gaps
-        available_slots = []
-        for day in range(5):
-            day_slots = slots_by_day.get(day, set())
-            for period in range(4):
-                slot = TimeSlot(day=day, period=period)
-                if slot not in occupied_slots:
-                    # Calculate gap penalty
-                    if not day_slots:
-                        gap_penalty = 0
-                    else:
-                        min_period = min(day_slots)
-                        max_period = max(day_slots)
-                        if period < min_period:
-                            gap_penalty = min_period - period
-                        elif period > max_period:
-                            gap_penalty = period - max_period
-                        else:
-                            gap_penalty = 1
-                    available_slots.append((slot, gap_penalty))
-        
-        if not available_slots:
-            return None
-        
-        # Sort by gap penalty and randomly choose from the best options
-        available_slots.sort(key=lambda x: x[1])
-        best_penalty = available_slots[0][1]
-        best_slots = [slot for slot, penalty in available_slots if penalty == best_penalty]
-        return random.choice(best_slots)
+        return self.validator.is_valid(schedule)
     
-    def _find_suitable_classroom(self,
-                               schedule: Schedule,
-                               time_slot: TimeSlot,
-                               student_count: int,
-                               requires_lab: bool) -> Optional[Classroom]:
-        """Find a suitable classroom for a class."""
-        # Get occupied classrooms
-        occupied_classrooms = set()
-        if time_slot in schedule.entries:
-            occupied_classrooms = {
-                entry.classroom for entry in schedule.entries[time_slot]
-            }
-        
-        # Find available classrooms with sufficient capacity
-        available_classrooms = [
-            c for c in self.classrooms
-            if c not in occupied_classrooms and 
-            c.can_accommodate(student_count) and
-            (not requires_lab or c.is_lab)
-        ]
-        
-        if not available_classrooms:
-            return None
+    def _breed(self,
+               population_fitness: List[Tuple[Schedule, float]],
+               seeds: List[int],
+               pool: Optional[WorkerPool]) -> List[Schedule]:
+        """Create one valid child per seed, in the pool when there is one."""
+        if pool:
+            return pool.breed(population_fitness, seeds)
         
-        # Prefer classrooms that are closer to the required capacity
-        available_classrooms.sort(key=lambda c: abs(c.capacity - student_count))
-        return available_classrooms[0]
+        # Go through the same encoding as the workers so results match
+        children, stats = breed_genes(
+            self,
+            [self.encoder.encode(schedule).genes for schedule, _ in population_fitness],
+            [fitness for _, fitness in population_fitness],
+            seeds
+        )
+        self.offspring_stats.merge(stats)
+        return [self.encoder.decode(EncodedSchedule(genes)) for genes in children]
     
     def evolve(self, 
                population: List[Schedule], 
                generations: int = 100,
-               progress_callback: Optional[ProgressCallback] = None) -> Schedule:
-        """Evolve the population to find the best schedule."""
+               progress_callback: Optional[ProgressCallback] = None,
+               stopping: Optional[StoppingCriteria] = None,
+               checkpoint_path: Optional[str] = None,
+               checkpoint_every: int = 0,
+               resume: Optional[Checkpoint] = None) -> Schedule:
+        """Evolve the population to find the best schedule.
+        
+        Runs at most ``generations`` generations; ``stopping`` may end the run
+        earlier. The criteria are checked once per generation, after scoring
+        the population. The outcome is recorded in ``result``.
+        
+        With ``checkpoint_path``, the run state is saved there every
+        ``checkpoint_every`` generations. Passing a loaded checkpoint as
+        ``resume`` continues that run instead of evolving ``population``; with
+        the same options it ends exactly as the uninterrupted run would.
+        """
         self.best_fitness_history = []
+        self.evaluations = 0
+        self.result = EvolutionResult()
+        start = time.perf_counter()
+        if resume:
+            start -= resume.seconds
+        
+        pool = WorkerPool(self, self.workers) if self.workers else None
+        try:
+            best_schedule = self._evolve(population, generations, progress_callback, pool,
+                                         stopping or StoppingCriteria(), start,
+                                         checkpoint_path, checkpoint_every, resume)
+        finally:
+            if pool:
+                pool.close()
+        
+        self._record_result(best_schedule, start)
+        if self.telemetry:
+            self.telemetry.on_finish(self.result)
+        return best_schedule
+    
+    def _report_generation(self,
+                           generation: int,
+                           population_fitness: List[Tuple[Schedule, float]],
+                           generation_start: float,
+                           evaluations_before: int,
+                           offspring_before: OffspringStats) -> None:
+        """Send the measurements of a generation to the telemetry."""
+        fitness = [f for _, f in population_fitness]
+        offspring = self.offspring_stats
+        self.telemetry.on_generation(GenerationRecord(
+            generation=generation,
+            seconds=time.perf_counter() - generation_start,
+            **GenerationRecord.fitness_summary(fitness),
+            diversity=len({s.canonical_hash() for s, _ in population_fitness}) / len(fitness) if fitness else 0.0,
+            evaluations=self.evaluations - evaluations_before,
+            offspring_attempts=offspring.attempts - offspring_before.attempts,
+            offspring_repaired=offspring.repaired - offspring_before.repaired,
+            offspring_rejected=offspring.rejected - offspring_before.rejected,
+            offspring_filled=offspring.filled - offspring_before.filled,
+            phases=self._timer.reset()
+        ))
+    
+    def _decode_population(self, population_genes: List[np.ndarray]) -> List[Schedule]:
+        """Decode an encoded population."""
+        return [self.encoder.decode(EncodedSchedule(genes)) for genes in population_genes]
+    
+    def _make_checkpoint(self,
+                         population: List[Schedule],
+                         generation: int,
+                         last_best: float,
+                         stale_generations: int,
+                         seconds: float) -> Checkpoint:
+        """Capture the state of a run before ``generation``."""
+        counters = {f"offspring_{name}": value for name, value in asdict(self.offspring_stats).items()}
+        counters.update({f"memetic_{name}": value for name, value in asdict(self.memetic_stats).items()})
+        counters.update(
+            cache_hits=self.fitness_cache.hits,
+            cache_misses=self.fitness_cache.misses,
+            validator_checks=self.validator.checks,
+            validator_skipped=self.validator.skipped
+        )
+        return Checkpoint(
+            generation=generation,
+            population=[self.encoder.encode(schedule).genes for schedule in population],
+            rng_state=self.rng.getstate(),
+            best_genes=self.encoder.encode(self.best_schedule).genes if self.best_schedule else None,
+            best_fitness=self.best_fitness,
+            best_fitness_history=list(self.best_fitness_history),
+            last_best=last_best,
+            stale_generations=stale_generations,
+            evaluations=self.evaluations,
+            seconds=seconds,
+            cache=self.fitness_cache.items(),
+            counters=counters
+        )
+    
+    def _restore_checkpoint(self, checkpoint: Checkpoint) -> List[Schedule]:
+        """Restore the state of a run from a checkpoint and return its population."""
+        if any(len(genes) < self.encoder.class_count for genes in checkpoint.population):
+            raise ValueError("Checkpoint does not match the scheduling problem")
+        
+        self.rng.setstate(checkpoint.rng_state)
+        self.best_schedule = (
+            self.encoder.decode(EncodedSchedule(checkpoint.best_genes))
+            if checkpoint.best_genes is not None else None
+        )
+        self.best_fitness = checkpoint.best_fitness
+        self.best_fitness_history = list(checkpoint.best_fitness_history)
+        self.evaluations = checkpoint.evaluations
+        
+        self.fitness_cache = FitnessCache(self.fitness_cache.max_size)
+        for key, value in checkpoint.cache:
+            self.fitness_cache.put(key, value)
+        
+        counters = checkpoint.counters
+        self.offspring_stats = OffspringStats(
+            **{name: counters.get(f"offspring_{name}", 0) for name in asdict(OffspringStats())}
+        )
+        self.memetic_stats = MemeticStats(
+            **{name: counters.get(f"memetic_{name}", 0) for name in asdict(MemeticStats())}
+        )
+        self.fitness_cache.hits = counters.get("cache_hits", 0)
+        self.fitness_cache.misses = counters.get("cache_misses", 0)
+        self.validator.checks = counters.get("validator_checks", 0)
+        self.validator.skipped = counters.get("validator_skipped", 0)
+        return self._decode_population(checkpoint.population)
+    
+    def _record_result(self, best_schedule: Optional[Schedule], start: float) -> None:
+        """Fill ``result`` in at the end of a run started at ``start``."""
+        self.result.best_schedule = best_schedule
+        self.result.best_fitness = self.best_fitness
+        self.result.best_fitness_history = self.best_fitness_history
+        self.result.generations = len(self.best_fitness_history)
+        self.result.evaluations = self.evaluations
+        self.result.seconds = time.perf_counter() - start
+    
+    def _evolve(self,
+                population: List[Schedule],
+                generations: int,
+                progress_callback: Optional[ProgressCallback],
+                pool: Optional[WorkerPool],
+                stopping: StoppingCriteria,
+                start: float,
+                checkpoint_path: Optional[str],
+                checkpoint_every: int,
+                resume: Optional[Checkpoint]) -> Schedule:
+        """Run the generations of ``evolve``."""
+        # Penalty breakdowns of known schedules, keyed by id, for delta evaluation
+        breakdowns: Dict[int, PenaltyBreakdown] = {}
+        last_best = self.best_fitness
+        stale_generations = 0
+        first_generation = 0
+        if resume:
+            population = self._restore_checkpoint(resume)
+            last_best = resume.last_best
+            stale_generations = resume.stale_generations
+            first_generation = resume.generation
         
-        for generation in range(generations):
+        for generation in range(first_generation, generations):
+            if self.telemetry:
+                generation_start = time.perf_counter()
+                evaluations_before = self.evaluations
+                offspring_before = replace(self.offspring_stats)
+                self._timer.reset()
+            
             # Evaluate fitness and sort population
-            population_fitness = [
-                (schedule, self.evaluate_schedule(schedule))
-                for schedule in population
-            ]
+            with self._phase("evaluation"):
+                fitness = self._evaluate_population(population, breakdowns, pool)
+            population_fitness = list(zip(population, fitness))
             population_fitness.sort(key=lambda x: x[1], reverse=True)
             
             # Update best solution
             current_best_fitness = population_fitness[0][1]
             if current_best_fitness > self.best_fitness:
                 self.best_fitness = current_best_fitness
-                self.best_schedule = deepcopy(population_fitness[0][0])
+                self.best_schedule = population_fitness[0][0].copy()
             
             self.best_fitness_history.append(current_best_fitness)
             
@@ -320,28 +752,64 @@ class GeneticScheduler:
             if progress_callback:
                 progress_callback(generation, current_best_fitness)
             
-            # Select elite schedules
+            if self.best_fitness > last_best:
+                last_best = self.best_fitness
+                stale_generations = 0
+            else:
+                stale_generations += 1
+            
+            stop_reason = stopping.reason(
+                self.best_fitness, stale_generations, time.perf_counter() - start, self.evaluations
+            )
+            if stop_reason:
+                self.result.stop_reason = stop_reason
+                if self.telemetry:
+                    self._report_generation(generation, population_fitness, generation_start,
+                                            evaluations_before, offspring_before)
+                break
+            
+            # Polish and select elite schedules
+            if self.memetic_budget:
+                with self._phase("polishing"):
+                    self._polish_elites(population_fitness, breakdowns)
             new_population = [
                 schedule for schedule, _ in population_fitness[:self.elite_size]
             ]
             
+            new_breakdowns = {
+                id(schedule): breakdowns[id(schedule)]
+                for schedule in new_population if id(schedule) in breakdowns
+            }
+            
             # Create offspring through crossover and mutation
+            if self.parallel_offspring:
+                seeds = spawn_seeds(self.rng, self.population_size - len(new_population))
+                with self._phase("breeding"):
+                    new_population.extend(self._breed(population_fitness, seeds, pool))
+            
+            attempts_left = self.max_offspring_attempts
             while len(new_population) < self.population_size:
-                if random.random() < self.crossover_rate:
-                    parent1 = self._tournament_select(population_fitness)
-                    parent2 = self._tournament_select(population_fitness)
-                    child = self._crossover(parent1, parent2)
-                else:
-                    # If no crossover, clone a parent
-                    child = deepcopy(self._tournament_select(population_fitness))
-                
-                # Apply mutation
-                if random.random() < self.mutation_rate:
-                    child = self._mutate(child)
-                
-                if child.validate_hard_constraints():
-                    new_population.append(child)
+                child, child_breakdown, attempts = self._make_child(
+                    population_fitness, breakdowns, attempts_left
+                )
+                attempts_left -= attempts
+                new_population.append(child)
+                if child_breakdown is not None:
+                    new_breakdowns[id(child)] = child_breakdown
             
             population = new_population
+            breakdowns = new_breakdowns
+            
+            if checkpoint_path and checkpoint_every and (generation + 1) % checkpoint_every == 0:
+                with self._phase("checkpoint"):
+                    checkpoint = self._make_checkpoint(
+                        population, generation + 1, last_best, stale_generations, time.perf_counter() - start
+                    )
+                    checkpoint.save(checkpoint_path)
+            
+            if self.telemetry:
+                self._report_generation(generation, population_fitness, generation_start,
+                                        evaluations_before, offspring_before)
         
+        self.final_population = population
         return self.best_schedule if self.best_schedule else population[0]
\ No newline at end of file
@@ -0,0 +1,176 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from models.schedule import Schedule
+from models.subject import Subject
+from models.lecturer import Lecturer
+from models.group import Group
+from models.classroom import Classroom
+from . import parallel
+from .cache import FitnessCache
+from .encoding import EncodedSchedule
+from .genetic import GeneticScheduler, StoppingCriteria, EvolutionResult
+
+IslandProgressCallback = Callable[[int, int, float], None]  # island, generation, best fitness
+
+TOPOLOGIES = ("ring", "full")
+
+def _island_epoch(population_genes: Optional[List[np.ndarray]],
+                  generations: int,
+                  seed: int) -> Tuple[List[np.ndarray], List[float], List[float], int]:
+    """Evolve one island for a number of generations in a worker process.
+    
+    Returns the island's population sorted by fitness, its fitness, the
+    best fitness of every generation and the number of evaluations.
+    """
+    scheduler = parallel._worker_scheduler
+    scheduler.rng = random.Random(seed)
+    
+    if population_genes is None:
+        population = scheduler.generate_initial_population()
+    else:
+        population = [scheduler.encoder.decode(EncodedSchedule(g)) for g in population_genes]
+    
+    # The worker's scheduler is shared by all islands it runs; a fresh cache
+    # keeps the evaluations from depending on which islands it ran before
+    scheduler.best_schedule = None
+    scheduler.best_fitness = 0.0
+    scheduler.fitness_cache = FitnessCache(scheduler.fitness_cache.max_size)
+    scheduler.evolve(population, generations=generations)
+    
+    final = scheduler.final_population or population
+    ranked = sorted(
+        ((scheduler.evaluate_schedule(s), i) for i, s in enumerate(final)),
+        key=lambda x: x[0], reverse=True
+    )
+    genes = [scheduler.encoder.encode(final[i]).genes for _, i in ranked]
+    return genes, [fitness for fitness, _ in ranked], scheduler.best_fitness_history, scheduler.evaluations
+
+class IslandScheduler(GeneticScheduler):
+    """Runs several independent GA populations, each in its own process.
+    
+    Every ``migration_interval`` generations the ``migration_size`` best
+    schedules of each island replace the worst schedules of its neighbours:
+    the next island on a ring, or every other island when fully connected.
+    """
+    
+    def __init__(self,
+                 subjects: List[Subject],
+                 lecturers: List[Lecturer],
+                 groups: List[Group],
+                 classrooms: List[Classroom],
+                 islands: int = 4,
+                 migration_interval: int = 10,
+                 migration_size: int = 2,
+                 topology: str = "ring",
+                 **kwargs):
+        """Initialize the island scheduler; other options are per island."""
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology {topology!r}, expected one of {TOPOLOGIES}")
+        super().__init__(subjects, lecturers, groups, classrooms, **kwargs)
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.island_fitness_history: List[List[float]] = [[] for _ in range(islands)]
+    
+    def _neighbours(self, island: int) -> List[int]:
+        """Islands receiving migrants from ``island``."""
+        if self.islands < 2:
+            return []
+        if self.topology == "ring":
+            return [(island + 1) % self.islands]
+        return [other for other in range(self.islands) if other != island]
+    
+    def _migrate(self, populations: List[List[np.ndarray]]) -> None:
+        """Replace the worst schedules of each island with migrants.
+        
+        Populations are sorted best first. An island keeps its size and at
+        least ``migration_size`` of its own best schedules; when more
+        migrants arrive than fit (full topology), the best migrants of every
+        sender are taken in turn.
+        """
+        senders: List[List[List[np.ndarray]]] = [[] for _ in range(self.islands)]
+        for island, population in enumerate(populations):
+            for neighbour in self._neighbours(island):
+                senders[neighbour].append(population[:self.migration_size])
+        
+        for island, batches in enumerate(senders):
+            population = populations[island]
+            incoming = [g for rank in zip_longest(*batches) for g in rank if g is not None]
+            keep = max(len(population) - len(incoming), min(self.migration_size, len(population)))
+            populations[island] = population[:keep] + [g.copy() for g in incoming[:len(population) - keep]]
+    
+    def evolve(self,
+               population: Optional[List[Schedule]] = None,
+               generations: int = 100,
+               progress_callback: Optional[IslandProgressCallback] = None,
+               stopping: Optional[StoppingCriteria] = None) -> Schedule:
+        """Evolve all islands and return the best schedule found.
+        
+        A given initial population is dealt out between the islands; without
+        one every island generates its own. The ``stopping`` criteria are
+        checked between migration epochs, on the best fitness of all islands.
+        """
+        stopping = stopping or StoppingCriteria()
+        self.evaluations = 0
+        self.result = EvolutionResult()
+        start = time.perf_counter()
+        
+        populations: List[Optional[List[np.ndarray]]] = [None] * self.islands
+        if population:
+            for island in range(self.islands):
+                populations[island] = [
+                    self.encoder.encode(schedule).genes for schedule in population[island::self.islands]
+                ] or None
+        
+        self.island_fitness_history = [[] for _ in range(self.islands)]
+        executor = ProcessPoolExecutor(
+            max_workers=self.islands,
+            initializer=parallel._init_worker,
+            initargs=(self.subjects, self.lecturers, self.groups, self.classrooms, self.worker_options())
+        )
+        try:
+            done = 0
+            last_best = self.best_fitness
+            stale_generations = 0
+            while done < generations:
+                epoch = min(self.migration_interval, generations - done)
+                seeds = parallel.spawn_seeds(self.rng, self.islands)
+                results = list(executor.map(_island_epoch, populations, [epoch] * self.islands, seeds))
+                done += epoch
+                
+                for island, (genes, fitness, history, evaluations) in enumerate(results):
+                    self.island_fitness_history[island].extend(history)
+                    self.evaluations += evaluations
+                    populations[island] = genes
+                    if fitness and fitness[0] > self.best_fitness:
+                        self.best_fitness = fitness[0]
+                        self.best_schedule = self.encoder.decode(EncodedSchedule(genes[0]))
+                    if progress_callback:
+                        progress_callback(island, done - 1, max(self.island_fitness_history[island], default=0.0))
+                
+                if self.best_fitness > last_best:
+                    last_best = self.best_fitness
+                    stale_generations = 0
+                else:
+                    stale_generations += epoch
+                
+                stop_reason = stopping.reason(
+                    self.best_fitness, stale_generations, time.perf_counter() - start, self.evaluations
+                )
+                if stop_reason:
+                    self.result.stop_reason = stop_reason
+                    break
+                
+                if done < generations:
+                    self._migrate(populations)
+        finally:
+            executor.shutdown()
+        
+        self.best_fitness_history = [max(values) for values in zip(*self.island_fitness_history)]
+        self._record_result(self.best_schedule, start)
+        return self.best_schedule
\ No newline at end of file
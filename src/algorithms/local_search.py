@@ -0,0 +1,236 @@
+import math
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+from models.schedule import Schedule, TimeSlot, ScheduleEntry
+from models.subject import Subject
+from models.lecturer import Lecturer
+from models.group import Group
+from models.classroom import Classroom
+from .evaluator import PenaltyBreakdown, Move
+from .base import SchedulerBase, ProgressCallback
+
+METHODS = ("sa", "tabu")
+
+class LocalSearchScheduler(SchedulerBase):
+    """Improves a single schedule by simulated annealing or tabu search.
+    
+    A move either reassigns one entry (a new slot, and possibly another
+    eligible lecturer or a free classroom that fits), or swaps the slots of
+    two entries. Only moves that keep the schedule valid are tried, and every
+    move is scored by delta evaluation of the resources it touches.
+    
+    Simulated annealing (``sa``) applies one random move per iteration and
+    accepts a worse schedule with probability ``exp(delta / temperature)``;
+    the temperature decays geometrically from ``initial_temperature`` to
+    ``final_temperature`` over the iteration or time budget. Tabu search
+    (``tabu``) applies the best of ``tabu_candidates`` random moves per
+    iteration, forbidding an entry to return to a slot it left during the
+    last ``tabu_tenure`` iterations unless that beats the best schedule.
+    
+    Moves are compared by total penalty rather than by score, which stops
+    improving once it reaches zero.
+    """
+    
+    def __init__(self,
+                 subjects: List[Subject],
+                 lecturers: List[Lecturer],
+                 groups: List[Group],
+                 classrooms: List[Classroom],
+                 method: str = "sa",
+                 initial_temperature: float = 1.0,
+                 final_temperature: float = 0.01,
+                 tabu_tenure: int = 20,
+                 tabu_candidates: int = 30,
+                 **kwargs):
+        """Initialize the local search; other options are as for SchedulerBase."""
+        if method not in METHODS:
+            raise ValueError(f"Unknown method {method!r}, expected one of {METHODS}")
+        super().__init__(subjects, lecturers, groups, classrooms, **kwargs)
+        self.method = method
+        self.initial_temperature = initial_temperature
+        self.final_temperature = final_temperature
+        self.tabu_tenure = tabu_tenure
+        self.tabu_candidates = tabu_candidates
+        self.iterations_done = 0
+    
+    def _entries(self, schedule: Schedule) -> List[Tuple[TimeSlot, ScheduleEntry]]:
+        """All (slot, entry) pairs of a schedule."""
+        return [(slot, entry) for slot, entries in schedule.entries.items() for entry in entries]
+    
+    def _random_move(self, schedule: Schedule,
+                     entries: List[Tuple[TimeSlot, ScheduleEntry]]) -> Optional[List[Move]]:
+        """A random reassignment or swap that keeps the schedule valid, if one is found."""
+        old_slot, entry = self.rng.choice(entries)
+        if self.rng.random() < 0.5:
+            new_slot = self.rng.choice(self.time_grid.slots)
+            leaving = entry if new_slot == old_slot else None
+            
+            new_entry = entry
+            if self.rng.random() < 0.5:
+                lecturers = self.problem_index.eligible_lecturers(entry.subject.subject_id, entry.is_lecture)
+                if lecturers:
+                    new_entry = replace(new_entry, lecturer=self.rng.choice(lecturers))
+            if self.rng.random() < 0.5 or not self._fits(schedule, new_entry, new_slot, leaving):
+                classrooms = [
+                    c for c in self.problem_index.candidate_classrooms(
+                        sum(g.student_count for g in entry.groups),
+                        entry.is_lecture and entry.subject.requires_subgroups
+                    )
+                    if c not in schedule.get_slot_classrooms(new_slot) or
+                    (leaving is not None and c == leaving.classroom)
+                ]
+                if classrooms:
+                    new_entry = replace(new_entry, classroom=self.rng.choice(classrooms))
+            
+            if not self._fits(schedule, new_entry, new_slot, leaving):
+                return None
+            if new_entry == entry:
+                return [(entry, old_slot, new_slot)] if new_slot != old_slot else None
+            return [(entry, old_slot, None), (new_entry, None, new_slot)]
+        else:
+            other_slot, other = self.rng.choice(entries)
+            if (other_slot != old_slot and
+                    self._fits(schedule, entry, other_slot, leaving=other) and
+                    self._fits(schedule, other, old_slot, leaving=entry)):
+                return [(entry, old_slot, other_slot), (other, other_slot, old_slot)]
+        return None
+    
+    @staticmethod
+    def _tabu_key(entry: ScheduleEntry, slot: TimeSlot) -> tuple:
+        """Key forbidding a class (whatever its lecturer and classroom) to return to a slot."""
+        return (
+            entry.subject.subject_id,
+            tuple(group.group_id for group in entry.groups),
+            entry.is_lecture,
+            slot.day,
+            slot.period
+        )
+    
+    @staticmethod
+    def _update_entries(entries: List[Tuple[TimeSlot, ScheduleEntry]],
+                        moves: List[Move]) -> List[Tuple[TimeSlot, ScheduleEntry]]:
+        """Apply moves to a list of (slot, entry) pairs."""
+        moved = {id(entry): new_slot for entry, old_slot, new_slot in moves if old_slot is not None}
+        updated = [
+            (moved.get(id(entry), slot), entry) for slot, entry in entries
+        ]
+        updated = [(slot, entry) for slot, entry in updated if slot is not None]
+        updated.extend((new_slot, entry) for entry, old_slot, new_slot in moves if old_slot is None)
+        return updated
+    
+    def search(self,
+               schedule: Optional[Schedule] = None,
+               iterations: int = 10000,
+               time_limit: Optional[float] = None,
+               progress_callback: Optional[ProgressCallback] = None) -> Schedule:
+        """Improve a schedule and return the best one found.
+        
+        Starts from a copy of ``schedule``, or from a random schedule. Stops
+        after ``iterations`` iterations or ``time_limit`` seconds, whichever
+        comes first. ``best_fitness_history`` gets one value per iteration.
+        """
+        start = time.perf_counter()
+        current = schedule.copy() if schedule is not None else self._generate_random_schedule()
+        breakdown = self.evaluator.breakdown(current)
+        
+        self.best_schedule = current.copy()
+        self.best_fitness = breakdown.score
+        self.best_fitness_history = []
+        best_penalty = breakdown.total_penalty
+        self.iterations_done = 0
+        
+        entries = self._entries(current)
+        tabu: Dict[tuple, int] = {}
+        
+        for iteration in range(iterations):
+            elapsed = time.perf_counter() - start
+            if time_limit is not None and elapsed >= time_limit:
+                break
+            
+            if entries:
+                if self.method == "sa":
+                    progress = iteration / iterations
+                    if time_limit:
+                        progress = max(progress, elapsed / time_limit)
+                    temperature = self.initial_temperature * (
+                        self.final_temperature / self.initial_temperature) ** progress
+                    moves, breakdown = self._annealing_step(current, breakdown, entries, temperature)
+                else:
+                    moves, breakdown = self._tabu_step(current, breakdown, entries, tabu, iteration, best_penalty)
+                
+                if moves:
+                    # Keep the (slot, entry) list in step with the schedule
+                    entries = self._update_entries(entries, moves)
+                    if breakdown.total_penalty < best_penalty:
+                        best_penalty = breakdown.total_penalty
+                        self.best_fitness = breakdown.score
+                        self.best_schedule = current.copy()
+            
+            self.iterations_done += 1
+            self.best_fitness_history.append(self.best_fitness)
+            if progress_callback:
+                progress_callback(iteration, self.best_fitness)
+        
+        return self.best_schedule
+    
+    def _annealing_step(self,
+                        schedule: Schedule,
+                        breakdown: PenaltyBreakdown,
+                        entries: List[Tuple[TimeSlot, ScheduleEntry]],
+                        temperature: float) -> Tuple[Optional[List[Move]], PenaltyBreakdown]:
+        """Try one random move; returns the moves applied and the new breakdown."""
+        moves = self._random_move(schedule, entries)
+        if moves is None:
+            return None, breakdown
+        
+        self._apply_moves(schedule, moves)
+        candidate = self.evaluator.evaluate_moves(schedule, breakdown, moves)
+        delta = breakdown.total_penalty - candidate.total_penalty
+        if candidate.is_valid and (delta >= 0 or self.rng.random() < math.exp(delta / temperature)):
+            return moves, candidate
+        
+        self._undo_moves(schedule, moves)
+        return None, breakdown
+    
+    def _tabu_step(self,
+                   schedule: Schedule,
+                   breakdown: PenaltyBreakdown,
+                   entries: List[Tuple[TimeSlot, ScheduleEntry]],
+                   tabu: Dict[tuple, int],
+                   iteration: int,
+                   best_penalty: float) -> Tuple[Optional[List[Move]], PenaltyBreakdown]:
+        """Apply the best admissible of a sample of moves."""
+        best_moves: Optional[List[Move]] = None
+        best_breakdown = breakdown
+        for _ in range(self.tabu_candidates):
+            moves = self._random_move(schedule, entries)
+            if moves is None:
+                continue
+            
+            self._apply_moves(schedule, moves)
+            candidate = self.evaluator.evaluate_moves(schedule, breakdown, moves)
+            self._undo_moves(schedule, moves)
+            if not candidate.is_valid:
+                continue
+            
+            is_tabu = any(
+                tabu.get(self._tabu_key(entry, new_slot), -1) >= iteration
+                for entry, _, new_slot in moves if new_slot is not None
+            )
+            if is_tabu and candidate.total_penalty >= best_penalty:
+                continue
+            if best_moves is None or candidate.total_penalty < best_breakdown.total_penalty:
+                best_moves, best_breakdown = moves, candidate
+        
+        if best_moves is None:
+            return None, breakdown
+        
+        self._apply_moves(schedule, best_moves)
+        for entry, old_slot, _ in best_moves:
+            if old_slot is not None:
+                tabu[self._tabu_key(entry, old_slot)] = iteration + self.tabu_tenure
+        if len(tabu) > 4 * self.tabu_tenure * len(best_moves):
+            for key in [key for key, expiry in tabu.items() if expiry < iteration]:
+                del tabu[key]
+        return best_moves, best_breakdown
\ No newline at end of file
@@ -0,0 +1,151 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+from models.schedule import Schedule
+from models.subject import Subject
+from models.lecturer import Lecturer
+from models.group import Group
+from models.classroom import Classroom
+from .encoding import EncodedSchedule
+
+if TYPE_CHECKING:
+    from .genetic import GeneticScheduler, OffspringStats
+
+# Scheduler rebuilt once per worker process from the static problem data
+_worker_scheduler: Optional["GeneticScheduler"] = None
+
+def _init_worker(subjects: List[Subject],
+                 lecturers: List[Lecturer],
+                 groups: List[Group],
+                 classrooms: List[Classroom],
+                 options: Dict[str, Any]) -> None:
+    """Build the worker's scheduler from the static problem data."""
+    global _worker_scheduler
+    from .genetic import GeneticScheduler
+    _worker_scheduler = GeneticScheduler(subjects, lecturers, groups, classrooms, **options)
+
+def evaluate_genes(scheduler: "GeneticScheduler", genes: List[np.ndarray]) -> List[float]:
+    """Score encoded schedules."""
+    encoded = [EncodedSchedule(g) for g in genes]
+    if scheduler.vectorized:
+        return scheduler.population_evaluator.evaluate(encoded).tolist()
+    return [scheduler.evaluator.breakdown(scheduler.encoder.decode(e)).score for e in encoded]
+
+def breed_genes(scheduler: "GeneticScheduler",
+                population_genes: List[np.ndarray],
+                fitness: List[float],
+                seeds: List[int]) -> Tuple[List[np.ndarray], "OffspringStats"]:
+    """Create one valid child per seed from an encoded, sorted population.
+    
+    Each child is bred from its own seeded random stream, with an equal share
+    of the scheduler's per-generation attempt budget, so the result does not
+    depend on how the seeds are split between workers.
+    """
+    from .genetic import OffspringStats
+    population = [scheduler.encoder.decode(EncodedSchedule(g)) for g in population_genes]
+    population_fitness = list(zip(population, fitness))
+    attempts_per_child = max(1, scheduler.max_offspring_attempts // max(scheduler.population_size, 1))
+    
+    rng = scheduler.rng
+    run_stats = scheduler.offspring_stats
+    scheduler.offspring_stats = stats = OffspringStats()
+    children = []
+    try:
+        for seed in seeds:
+            scheduler.rng = random.Random(seed)
+            child, _, _ = scheduler._make_child(population_fitness, {}, attempts_per_child)
+            children.append(scheduler.encoder.encode(child).genes)
+    finally:
+        scheduler.rng = rng
+        scheduler.offspring_stats = run_stats
+    return children, stats
+
+def spawn_seeds(rng: random.Random, count: int) -> List[int]:
+    """Seeds of independent child streams of a random generator."""
+    return [rng.getrandbits(64) for _ in range(count)]
+
+def generate_genes(scheduler: "GeneticScheduler", seeds: List[int]) -> List[np.ndarray]:
+    """Build one random schedule per seed, each from its own random stream."""
+    rng = scheduler.rng
+    genes = []
+    try:
+        for seed in seeds:
+            scheduler.rng = random.Random(seed)
+            genes.append(scheduler.encoder.encode(scheduler._generate_random_schedule()).genes)
+    finally:
+        scheduler.rng = rng
+    return genes
+
+def _evaluate_task(genes: List[np.ndarray]) -> List[float]:
+    return evaluate_genes(_worker_scheduler, genes)
+
+def _breed_task(population_genes: List[np.ndarray],
+                fitness: List[float],
+                seeds: List[int]) -> Tuple[List[np.ndarray], "OffspringStats"]:
+    return breed_genes(_worker_scheduler, population_genes, fitness, seeds)
+
+def _generate_task(seeds: List[int]) -> List[np.ndarray]:
+    return generate_genes(_worker_scheduler, seeds)
+
+def _split(items: List, parts: int) -> List[List]:
+    """Split a list into at most ``parts`` contiguous chunks."""
+    size = -(-len(items) // parts) if items else 1
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+class WorkerPool:
+    """Process pool that evaluates and breeds schedules for a GeneticScheduler.
+    
+    The static problem data is sent to every worker once through the pool
+    initializer; schedules travel in their compact array encoding.
+    """
+    
+    def __init__(self, scheduler: "GeneticScheduler", workers: int):
+        self.scheduler = scheduler
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                scheduler.subjects,
+                scheduler.lecturers,
+                scheduler.groups,
+                scheduler.classrooms,
+                scheduler.worker_options()
+            )
+        )
+    
+    def evaluate(self, schedules: List[Schedule]) -> List[float]:
+        """Score schedules across the workers, preserving order."""
+        genes = [self.scheduler.encoder.encode(schedule).genes for schedule in schedules]
+        scores: List[float] = []
+        for chunk_scores in self.executor.map(_evaluate_task, _split(genes, self.workers)):
+            scores.extend(chunk_scores)
+        return scores
+    
+    def breed(self, population_fitness: List[Tuple[Schedule, float]], seeds: List[int]) -> List[Schedule]:
+        """Create one child per seed across the workers, preserving order."""
+        population_genes = [self.scheduler.encoder.encode(s).genes for s, _ in population_fitness]
+        fitness = [f for _, f in population_fitness]
+        chunks = _split(seeds, self.workers)
+        children: List[Schedule] = []
+        for chunk_children, stats in self.executor.map(
+                _breed_task, [population_genes] * len(chunks), [fitness] * len(chunks), chunks):
+            children.extend(self.scheduler.encoder.decode(EncodedSchedule(g)) for g in chunk_children)
+            self.scheduler.offspring_stats.merge(stats)
+        return children
+    
+    def generate(self, seeds: List[int]) -> Iterator[Schedule]:
+        """Build one random schedule per seed across the workers, in order.
+        
+        Schedules are yielded as their chunk completes, so the caller can stop
+        consuming once it has enough.
+        """
+        chunks = _split(seeds, self.workers * 4)
+        for chunk_genes in self.executor.map(_generate_task, chunks):
+            for genes in chunk_genes:
+                yield self.scheduler.encoder.decode(EncodedSchedule(genes))
+    
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        self.executor.shutdown()
\ No newline at end of file
@@ -0,0 +1,104 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Tuple
+from models.subject import Subject
+from models.lecturer import Lecturer
+from models.group import Group
+from models.classroom import Classroom
+from .encoding import ClassRequirement, list_required_classes
+
+@dataclass(frozen=True)
+class ProblemIndex:
+    """Static lookups of a scheduling problem, built once per scheduler.
+    
+    Classroom buckets are keyed by whether a lab is required: the lab bucket
+    holds only labs, the other one every classroom. Each bucket is sorted by
+    capacity, ties keeping the input order.
+    """
+    subjects: Tuple[Subject, ...]
+    lecturers: Tuple[Lecturer, ...]
+    groups: Tuple[Group, ...]
+    classrooms: Tuple[Classroom, ...]
+    
+    # Integer ids of every entity
+    subject_ids: Mapping[str, int]
+    lecturer_ids: Mapping[Lecturer, int]
+    group_ids: Mapping[Group, int]
+    classroom_ids: Mapping[Classroom, int]
+    
+    # (subject_id, is_lecture) -> ids of the lecturers who can teach it
+    eligible_lecturer_ids: Mapping[Tuple[str, bool], Tuple[int, ...]]
+    
+    # requires_lab -> (capacities, classrooms), sorted by capacity
+    classroom_buckets: Mapping[bool, Tuple[Tuple[int, ...], Tuple[Classroom, ...]]]
+    
+    required_classes: Tuple[ClassRequirement, ...]
+    class_demand: Mapping[Group, Tuple[ClassRequirement, ...]]
+    
+    @classmethod
+    def build(cls,
+              subjects: List[Subject],
+              lecturers: List[Lecturer],
+              groups: List[Group],
+              classrooms: List[Classroom]) -> "ProblemIndex":
+        """Index a scheduling problem.
+        
+        Raises TypeError if a list holds something other than its entities.
+        """
+        for name, items, kind in (("subjects", subjects, Subject), ("lecturers", lecturers, Lecturer),
+                                  ("groups", groups, Group), ("classrooms", classrooms, Classroom)):
+            for item in items:
+                if not isinstance(item, kind):
+                    raise TypeError(f"{name} must hold {kind.__name__} objects, got {type(item).__name__} {item!r}")
+        
+        required_classes = tuple(list_required_classes(groups))
+        
+        class_demand: Dict[Group, List[ClassRequirement]] = {group: [] for group in groups}
+        for requirement in required_classes:
+            class_demand[requirement[0]].append(requirement)
+        
+        # Subjects taught to groups may be missing from the subject list
+        subject_ids = {s.subject_id: i for i, s in enumerate(subjects)}
+        for group in groups:
+            for subject_id in group.subjects:
+                subject_ids.setdefault(subject_id, len(subject_ids))
+        
+        eligible_lecturer_ids: Dict[Tuple[str, bool], Tuple[int, ...]] = {}
+        for subject_id in subject_ids:
+            for is_lecture in (True, False):
+                eligible_lecturer_ids[(subject_id, is_lecture)] = tuple(
+                    i for i, l in enumerate(lecturers)
+                    if l.can_teach_subject(subject_id, is_lecture)
+                )
+        
+        classroom_buckets = {}
+        for requires_lab in (False, True):
+            bucket = sorted(
+                (c for c in classrooms if not requires_lab or c.is_lab),
+                key=lambda c: c.capacity
+            )
+            classroom_buckets[requires_lab] = (tuple(c.capacity for c in bucket), tuple(bucket))
+        
+        return cls(
+            subjects=tuple(subjects),
+            lecturers=tuple(lecturers),
+            groups=tuple(groups),
+            classrooms=tuple(classrooms),
+            subject_ids=subject_ids,
+            lecturer_ids={l: i for i, l in enumerate(lecturers)},
+            group_ids={g: i for i, g in enumerate(groups)},
+            classroom_ids={c: i for i, c in enumerate(classrooms)},
+            eligible_lecturer_ids=eligible_lecturer_ids,
+            classroom_buckets=classroom_buckets,
+            required_classes=required_classes,
+            class_demand={group: tuple(demand) for group, demand in class_demand.items()}
+        )
+    
+    def eligible_lecturers(self, subject_id: str, is_lecture: bool) -> List[Lecturer]:
+        """Lecturers who can teach the lectures or practicals of a subject."""
+        return [self.lecturers[i] for i in self.eligible_lecturer_ids.get((subject_id, is_lecture), ())]
+    
+    def candidate_classrooms(self, student_count: int, requires_lab: bool) -> Tuple[Classroom, ...]:
+        """Classrooms large enough for a class, smallest first."""
+        capacities, classrooms = self.classroom_buckets[requires_lab]
+        return classrooms[bisect_left(capacities, student_count):]
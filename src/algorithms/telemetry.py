@@ -0,0 +1,124 @@
+import json
+import statistics
+import time
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import IO, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .genetic import EvolutionResult
+
+PHASES = ("evaluation", "selection", "crossover", "mutation", "validation", "repair",
+          "rejected", "breeding", "polishing", "checkpoint")
+
+# Context manager of phases that are not timed
+NO_PHASE = nullcontext()
+
+class _Phase:
+    """Adds the time spent inside a ``with`` block to a phase of a timer."""
+    
+    __slots__ = ("timer", "name", "start")
+    
+    def __init__(self, timer: "PhaseTimer", name: str):
+        self.timer = timer
+        self.name = name
+    
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.timer.add(self.name, time.perf_counter() - self.start)
+
+class PhaseTimer:
+    """Wall-clock seconds spent in each phase of a generation."""
+    
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+    
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+    
+    def add(self, name: str, seconds: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+    
+    def reset(self) -> Dict[str, float]:
+        """Return the phase times so far and start again from zero."""
+        seconds, self.seconds = self.seconds, {}
+        return seconds
+
+@dataclass
+class GenerationRecord:
+    """Measurements of one generation.
+    
+    ``phases`` holds the seconds spent in each of PHASES that ran. Phases may
+    nest: ``rejected`` is the whole time of offspring attempts that were
+    thrown away, including their selection, crossover and mutation, and
+    ``evaluation`` includes the validation done while scoring. ``diversity``
+    is the fraction of distinct schedules in the population.
+    """
+    generation: int
+    seconds: float
+    best_fitness: float
+    mean_fitness: float
+    median_fitness: float
+    worst_fitness: float
+    diversity: float
+    evaluations: int
+    offspring_attempts: int
+    offspring_repaired: int
+    offspring_rejected: int
+    offspring_filled: int
+    phases: Dict[str, float] = field(default_factory=dict)
+    
+    @staticmethod
+    def fitness_summary(fitness: List[float]) -> Dict[str, float]:
+        """Best, mean, median and worst of a list of fitness values."""
+        return {
+            "best_fitness": max(fitness, default=0.0),
+            "mean_fitness": statistics.fmean(fitness) if fitness else 0.0,
+            "median_fitness": statistics.median(fitness) if fitness else 0.0,
+            "worst_fitness": min(fitness, default=0.0)
+        }
+
+class Telemetry:
+    """Receives measurements of a run; subclass it and override what you need."""
+    
+    def on_generation(self, record: GenerationRecord) -> None:
+        """Called after every generation."""
+    
+    def on_finish(self, result: "EvolutionResult") -> None:
+        """Called once the run has ended."""
+
+class JsonLinesTelemetry(Telemetry):
+    """Writes one JSON object per generation, and one at the end of the run.
+    
+    Every line has an ``event`` field: ``generation`` for the fields of a
+    GenerationRecord, ``finish`` for the summary of the run.
+    """
+    
+    def __init__(self, path: Optional[str] = None, stream: Optional[IO[str]] = None):
+        if (path is None) == (stream is None):
+            raise ValueError("Give either a path or a stream")
+        self._owned = stream is None
+        self.stream = open(path, "w", encoding="utf-8") if stream is None else stream
+    
+    def _write(self, event: str, data: dict) -> None:
+        self.stream.write(json.dumps({"event": event, **data}) + "\n")
+        self.stream.flush()
+    
+    def on_generation(self, record: GenerationRecord) -> None:
+        self._write("generation", asdict(record))
+    
+    def on_finish(self, result: "EvolutionResult") -> None:
+        self._write("finish", {
+            "stop_reason": result.stop_reason,
+            "generations": result.generations,
+            "evaluations": result.evaluations,
+            "seconds": result.seconds,
+            "best_fitness": result.best_fitness
+        })
+    
+    def close(self) -> None:
+        """Close the file opened for a path."""
+        if self._owned:
+            self.stream.close()
\ No newline at end of file
@@ -0,0 +1,159 @@
+from dataclasses import dataclass, field
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Hashable, List, Tuple, Union
+from models.schedule import Schedule, TimeSlot, ScheduleEntry
+from models.lecturer import Lecturer
+from models.group import Group
+from models.classroom import Classroom
+from .problem_index import ProblemIndex
+
+CONFLICT_KINDS = ("lecturer", "group", "classroom", "capacity")
+
+@dataclass(frozen=True)
+class Conflict:
+    """A hard constraint broken by an entry in a time slot.
+    
+    ``kind`` is one of CONFLICT_KINDS. For clashes, ``entry`` is the entry
+    that found ``resource`` already busy in the slot; for capacity it is the
+    entry that does not fit its classroom.
+    """
+    time_slot: TimeSlot
+    kind: str
+    resource: Union[Lecturer, Group, Classroom]
+    entry: ScheduleEntry
+
+@dataclass
+class ConflictReport:
+    """All hard constraint conflicts of a schedule."""
+    conflicts: List[Conflict] = field(default_factory=list)
+    
+    @property
+    def is_valid(self) -> bool:
+        return not self.conflicts
+    
+    def by_slot(self) -> Dict[TimeSlot, List[Conflict]]:
+        """Conflicts grouped by time slot."""
+        result: Dict[TimeSlot, List[Conflict]] = {}
+        for conflict in self.conflicts:
+            result.setdefault(conflict.time_slot, []).append(conflict)
+        return result
+    
+    def conflicting_entries(self) -> List[Tuple[TimeSlot, ScheduleEntry]]:
+        """Entries involved in a conflict, once per slot, in report order.
+        
+        An entry object placed in several slots (e.g. after crossover) is
+        listed for each slot where it conflicts.
+        """
+        seen = set()
+        result = []
+        for conflict in self.conflicts:
+            key = (conflict.time_slot, id(conflict.entry))
+            if key not in seen:
+                seen.add(key)
+                result.append((conflict.time_slot, conflict.entry))
+        return result
+
+class HardConstraintValidator:
+    """Checks hard constraints with per-slot bitmasks of busy resources.
+    
+    Every lecturer, group and classroom owns one bit, taken from its dense id
+    in the problem index; a clash is a bit that is already set in the slot's
+    mask. Accepts the same schedules as ``Schedule.validate_hard_constraints``.
+    
+    ``is_valid`` reuses the validity cached on a schedule; ``checks`` and
+    ``skipped`` count full checks made and avoided that way.
+    """
+    
+    def __init__(self, problem_index: ProblemIndex):
+        self.lecturer_bits: Dict[Lecturer, int] = {l: 1 << i for l, i in problem_index.lecturer_ids.items()}
+        self.group_bits: Dict[Group, int] = {g: 1 << i for g, i in problem_index.group_ids.items()}
+        self.classroom_bits: Dict[Classroom, int] = {c: 1 << i for c, i in problem_index.classroom_ids.items()}
+        self.checks = 0
+        self.skipped = 0
+    
+    @staticmethod
+    def _bit(bits: Dict[Hashable, int], resource: Hashable) -> int:
+        """Bit of a resource, assigning a new one to resources outside the index."""
+        bit = bits.get(resource)
+        if bit is None:
+            bit = bits[resource] = 1 << len(bits)
+        return bit
+    
+    def is_valid(self, schedule: Schedule) -> bool:
+        """Whether the schedule meets all hard constraints."""
+        valid = schedule.cached_validity
+        if valid is not None:
+            self.skipped += 1
+            return valid
+        
+        self.checks += 1
+        valid = all(self._entries_valid(entries) for entries in schedule.entries.values())
+        schedule.remember_validity(valid)
+        return valid
+    
+    def slot_valid(self, schedule: Schedule, time_slot: TimeSlot) -> bool:
+        """Whether hard constraints are met within a single time slot."""
+        return self._entries_valid(schedule.entries.get(time_slot, []))
+    
+    def _entries_valid(self, entries: List[ScheduleEntry]) -> bool:
+        """Validate hard constraints for the entries of one time slot."""
+        lecturers = groups = classrooms = 0
+        for entry in entries:
+            bit = self.lecturer_bits.get(entry.lecturer) or self._bit(self.lecturer_bits, entry.lecturer)
+            if lecturers & bit:
+                return False
+            lecturers |= bit
+            
+            students = 0
+            for group in entry.groups:
+                bit = self.group_bits.get(group) or self._bit(self.group_bits, group)
+                if groups & bit:
+                    return False
+                groups |= bit
+                students += group.student_count
+            
+            bit = self.classroom_bits.get(entry.classroom) or self._bit(self.classroom_bits, entry.classroom)
+            if classrooms & bit or entry.classroom.capacity < students:
+                return False
+            classrooms |= bit
+        return True
+    
+    def report(self, schedule: Schedule) -> ConflictReport:
+        """List every hard constraint conflict of the schedule.
+        
+        Within a slot, entries claim their resources in the order of
+        ``Schedule.sorted_entries``; an entry that conflicts is reported and
+        claims nothing, so the entries that are not reported form a valid
+        schedule. Equal schedules give the same report.
+        """
+        report = ConflictReport()
+        for time_slot, entries in groupby(schedule.sorted_entries(), key=itemgetter(0)):
+            lecturers = groups = classrooms = 0
+            for _, entry in entries:
+                entry_conflicts = []
+                lecturer_bit = self._bit(self.lecturer_bits, entry.lecturer)
+                if lecturers & lecturer_bit:
+                    entry_conflicts.append(Conflict(time_slot, "lecturer", entry.lecturer, entry))
+                
+                group_bits = 0
+                for group in entry.groups:
+                    bit = self._bit(self.group_bits, group)
+                    if (groups | group_bits) & bit:
+                        entry_conflicts.append(Conflict(time_slot, "group", group, entry))
+                    group_bits |= bit
+                
+                classroom_bit = self._bit(self.classroom_bits, entry.classroom)
+                if classrooms & classroom_bit:
+                    entry_conflicts.append(Conflict(time_slot, "classroom", entry.classroom, entry))
+                
+                if not entry.classroom.can_accommodate(sum(g.student_count for g in entry.groups)):
+                    entry_conflicts.append(Conflict(time_slot, "capacity", entry.classroom, entry))
+                
+                if entry_conflicts:
+                    report.conflicts.extend(entry_conflicts)
+                else:
+                    lecturers |= lecturer_bit
+                    groups |= group_bits
+                    classrooms |= classroom_bit
+        return report
\ No newline at end of file
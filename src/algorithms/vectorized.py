@@ -0,0 +1,158 @@
+from typing import List, Tuple
+import numpy as np
+from .encoding import (
+    ChromosomeEncoder, EncodedSchedule, CLASS, SLOT, LECTURER, CLASSROOM,
+    UNSCHEDULED
+)
+
+def _reduce_by_key(keys: np.ndarray, *values: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Group values by key.
+    
+    Returns the unique keys, the number of items per key and, for every value
+    array, its minimum and maximum per key.
+    """
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]) if len(keys) else np.zeros(0, dtype=np.int64)
+    counts = np.diff(np.r_[starts, len(keys)])
+    result = [sorted_keys[starts], counts]
+    for value in values:
+        sorted_values = value[order]
+        result.append(np.minimum.reduceat(sorted_values, starts) if len(keys) else sorted_values)
+        result.append(np.maximum.reduceat(sorted_values, starts) if len(keys) else sorted_values)
+    return tuple(result)
+
+def _has_duplicates(keys: np.ndarray, active: np.ndarray) -> np.ndarray:
+    """Per individual, whether two active rows share the same key."""
+    # Inactive rows get distinct negative keys so they never match
+    filler = -1 - np.arange(keys.shape[1], dtype=np.int64)
+    keys = np.where(active, keys, filler)
+    keys = np.sort(keys, axis=1)
+    return (keys[:, 1:] == keys[:, :-1]).any(axis=1)
+
+class PopulationEvaluator:
+    """Scores a whole population of encoded schedules with array operations.
+    
+    Scores match ``ScheduleEvaluator`` (up to floating point rounding):
+    schedules with lecturer, group or classroom clashes or overfull classrooms
+    score 0, the others lose the severities of their soft constraint
+    violations.
+    """
+    
+    def __init__(self, encoder: ChromosomeEncoder, legacy_scoring: bool = False):
+        self.encoder = encoder
+        self.legacy_scoring = legacy_scoring
+        
+        # Static per-class data
+        classes = encoder.required_classes
+        subject_ids = {}
+        for _, subject, _ in classes:
+            subject_ids.setdefault(subject.subject_id, len(subject_ids))
+        self.subject_count = max(len(subject_ids), 1)
+        self.class_groups = encoder.row_groups.astype(np.int64)
+        self.class_subjects = np.array([subject_ids[s.subject_id] for _, s, _ in classes], dtype=np.int64)
+        self.class_is_lecture = encoder.row_is_lecture
+        self.class_requires_subgroups = np.array([s.requires_subgroups for _, s, _ in classes], dtype=bool)
+        self.class_students = np.array([g.student_count for g, _, _ in classes], dtype=np.int64)
+        
+        # Static per-classroom data
+        self.classroom_capacity = np.array([c.capacity for c in encoder.classrooms], dtype=np.int64)
+        self.classroom_is_lab = np.array([c.is_lab for c in encoder.classrooms], dtype=bool)
+        
+        # Weekly hour limits of every lecturer, one column per subject constraint
+        limits = [
+            [c.max_hours_per_week for c in lecturer.subject_constraints.values()]
+            for lecturer in encoder.lecturers
+        ]
+        width = max((len(row) for row in limits), default=0)
+        self.lecturer_limits = np.full((len(limits), max(width, 1)), np.inf)
+        for i, row in enumerate(limits):
+            self.lecturer_limits[i, :len(row)] = row
+    
+    def stack(self, population: List[EncodedSchedule]) -> np.ndarray:
+        """Stack chromosomes into one (individuals, rows, 4) array.
+        
+        Shorter chromosomes are padded with unscheduled rows.
+        """
+        rows = max((len(e.genes) for e in population), default=0)
+        genes = np.full((len(population), rows, 4), UNSCHEDULED, dtype=np.int32)
+        for i, encoded in enumerate(population):
+            genes[i, :len(encoded.genes)] = encoded.genes
+        return genes
+    
+    def evaluate(self, population: List[EncodedSchedule]) -> np.ndarray:
+        """Fitness of every chromosome of the population."""
+        if not population:
+            return np.zeros(0)
+        return self.evaluate_genes(self.stack(population))
+    
+    def evaluate_genes(self, genes: np.ndarray) -> np.ndarray:
+        """Fitness of every individual of a stacked (individuals, rows, 4) array."""
+        individuals, rows = genes.shape[:2]
+        group_count = max(len(self.encoder.groups), 1)
+        lecturer_count = max(len(self.encoder.lecturers), 1)
+        classroom_count = max(len(self.encoder.classrooms), 1)
+        time_grid = self.encoder.time_grid
+        
+        active = genes[..., SLOT] != UNSCHEDULED
+        classes = np.where(active, genes[..., CLASS], 0).astype(np.int64)
+        slots = np.where(active, genes[..., SLOT], 0).astype(np.int64)
+        lecturers = np.where(active, genes[..., LECTURER], 0).astype(np.int64)
+        classrooms = np.where(active, genes[..., CLASSROOM], 0).astype(np.int64)
+        groups = self.class_groups[classes]
+        
+        # Hard constraints: clashes within a slot and classroom capacity
+        overfull = active & (self.class_students[classes] > self.classroom_capacity[classrooms])
+        valid = ~(
+            _has_duplicates(slots * lecturer_count + lecturers, active) |
+            _has_duplicates(slots * group_count + groups, active) |
+            _has_duplicates(slots * classroom_count + classrooms, active) |
+            overfull.any(axis=1)
+        )
+        
+        individual = np.broadcast_to(np.arange(individuals, dtype=np.int64)[:, None], (individuals, rows))[active]
+        groups = groups[active]
+        lecturers = lecturers[active]
+        slots = slots[active]
+        days = slots // time_grid.periods_per_day
+        periods = slots % time_grid.periods_per_day
+        penalty = np.zeros(individuals)
+        
+        # Entries per (individual, group) and (individual, lecturer) weigh
+        # every violation in legacy scoring
+        group_keys = individual * group_count + groups
+        lecturer_keys = individual * lecturer_count + lecturers
+        if self.legacy_scoring:
+            unique_group_keys, group_entries = _reduce_by_key(group_keys)
+            group_weight = group_entries[np.searchsorted(unique_group_keys, group_keys)]
+        else:
+            group_weight = np.ones(len(group_keys), dtype=np.int64)
+        
+        # Lecturer weekly hours
+        unique_keys, counts = _reduce_by_key(lecturer_keys)
+        lecturer_ids = unique_keys % lecturer_count
+        exceeded = (self.lecturer_limits[lecturer_ids] < (counts * time_grid.slot_hours)[:, None]).sum(axis=1)
+        weight = counts if self.legacy_scoring else 1
+        np.add.at(penalty, unique_keys // lecturer_count, 0.5 * exceeded * weight)
+        
+        # Daily load and gaps per (individual, group, day)
+        day_keys = group_keys * time_grid.days + days
+        unique_keys, counts, first, last, key_weight, _ = _reduce_by_key(day_keys, periods, group_weight)
+        overloaded = counts * time_grid.slot_hours > time_grid.max_daily_hours
+        gaps = last - first + 1 - counts
+        np.add.at(penalty, unique_keys // time_grid.days // group_count, (0.3 * overloaded + 0.2 * gaps) * key_weight)
+        
+        # Subject distribution per (individual, group, subject)
+        subject_keys = group_keys * self.subject_count + self.class_subjects[classes[active]]
+        unique_keys, counts, first_day, last_day, key_weight, _ = _reduce_by_key(subject_keys, days, group_weight)
+        same_day = (counts > 1) & (first_day == last_day)
+        np.add.at(penalty, unique_keys // self.subject_count // group_count, 0.3 * same_day * key_weight)
+        
+        # Practical classes outside labs
+        unsuitable = (
+            ~self.class_is_lecture[classes] & self.class_requires_subgroups[classes] &
+            ~self.classroom_is_lab[classrooms] & active
+        )
+        penalty += 0.4 * unsuitable.sum(axis=1)
+        
+        return np.where(valid, np.maximum(0.0, 100.0 - penalty), 0.0)
\ No newline at end of file
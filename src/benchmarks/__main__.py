@@ -0,0 +1,119 @@
+import argparse
+import sys
+from rich.console import Console
+from rich.table import Table
+from .instances import INSTANCE_SIZES, DEFAULT_SIZES
+from .suite import BENCHMARKS, Measurement, run_suite, save_results, load_results, compare_results
+
+console = Console()
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the scheduler on generated instances of growing size"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    run = commands.add_parser("run", help="Run the benchmarks and save the results as JSON")
+    run.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(INSTANCE_SIZES),
+        default=list(DEFAULT_SIZES),
+        help=f"Instance sizes to run (default: {' '.join(DEFAULT_SIZES)})"
+    )
+    run.add_argument(
+        "--benchmarks",
+        nargs="+",
+        choices=list(BENCHMARKS),
+        default=list(BENCHMARKS),
+        help="Benchmarks to run (default: all)"
+    )
+    run.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    run.add_argument("--seed", type=int, default=42, help="Seed of the instances and schedulers (default: 42)")
+    run.add_argument("--population", type=int, default=10, help="Population size (default: 10)")
+    run.add_argument("--generations", type=int, default=5, help="Generations of the evolve benchmark (default: 5)")
+    run.add_argument(
+        "--output",
+        type=str,
+        default="benchmark_results.json",
+        help="JSON file to write (default: benchmark_results.json)"
+    )
+    
+    compare = commands.add_parser("compare", help="Compare results against a baseline and flag regressions")
+    compare.add_argument("baseline", help="Baseline results JSON")
+    compare.add_argument("current", help="Current results JSON")
+    compare.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative slowdown before flagging a regression (default: 0.2)"
+    )
+    compare.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative growth of peak memory before flagging a regression (default: 0.2)"
+    )
+    
+    return parser.parse_args()
+
+def run(args) -> int:
+    def progress(measurement: Measurement):
+        result = measurement.to_dict()
+        console.print(
+            f"{result['size']:>8} {result['benchmark']:<28} "
+            f"{result['seconds_min'] * 1000:10.2f} ms  {result['peak_memory_bytes'] / 2**20:8.2f} MiB"
+        )
+    
+    results = run_suite(
+        sizes=args.sizes,
+        benchmarks=args.benchmarks,
+        repeat=args.repeat,
+        seed=args.seed,
+        population_size=args.population,
+        generations=args.generations,
+        progress=progress
+    )
+    save_results(results, args.output)
+    console.print(f"[green]Results saved to {args.output}[/]")
+    return 0
+
+def compare(args) -> int:
+    try:
+        baseline = load_results(args.baseline)
+        current = load_results(args.current)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error loading results: {str(e)}[/]")
+        return 2
+    
+    comparisons = compare_results(baseline, current, args.time_tolerance, args.memory_tolerance)
+    table = Table(title="Benchmark comparison", show_header=True, header_style="bold magenta")
+    table.add_column("Size")
+    table.add_column("Benchmark")
+    table.add_column("Metric")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Ratio", justify="right")
+    for c in comparisons:
+        style = "red" if c.regressed else ("green" if c.ratio < 1 else None)
+        table.add_row(
+            c.size, c.benchmark, c.metric,
+            f"{c.baseline:.6g}", f"{c.current:.6g}", f"{c.ratio:.2f}",
+            style=style
+        )
+    console.print(table)
+    
+    regressions = [c for c in comparisons if c.regressed]
+    if regressions:
+        console.print(f"[red]{len(regressions)} regression(s) found[/]")
+        return 1
+    console.print("[green]No regressions[/]")
+    return 0
+
+def main() -> int:
+    args = parse_args()
+    return run(args) if args.command == "run" else compare(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from generators.data_generator import DataGenerator
+from models.subject import Subject
+from models.lecturer import Lecturer
+from models.group import Group
+from models.classroom import Classroom
+from models.time_grid import TimeGrid
+
+@dataclass(frozen=True)
+class InstanceSize:
+    """Parameters of a generated benchmark instance."""
+    subjects: int
+    lecturers: int
+    groups: int
+    classrooms: int
+    hours_range: Tuple[int, int] = (2, 6)
+    group_size_range: Tuple[int, int] = (20, 35)
+    capacity_range: Tuple[int, int] = (25, 60)
+    days: int = 5
+    periods_per_day: int = 4
+
+# Small and medium match generate_mock_data; larger instances keep few
+# subjects per group and get a longer week, so they stay mostly schedulable
+INSTANCE_SIZES: Dict[str, InstanceSize] = {
+    "small": InstanceSize(5, 3, 2, 4, hours_range=(2, 4), group_size_range=(15, 25), capacity_range=(20, 40)),
+    "medium": InstanceSize(10, 6, 4, 8),
+    "large": InstanceSize(12, 40, 100, 60, hours_range=(2, 3), capacity_range=(25, 80), periods_per_day=6),
+    "xlarge": InstanceSize(12, 150, 1000, 300, hours_range=(2, 3), capacity_range=(25, 80), periods_per_day=8),
+    "xxlarge": InstanceSize(12, 300, 3000, 600, hours_range=(2, 3), capacity_range=(25, 80),
+                            days=6, periods_per_day=8)
+}
+
+DEFAULT_SIZES = ("small", "medium", "large")
+
+@dataclass
+class Instance:
+    """A generated scheduling problem."""
+    name: str
+    subjects: List[Subject]
+    lecturers: List[Lecturer]
+    groups: List[Group]
+    classrooms: List[Classroom]
+    time_grid: TimeGrid
+
+def build_instance(name: str, seed: int = 42) -> Instance:
+    """Generate the benchmark instance of a given size."""
+    size = INSTANCE_SIZES[name]
+    generator = DataGenerator(seed=seed)
+    subjects = generator.generate_subjects(count=size.subjects, hours_range=size.hours_range)
+    lecturers = generator.generate_lecturers(count=size.lecturers, subjects=subjects)
+    groups = generator.generate_groups(count=size.groups, subjects=subjects, size_range=size.group_size_range)
+    classrooms = generator.generate_classrooms(count=size.classrooms, capacity_range=size.capacity_range)
+    return Instance(
+        name=name,
+        subjects=subjects,
+        lecturers=lecturers,
+        groups=groups,
+        classrooms=classrooms,
+        time_grid=TimeGrid(days=size.days, periods_per_day=size.periods_per_day)
+    )
\ No newline at end of file
@@ -0,0 +1,217 @@
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from algorithms.constraints import ScheduleConstraints
+from algorithms.genetic import GeneticScheduler
+from models.schedule import Schedule
+from .instances import Instance, build_instance
+
+RESULTS_VERSION = 1
+
+class BenchmarkContext:
+    """An instance with a seeded scheduler and, once needed, a population."""
+    
+    def __init__(self, instance: Instance, seed: int, population_size: int, generations: int):
+        self.instance = instance
+        self.seed = seed
+        self.population_size = population_size
+        self.generations = generations
+        self.scheduler = self.new_scheduler()
+        self._population: Optional[List[Schedule]] = None
+    
+    def new_scheduler(self) -> GeneticScheduler:
+        return GeneticScheduler(
+            self.instance.subjects,
+            self.instance.lecturers,
+            self.instance.groups,
+            self.instance.classrooms,
+            population_size=self.population_size,
+            elite_size=max(1, self.population_size // 10),
+            tournament_size=min(3, self.population_size),
+            seed=self.seed,
+            time_grid=self.instance.time_grid
+        )
+    
+    @property
+    def population(self) -> List[Schedule]:
+        """Initial population, built once and shared by the benchmarks."""
+        if self._population is None:
+            self._population = self.new_scheduler().generate_initial_population()
+        return self._population
+
+# A benchmark prepares its state untimed and returns the call to time
+Benchmark = Callable[[BenchmarkContext], Tuple[Callable[[], None], Callable[[], Any]]]
+
+def _reseeded(context: BenchmarkContext, run: Callable[[], Any]) -> Tuple[Callable[[], None], Callable[[], Any]]:
+    """Time ``run`` with the scheduler's random generator reseeded before each call."""
+    return lambda: context.scheduler.rng.seed(context.seed), run
+
+def _initial_population(context: BenchmarkContext):
+    return _reseeded(context, context.scheduler.generate_initial_population)
+
+def _quality_score(context: BenchmarkContext):
+    schedule = context.population[0]
+    # Drop cached validity so every call scores from scratch
+    return schedule.clear_caches, lambda: ScheduleConstraints.calculate_quality_score(
+        schedule, context.instance.time_grid
+    )
+
+def _validate(context: BenchmarkContext):
+    schedule = context.population[0]
+    return schedule.clear_caches, schedule.validate_hard_constraints
+
+def _crossover(context: BenchmarkContext):
+    parent1, parent2 = context.population[0], context.population[-1]
+    return _reseeded(context, lambda: context.scheduler._crossover(parent1, parent2))
+
+def _mutate(context: BenchmarkContext):
+    schedule = context.population[0]
+    return _reseeded(context, lambda: context.scheduler._mutate(schedule))
+
+def _evolve(context: BenchmarkContext):
+    state = {}
+    
+    def prepare():
+        # A fresh scheduler, so no fitness is cached from the previous run
+        state["scheduler"] = context.new_scheduler()
+        state["population"] = [schedule.copy() for schedule in context.population]
+    
+    return prepare, lambda: state["scheduler"].evolve(state["population"], generations=context.generations)
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "generate_initial_population": _initial_population,
+    "calculate_quality_score": _quality_score,
+    "validate_hard_constraints": _validate,
+    "crossover": _crossover,
+    "mutate": _mutate,
+    "evolve": _evolve
+}
+
+@dataclass
+class Measurement:
+    """Timings and peak memory of one benchmark on one instance size."""
+    benchmark: str
+    size: str
+    seconds: List[float] = field(default_factory=list)
+    peak_memory_bytes: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "benchmark": self.benchmark,
+            "size": self.size,
+            "repeat": len(self.seconds),
+            "seconds_min": min(self.seconds),
+            "seconds_median": statistics.median(self.seconds),
+            "seconds_max": max(self.seconds),
+            "peak_memory_bytes": self.peak_memory_bytes
+        }
+
+def measure(context: BenchmarkContext, name: str, repeat: int) -> Measurement:
+    """Time a benchmark ``repeat`` times, then trace its peak memory in one more run.
+    
+    Memory is traced separately because tracing slows the code down.
+    """
+    prepare, run = BENCHMARKS[name](context)
+    measurement = Measurement(benchmark=name, size=context.instance.name)
+    for _ in range(repeat):
+        prepare()
+        start = time.perf_counter()
+        run()
+        measurement.seconds.append(time.perf_counter() - start)
+    
+    prepare()
+    tracemalloc.start()
+    try:
+        run()
+        measurement.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return measurement
+
+def run_suite(sizes: List[str],
+              benchmarks: List[str],
+              repeat: int = 5,
+              seed: int = 42,
+              population_size: int = 10,
+              generations: int = 5,
+              progress: Optional[Callable[[Measurement], None]] = None) -> Dict[str, Any]:
+    """Run benchmarks on instance sizes and return the results document."""
+    results = []
+    for size in sizes:
+        context = BenchmarkContext(build_instance(size, seed), seed, population_size, generations)
+        for name in benchmarks:
+            # Long runs are timed fewer times
+            measurement = measure(context, name, 1 if name == "evolve" else repeat)
+            results.append(measurement.to_dict())
+            if progress:
+                progress(measurement)
+    
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "population_size": population_size,
+        "generations": generations,
+        "results": results
+    }
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version {results.get('version')!r} in {path}")
+    return results
+
+@dataclass
+class Comparison:
+    """A metric of one benchmark in a baseline and a current run."""
+    benchmark: str
+    size: str
+    metric: str
+    baseline: float
+    current: float
+    regressed: bool
+    
+    @property
+    def ratio(self) -> float:
+        if not self.baseline:
+            return 1.0 if not self.current else float("inf")
+        return self.current / self.baseline
+
+def compare_results(baseline: Dict[str, Any],
+                    current: Dict[str, Any],
+                    time_tolerance: float = 0.2,
+                    memory_tolerance: float = 0.2) -> List[Comparison]:
+    """Compare the benchmarks found in both runs.
+    
+    Times are compared by their minimum, the least noisy statistic. A metric
+    regresses when it grows by more than its tolerance, a fraction of the
+    baseline value.
+    """
+    baseline_results = {(r["benchmark"], r["size"]): r for r in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        base = baseline_results.get((result["benchmark"], result["size"]))
+        if base is None:
+            continue
+        for metric, tolerance in (("seconds_min", time_tolerance), ("peak_memory_bytes", memory_tolerance)):
+            comparisons.append(Comparison(
+                benchmark=result["benchmark"],
+                size=result["size"],
+                metric=metric,
+                baseline=base[metric],
+                current=result[metric],
+                regressed=result[metric] > base[metric] * (1 + tolerance)
+            ))
+    return comparisons
\ No newline at end of file
@@ -1,5 +1,5 @@
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from models.subject import Subject
 from models.lecturer import Lecturer, LecturerConstraints
 from models.group import Group
@@ -8,17 +8,16 @@ from models.classroom import Classroom
 class DataGenerator:
     """Generates random test data for the scheduling system."""
     
-    def __init__(self, seed: int = None):
-        """Initialize the generator with an optional seed."""
-        if seed is not None:
-            random.seed(seed)
+    def __init__(self, seed: int = None, rng: Optional[random.Random] = None):
+        """Initialize the generator with an optional seed or random generator."""
+        self.rng = rng if rng is not None else random.Random(seed)
     
     def generate_subjects(self, count: int, hours_range: Tuple[int, int] = (2, 6)) -> List[Subject]:
         """Generate a list of random subjects."""
         subjects = []
         for i in range(count):
-            total_hours = random.randint(*hours_range)
-            lecture_hours = random.randint(1, total_hours)
+            total_hours = self.rng.randint(*hours_range)
+            lecture_hours = self.rng.randint(1, total_hours)
             practical_hours = total_hours - lecture_hours
             
             subject = Subject(
@@ -26,7 +25,7 @@ class DataGenerator:
                 name=f"Subject {i+1}",
                 lecture_hours=lecture_hours,
                 practical_hours=practical_hours,
-                requires_subgroups=random.random() < 0.3
+                requires_subgroups=self.rng.random() < 0.3
             )
             subjects.append(subject)
         return subjects
@@ -41,12 +40,12 @@ class DataGenerator:
             )
             
             # Randomly assign subjects to lecturer
-            subject_count = random.randint(1, len(subjects))
-            for subject in random.sample(subjects, subject_count):
+            subject_count = self.rng.randint(1, len(subjects))
+            for subject in self.rng.sample(subjects, subject_count):
                 constraints = LecturerConstraints(
-                    can_lecture=random.random() < 0.7,
-                    can_practice=random.random() < 0.8,
-                    max_hours_per_week=random.randint(10, 25)
+                    can_lecture=self.rng.random() < 0.7,
+                    can_practice=self.rng.random() < 0.8,
+                    max_hours_per_week=self.rng.randint(10, 25)
                 )
                 lecturer.add_subject_constraint(subject.subject_id, constraints)
             
@@ -58,7 +57,7 @@ class DataGenerator:
         """Generate a list of random groups."""
         groups = []
         for i in range(count):
-            student_count = random.randint(*size_range)
+            student_count = self.rng.randint(*size_range)
             group = Group(
                 group_id=f"GRP{i+1:03d}",
                 name=f"Group {i+1}",
@@ -66,13 +65,13 @@ class DataGenerator:
             )
             
             # Randomly assign subjects to group
-            subject_count = random.randint(len(subjects) // 2, len(subjects))
-            for subject in random.sample(subjects, subject_count):
+            subject_count = self.rng.randint(len(subjects) // 2, len(subjects))
+            for subject in self.rng.sample(subjects, subject_count):
                 group.add_subject(subject)
             
             # Create subgroups for some groups
-            if random.random() < 0.5:
-                group.create_subgroups(random.randint(2, 3))
+            if self.rng.random() < 0.5:
+                group.create_subgroups(self.rng.randint(2, 3))
             
             groups.append(group)
         return groups
@@ -87,10 +86,10 @@ class DataGenerator:
             classroom = Classroom(
                 classroom_id=f"ROOM{i+1:03d}",
                 name=f"Room {i+1}",
-                capacity=random.randint(*capacity_range),
-                is_lab=random.random() < 0.3,
-                building=random.choice(buildings),
-                floor=random.randint(1, 5)
+                capacity=self.rng.randint(*capacity_range),
+                is_lab=self.rng.random() < 0.3,
+                building=self.rng.choice(buildings),
+                floor=self.rng.randint(1, 5)
             )
             classrooms.append(classroom)
         return classrooms 
\ No newline at end of file
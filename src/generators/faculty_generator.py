@@ -0,0 +1,311 @@
+import argparse
+import csv
+import math
+import random
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from models.subject import Subject
+from models.lecturer import Lecturer, LecturerConstraints
+from models.group import Group
+from models.classroom import Classroom
+from models.time_grid import TimeGrid, DEFAULT_TIME_GRID
+
+@dataclass(frozen=True)
+class FacultyProfile:
+    """Shape of a generated faculty structure.
+    
+    Every faculty runs several programmes over ``years`` years. Each year of
+    a programme is a cohort of one or more groups following the same
+    curriculum: the faculty's common subjects for that year plus the
+    programme's own. Ranges are inclusive.
+    """
+    faculties: int = 4
+    programmes_per_faculty: Tuple[int, int] = (2, 4)
+    years: int = 3
+    groups_per_cohort: Tuple[int, int] = (1, 4)
+    common_subjects_per_year: int = 2
+    programme_subjects_per_year: Tuple[int, int] = (2, 4)
+    hours_range: Tuple[int, int] = (2, 3)
+    group_size_range: Tuple[int, int] = (18, 32)
+    lab_subject_share: float = 0.3  # subjects whose lectures need a lab and whose groups split
+    subjects_per_lecturer: Tuple[int, int] = (2, 4)
+    lecturer_hours_range: Tuple[int, int] = (12, 20)
+    practice_only_share: float = 0.2  # lecturers who only teach practicals
+    lecturer_coverage: float = 1.25  # teaching capacity per hour of demand
+    room_utilisation: float = 0.75  # share of a room's slots that demand may fill
+    
+    @property
+    def expected_groups_per_faculty(self) -> float:
+        return sum(self.programmes_per_faculty) / 2 * self.years * sum(self.groups_per_cohort) / 2
+    
+    @classmethod
+    def for_groups(cls, groups: int, **options) -> "FacultyProfile":
+        """Profile with enough faculties for about ``groups`` groups."""
+        profile = cls(**options)
+        faculties = max(1, round(groups / profile.expected_groups_per_faculty))
+        return cls(faculties=faculties, **options)
+
+@dataclass
+class Faculty:
+    """Subjects, groups and lecturers of one generated faculty."""
+    subjects: List[Subject]
+    groups: List[Group]
+    lecturers: List[Lecturer]
+
+class FacultyGenerator:
+    """Generates instances structured like a real university.
+    
+    Unlike DataGenerator, groups share curricula with their cohort, lecturers
+    teach a few subjects of their own faculty, and the classrooms are sized
+    to the teaching demand of the groups on the given time grid.
+    
+    Faculties are generated one at a time, so ``write_csv`` only holds one
+    faculty in memory and scales to tens of thousands of groups.
+    """
+    
+    def __init__(self,
+                 profile: Optional[FacultyProfile] = None,
+                 seed: int = None,
+                 rng: Optional[random.Random] = None,
+                 time_grid: TimeGrid = DEFAULT_TIME_GRID):
+        """Initialize the generator with an optional seed or random generator."""
+        self.profile = profile or FacultyProfile()
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.time_grid = time_grid
+    
+    def _subject(self, subject_id: str, name: str) -> Subject:
+        total_hours = self.rng.randint(*self.profile.hours_range)
+        lecture_hours = self.rng.randint(1, total_hours)
+        return Subject(
+            subject_id=subject_id,
+            name=name,
+            lecture_hours=lecture_hours,
+            practical_hours=total_hours - lecture_hours,
+            requires_subgroups=self.rng.random() < self.profile.lab_subject_share
+        )
+    
+    def _faculty(self, index: int) -> Faculty:
+        """Generate the subjects, groups and lecturers of a faculty."""
+        profile = self.profile
+        prefix = f"F{index + 1:02d}"
+        subjects: List[Subject] = []
+        groups: List[Group] = []
+        
+        # Subjects shared by all programmes of the faculty, per year
+        common: List[List[Subject]] = []
+        for year in range(1, profile.years + 1):
+            common.append([
+                self._subject(f"{prefix}Y{year}C{i + 1}", f"Faculty {index + 1} Year {year} Core {i + 1}")
+                for i in range(profile.common_subjects_per_year)
+            ])
+            subjects.extend(common[-1])
+        
+        # Related subjects, a lecturer's specialisation is drawn from one of these
+        areas: List[List[Subject]] = [list(s) for s in common]
+        for programme in range(1, self.rng.randint(*profile.programmes_per_faculty) + 1):
+            programme_subjects: List[Subject] = []
+            for year in range(1, profile.years + 1):
+                curriculum = [
+                    self._subject(
+                        f"{prefix}P{programme}Y{year}S{i + 1}",
+                        f"Faculty {index + 1} Programme {programme} Year {year} Subject {i + 1}"
+                    )
+                    for i in range(self.rng.randint(*profile.programme_subjects_per_year))
+                ]
+                subjects.extend(curriculum)
+                programme_subjects.extend(curriculum)
+                
+                for g in range(self.rng.randint(*profile.groups_per_cohort)):
+                    group = Group(
+                        group_id=f"{prefix}P{programme}Y{year}G{g + 1}",
+                        name=f"Faculty {index + 1} Programme {programme} Year {year} Group {chr(ord('A') + g % 26)}",
+                        student_count=self.rng.randint(*profile.group_size_range)
+                    )
+                    for subject in common[year - 1] + curriculum:
+                        group.add_subject(subject)
+                    if any(subject.requires_subgroups for subject in group.subjects.values()):
+                        group.create_subgroups(2 if group.student_count < 25 else 3)
+                    groups.append(group)
+            areas.append(programme_subjects)
+        
+        return Faculty(subjects, groups, self._lecturers(prefix, groups, areas))
+    
+    def _lecturers(self, prefix: str, groups: List[Group], areas: List[List[Subject]]) -> List[Lecturer]:
+        """Hire lecturers until the teaching demand of the groups is covered.
+        
+        Each lecturer specialises in a few subjects of one area, starting with
+        the lectures or practicals that still lack the most teaching hours.
+        Some of those hired for practicals teach no lectures.
+        """
+        profile = self.profile
+        demand: Dict[Tuple[str, bool], float] = Counter()
+        for group in groups:
+            for subject in group.subjects.values():
+                demand[(subject.subject_id, True)] += subject.lecture_hours * self.time_grid.slot_hours
+                demand[(subject.subject_id, False)] += subject.practical_hours * self.time_grid.slot_hours
+        missing = {key: hours * profile.lecturer_coverage for key, hours in demand.items() if hours}
+        area_of = {subject.subject_id: area for area in areas for subject in area}
+        
+        lecturers: List[Lecturer] = []
+        while missing:
+            (subject_id, is_lecture), _ = max(missing.items(), key=lambda item: item[1])
+            area = area_of[subject_id]
+            count = min(len(area), self.rng.randint(*profile.subjects_per_lecturer))
+            others = [s.subject_id for s in area if s.subject_id != subject_id]
+            specialisation = [subject_id] + self.rng.sample(others, count - 1)
+            
+            practice_only = not is_lecture and self.rng.random() < profile.practice_only_share
+            hours = self.rng.randint(*profile.lecturer_hours_range)
+            lecturer = Lecturer(lecturer_id=f"{prefix}L{len(lecturers) + 1:04d}",
+                                name=f"Lecturer {prefix}-{len(lecturers) + 1}")
+            for sid in specialisation:
+                lecturer.add_subject_constraint(sid, LecturerConstraints(
+                    can_lecture=not practice_only,
+                    can_practice=True,
+                    max_hours_per_week=hours
+                ))
+            
+            # Spend the lecturer's hours on the demand they can teach
+            capacity = float(hours)
+            for key in [(subject_id, is_lecture)] + [(sid, kind) for sid in specialisation for kind in (True, False)]:
+                if key in missing and lecturer.can_teach_subject(*key) and capacity > 0:
+                    taken = min(missing[key], capacity)
+                    capacity -= taken
+                    missing[key] -= taken
+                    if missing[key] <= 1e-9:
+                        del missing[key]
+            lecturers.append(lecturer)
+        return lecturers
+    
+    def faculties(self) -> Iterator[Faculty]:
+        """Generate the faculties one by one."""
+        for index in range(self.profile.faculties):
+            yield self._faculty(index)
+    
+    def classrooms(self, room_demand: Dict[Tuple[bool, int], int]) -> List[Classroom]:
+        """Classrooms for a demand of class slots per (requires_lab, capacity).
+        
+        Each capacity tier gets enough rooms to hold its classes at the
+        profile's room utilisation; lab tiers get labs.
+        """
+        slots = self.time_grid.slot_count * self.profile.room_utilisation
+        classrooms: List[Classroom] = []
+        buildings = max(1, self.profile.faculties)
+        for (is_lab, capacity), classes in sorted(room_demand.items()):
+            for _ in range(math.ceil(classes / slots)):
+                number = len(classrooms) + 1
+                classrooms.append(Classroom(
+                    classroom_id=f"{'LAB' if is_lab else 'ROOM'}{number:05d}",
+                    name=f"{'Lab' if is_lab else 'Room'} {number}",
+                    capacity=capacity,
+                    is_lab=is_lab,
+                    building=f"Building {number % buildings + 1}",
+                    floor=self.rng.randint(1, 5)
+                ))
+        return classrooms
+    
+    @staticmethod
+    def add_room_demand(room_demand: Dict[Tuple[bool, int], int], groups: List[Group]) -> None:
+        """Count the class slots of groups per (requires_lab, capacity rounded up to 10)."""
+        for group in groups:
+            capacity = -(-group.student_count // 10) * 10
+            for subject in group.subjects.values():
+                lab_lectures = subject.lecture_hours if subject.requires_subgroups else 0
+                room_demand[(True, capacity)] += lab_lectures
+                room_demand[(False, capacity)] += subject.lecture_hours + subject.practical_hours - lab_lectures
+    
+    def generate(self) -> Tuple[List[Subject], List[Lecturer], List[Group], List[Classroom]]:
+        """Generate a whole instance in memory."""
+        subjects: List[Subject] = []
+        lecturers: List[Lecturer] = []
+        groups: List[Group] = []
+        room_demand: Dict[Tuple[bool, int], int] = Counter()
+        for faculty in self.faculties():
+            subjects.extend(faculty.subjects)
+            lecturers.extend(faculty.lecturers)
+            groups.extend(faculty.groups)
+            self.add_room_demand(room_demand, faculty.groups)
+        return subjects, lecturers, groups, self.classrooms(room_demand)
+    
+    def write_csv(self, output_dir: str) -> Dict[str, int]:
+        """Stream an instance to the CSV files read by ``load_data_from_csv``.
+        
+        Returns the number of rows written to each file.
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        counts = Counter()
+        room_demand: Dict[Tuple[bool, int], int] = Counter()
+        
+        with open(output_path / "subjects.csv", "w", newline="") as subjects_file, \
+                open(output_path / "lecturers.csv", "w", newline="") as lecturers_file, \
+                open(output_path / "groups.csv", "w", newline="") as groups_file:
+            subjects_writer = csv.writer(subjects_file)
+            subjects_writer.writerow(["subject_id", "name", "lecture_hours", "practical_hours", "requires_subgroups"])
+            lecturers_writer = csv.writer(lecturers_file)
+            lecturers_writer.writerow(["lecturer_id", "name", "subjects", "can_lecture", "can_practice", "max_hours"])
+            groups_writer = csv.writer(groups_file)
+            groups_writer.writerow(["group_id", "name", "student_count", "subjects", "subgroups"])
+            
+            for faculty in self.faculties():
+                for subject in faculty.subjects:
+                    subjects_writer.writerow([
+                        subject.subject_id, subject.name, subject.lecture_hours,
+                        subject.practical_hours, _bool(subject.requires_subgroups)
+                    ])
+                for lecturer in faculty.lecturers:
+                    constraints = lecturer.subject_constraints
+                    lecturers_writer.writerow([
+                        lecturer.lecturer_id,
+                        lecturer.name,
+                        ";".join(constraints),
+                        ";".join(_bool(c.can_lecture) for c in constraints.values()),
+                        ";".join(_bool(c.can_practice) for c in constraints.values()),
+                        ";".join(str(c.max_hours_per_week) for c in constraints.values())
+                    ])
+                for group in faculty.groups:
+                    groups_writer.writerow([
+                        group.group_id, group.name, group.student_count,
+                        ";".join(group.subjects), len(group.subgroups) or ""
+                    ])
+                self.add_room_demand(room_demand, faculty.groups)
+                counts["subjects"] += len(faculty.subjects)
+                counts["lecturers"] += len(faculty.lecturers)
+                counts["groups"] += len(faculty.groups)
+        
+        with open(output_path / "classrooms.csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["classroom_id", "name", "capacity", "is_lab", "building", "floor"])
+            for classroom in self.classrooms(room_demand):
+                writer.writerow([
+                    classroom.classroom_id, classroom.name, classroom.capacity,
+                    _bool(classroom.is_lab), classroom.building, classroom.floor
+                ])
+                counts["classrooms"] += 1
+        return dict(counts)
+
+def _bool(value: bool) -> str:
+    return "true" if value else "false"
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a structured synthetic instance as CSV files")
+    parser.add_argument("output_dir", help="Directory to write the CSV files to")
+    parser.add_argument("--groups", type=int, default=10000, help="Approximate number of groups (default: 10000)")
+    parser.add_argument("--years", type=int, default=3, help="Years of study per programme (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--days", type=int, default=5, help="Teaching days per week (default: 5)")
+    parser.add_argument("--periods", type=int, default=4, help="Periods per day (default: 4)")
+    args = parser.parse_args()
+    
+    generator = FacultyGenerator(
+        profile=FacultyProfile.for_groups(args.groups, years=args.years),
+        seed=args.seed,
+        time_grid=TimeGrid(days=args.days, periods_per_day=args.periods)
+    )
+    counts = generator.write_csv(args.output_dir)
+    print(", ".join(f"{count} {name}" for name, count in counts.items()) + f" written to {args.output_dir}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
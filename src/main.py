@@ -2,11 +2,12 @@ from generators.data_generator import DataGenerator
 from algorithms.genetic import GeneticScheduler
 from algorithms.constraints import ScheduleConstraints
 from models.schedule import TimeSlot
+from models.time_grid import TimeGrid, DEFAULT_TIME_GRID
 
-def print_schedule(schedule):
+def print_schedule(schedule, time_grid: TimeGrid = DEFAULT_TIME_GRID):
     """Print a schedule in a readable format."""
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-    periods = ['1st Period', '2nd Period', '3rd Period', '4th Period']
+    days = time_grid.day_names
+    periods = time_grid.period_names
     
     print("\nGenerated Schedule:")
     print("=" * 80)
@@ -96,8 +97,8 @@ def main():
     
     print("\nGenerated Lecturers:")
     for lecturer in lecturers:
-        subjects = lecturer.get_teachable_subjects()
-        print(f"- {lecturer.name} can teach {len(subjects)} subjects")
+        teachable = lecturer.get_teachable_subjects()
+        print(f"- {lecturer.name} can teach {len(teachable)} subjects")
     
     print("\nGenerated Groups:")
     for group in groups:
@@ -1,5 +1,6 @@
+import hashlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Tuple, Union
 from .subject import Subject
 from .lecturer import Lecturer
 from .group import Group, Subgroup
@@ -8,15 +9,18 @@ from .classroom import Classroom
 @dataclass
 class TimeSlot:
     """Represents a time slot in the schedule."""
-    day: int  # 0-4 (Monday to Friday)
-    period: int  # 0-3 (four periods per day)
+    day: int  # 0-based day of the TimeGrid (0 is Monday)
+    period: int  # 0-based period of the day
     
     def __hash__(self):
         return hash((self.day, self.period))
 
-@dataclass
+@dataclass(frozen=True)
 class ScheduleEntry:
-    """Represents a single entry in the schedule."""
+    """Represents a single entry in the schedule.
+    
+    Entries are immutable so that copies of a schedule can share them.
+    """
     subject: Subject
     lecturer: Lecturer
     classroom: Classroom
@@ -26,76 +30,272 @@ class ScheduleEntry:
 
 @dataclass
 class Schedule:
-    """Represents a complete schedule."""
+    """Represents a complete schedule.
+    
+    Occupancy indexes (resource -> slots and slot -> resources) are kept up to
+    date by ``add_entry``, ``remove_entry`` and ``move_entry``, so ``entries``
+    must not be modified directly.
+    
+    ``copy`` shares entries, slot lists and index dicts between schedules;
+    each of them is copied the first time one of the schedules modifies it.
+    Views returned by the getters therefore follow later changes only until
+    the schedule is copied.
+    
+    The canonical hash, the hard constraint validity and the fitness are
+    cached until the schedule is modified.
+    """
     entries: Dict[TimeSlot, List[ScheduleEntry]] = field(default_factory=dict)
     
+    # resource -> {slot: number of entries using the resource in that slot}
+    _lecturer_slots: Dict[Lecturer, Dict[TimeSlot, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _group_slots: Dict[Group, Dict[TimeSlot, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _classroom_slots: Dict[Classroom, Dict[TimeSlot, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    
+    # slot -> {resource: number of entries using the resource in that slot}
+    _slot_lecturers: Dict[TimeSlot, Dict[Lecturer, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _slot_groups: Dict[TimeSlot, Dict[Group, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _slot_classrooms: Dict[TimeSlot, Dict[Classroom, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    
+    # Containers (slot lists, inner index dicts) this schedule may modify in
+    # place, by id; all other containers may be shared with copies
+    _owned: Dict[int, Union[list, dict]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    
+    # Cached canonical_hash(), validity and (scorer, fitness), cleared
+    # whenever the schedule changes
+    _hash: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _valid: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    _fitness: Optional[Tuple[Any, float]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        for slot, entries in self.entries.items():
+            for entry in entries:
+                self._index_entry(slot, entry, 1)
+    
+    def _writable(self, containers: Dict, key, factory: Callable):
+        """Get ``containers[key]`` for modification, copying it if it is shared."""
+        container = containers.get(key)
+        if container is None:
+            container = containers[key] = factory()
+        elif id(container) in self._owned:
+            return container
+        else:
+            container = containers[key] = factory(container)
+        self._owned[id(container)] = container
+        return container
+    
+    def _update_count(self, index: Dict, key, value, delta: int) -> None:
+        """Adjust the usage counter of ``value`` under ``key``."""
+        counts = self._writable(index, key, dict)
+        count = counts.get(value, 0) + delta
+        if count > 0:
+            counts[value] = count
+        else:
+            # Empty inner dicts are kept so that views handed out stay live
+            counts.pop(value, None)
+    
+    def _index_entry(self, time_slot: TimeSlot, entry: ScheduleEntry, delta: int) -> None:
+        """Add (delta=1) or remove (delta=-1) an entry from the occupancy indexes."""
+        self._update_count(self._lecturer_slots, entry.lecturer, time_slot, delta)
+        self._update_count(self._slot_lecturers, time_slot, entry.lecturer, delta)
+        self._update_count(self._classroom_slots, entry.classroom, time_slot, delta)
+        self._update_count(self._slot_classrooms, time_slot, entry.classroom, delta)
+        for group in entry.groups:
+            self._update_count(self._group_slots, group, time_slot, delta)
+            self._update_count(self._slot_groups, time_slot, group, delta)
+    
+    def _changed(self) -> None:
+        """Clear the cached state after a modification."""
+        self._hash = None
+        self._valid = None
+        self._fitness = None
+    
+    def _view(self, index: Dict, key) -> AbstractSet:
+        """Keys of ``index[key]``, creating a missing inner dict as owned.
+        
+        Owning it keeps the view live when the first entry is added.
+        """
+        counts = index.get(key)
+        if counts is None:
+            counts = self._writable(index, key, dict)
+        return counts.keys()
+    
+    def clear_caches(self) -> None:
+        """Forget the cached hash, validity and fitness, so they are computed again."""
+        self._changed()
+    
     def add_entry(self, time_slot: TimeSlot, entry: ScheduleEntry) -> None:
         """Add a schedule entry to a time slot."""
+        self._writable(self.entries, time_slot, list).append(entry)
+        self._index_entry(time_slot, entry, 1)
+        self._changed()
+    
+    def remove_entry(self, time_slot: TimeSlot, entry: ScheduleEntry) -> None:
+        """Remove a schedule entry from a time slot.
+        
+        Raises ValueError if the entry is not scheduled in that slot.
+        """
         if time_slot not in self.entries:
-            self.entries[time_slot] = []
-        self.entries[time_slot].append(entry)
+            raise ValueError(f"No entries scheduled in {time_slot}")
+        entries = self._writable(self.entries, time_slot, list)
+        entries.remove(entry)
+        if not entries:
+            del self.entries[time_slot]
+            del self._owned[id(entries)]
+        self._index_entry(time_slot, entry, -1)
+        self._changed()
     
-    def get_lecturer_slots(self, lecturer: Lecturer) -> Set[TimeSlot]:
-        """Get all time slots where a lecturer is teaching."""
-        slots = set()
-        for slot, entries in self.entries.items():
-            if any(entry.lecturer == lecturer for entry in entries):
-                slots.add(slot)
-        return slots
+    def move_entry(self, entry: ScheduleEntry, old_slot: TimeSlot, new_slot: TimeSlot) -> None:
+        """Move a schedule entry from one time slot to another."""
+        self.remove_entry(old_slot, entry)
+        self.add_entry(new_slot, entry)
     
-    def get_group_slots(self, group: Group) -> Set[TimeSlot]:
-        """Get all time slots where a group has classes."""
-        slots = set()
-        for slot, entries in self.entries.items():
-            if any(group in entry.groups for entry in entries):
-                slots.add(slot)
-        return slots
+    def copy(self) -> "Schedule":
+        """Copy the schedule, sharing its entries and unchanged containers."""
+        clone = Schedule()
+        clone.entries = dict(self.entries)
+        clone._lecturer_slots = dict(self._lecturer_slots)
+        clone._group_slots = dict(self._group_slots)
+        clone._classroom_slots = dict(self._classroom_slots)
+        clone._slot_lecturers = dict(self._slot_lecturers)
+        clone._slot_groups = dict(self._slot_groups)
+        clone._slot_classrooms = dict(self._slot_classrooms)
+        clone._hash = self._hash
+        clone._valid = self._valid
+        clone._fitness = self._fitness
+        
+        # All containers are shared from now on
+        self._owned.clear()
+        return clone
     
-    def get_classroom_slots(self, classroom: Classroom) -> Set[TimeSlot]:
-        """Get all time slots where a classroom is in use."""
-        slots = set()
-        for slot, entries in self.entries.items():
-            if any(entry.classroom == classroom for entry in entries):
-                slots.add(slot)
-        return slots
+    def canonical_hash(self) -> bytes:
+        """Hash of the schedule's content, independent of entry and slot order.
+        
+        Schedules with the same entries in the same slots have the same hash.
+        """
+        if self._hash is None:
+            content = sorted(
+                ((slot.day, slot.period), sorted(self._entry_key(entry) for entry in entries))
+                for slot, entries in self.entries.items()
+            )
+            self._hash = hashlib.blake2b(repr(content).encode(), digest_size=16).digest()
+        return self._hash
+    
+    def sorted_entries(self) -> List[Tuple[TimeSlot, ScheduleEntry]]:
+        """All (slot, entry) pairs, by slot and then by entry content.
+        
+        Unlike iterating ``entries``, the order does not depend on the order
+        the entries were added in, so it is the same for equal schedules.
+        """
+        return sorted(
+            ((slot, entry) for slot, entries in self.entries.items() for entry in entries),
+            key=lambda item: ((item[0].day, item[0].period), self._entry_key(item[1]))
+        )
+    
+    @property
+    def cached_validity(self) -> Optional[bool]:
+        """Result of the last hard constraint check, None if not checked since the last change."""
+        return self._valid
+    
+    def remember_validity(self, valid: bool) -> None:
+        """Cache the result of a hard constraint check."""
+        self._valid = valid
+    
+    def cached_fitness(self, scorer: Any) -> Optional[float]:
+        """Fitness last given by ``scorer``, None if not scored by it since the last change."""
+        if self._fitness is not None and self._fitness[0] is scorer:
+            return self._fitness[1]
+        return None
+    
+    def remember_fitness(self, scorer: Any, fitness: float) -> None:
+        """Cache the fitness given by ``scorer``."""
+        self._fitness = (scorer, fitness)
+    
+    @staticmethod
+    def _entry_key(entry: ScheduleEntry) -> tuple:
+        """Comparable key identifying an entry by the ids of its resources."""
+        return (
+            entry.subject.subject_id,
+            entry.lecturer.lecturer_id,
+            entry.classroom.classroom_id,
+            tuple(sorted(group.group_id for group in entry.groups)),
+            tuple(sorted(sg.subgroup_id for sg in entry.subgroups)) if entry.subgroups else (),
+            entry.is_lecture
+        )
+    
+    def get_lecturer_slots(self, lecturer: Lecturer) -> AbstractSet[TimeSlot]:
+        """Get all time slots where a lecturer is teaching (read-only view)."""
+        return self._view(self._lecturer_slots, lecturer)
+    
+    def get_group_slots(self, group: Group) -> AbstractSet[TimeSlot]:
+        """Get all time slots where a group has classes (read-only view)."""
+        return self._view(self._group_slots, group)
+    
+    def get_classroom_slots(self, classroom: Classroom) -> AbstractSet[TimeSlot]:
+        """Get all time slots where a classroom is in use (read-only view)."""
+        return self._view(self._classroom_slots, classroom)
+    
+    def get_slot_lecturers(self, time_slot: TimeSlot) -> AbstractSet[Lecturer]:
+        """Get all lecturers teaching in a time slot (read-only view)."""
+        return self._view(self._slot_lecturers, time_slot)
+    
+    def get_slot_groups(self, time_slot: TimeSlot) -> AbstractSet[Group]:
+        """Get all groups having classes in a time slot (read-only view)."""
+        return self._view(self._slot_groups, time_slot)
+    
+    def get_slot_classrooms(self, time_slot: TimeSlot) -> AbstractSet[Classroom]:
+        """Get all classrooms in use in a time slot (read-only view)."""
+        return self._view(self._slot_classrooms, time_slot)
     
     def validate_hard_constraints(self) -> bool:
         """Validate that all hard constraints are met."""
+        if self._valid is not None:
+            return self._valid
+        
         # Check each time slot
-        for slot, entries in self.entries.items():
-            # Track resources in use for this slot
-            lecturers_in_use = set()
-            groups_in_use = set()
-            classrooms_in_use = set()
+        self._valid = all(self._entries_valid(entries) for entries in self.entries.values())
+        return self._valid
+    
+    def validate_slot(self, time_slot: TimeSlot) -> bool:
+        """Validate that hard constraints are met within a single time slot."""
+        return self._entries_valid(self.entries.get(time_slot, []))
+    
+    @staticmethod
+    def _entries_valid(entries: List[ScheduleEntry]) -> bool:
+        """Validate hard constraints for the entries of one time slot."""
+        # Track resources in use for this slot
+        lecturers_in_use = set()
+        groups_in_use = set()
+        classrooms_in_use = set()
+        
+        for entry in entries:
+            # Check lecturer conflicts
+            if entry.lecturer in lecturers_in_use:
+                return False
+            lecturers_in_use.add(entry.lecturer)
             
-            for entry in entries:
-                # Check lecturer conflicts
-                if entry.lecturer in lecturers_in_use:
-                    return False
-                lecturers_in_use.add(entry.lecturer)
-                
-                # Check group conflicts
-                for group in entry.groups:
-                    if group in groups_in_use:
-                        return False
-                    groups_in_use.add(group)
-                
-                # Check classroom conflicts
-                if entry.classroom in classrooms_in_use:
-                    # Only allow sharing if it's the same lecturer and subject
-                    sharing_allowed = any(
-                        e.lecturer == entry.lecturer and 
-                        e.subject == entry.subject and
-                        e.is_lecture
-                        for e in entries if e.classroom == entry.classroom
-                    )
-                    if not sharing_allowed:
-                        return False
-                classrooms_in_use.add(entry.classroom)
-                
-                # Check classroom capacity
-                total_students = sum(g.student_count for g in entry.groups)
-                if not entry.classroom.can_accommodate(total_students):
+            # Check group conflicts
+            for group in entry.groups:
+                if group in groups_in_use:
                     return False
+                groups_in_use.add(group)
+            
+            # Check classroom conflicts. A lecture shared by several groups is
+            # one entry; two entries never share a classroom, whatever their
+            # order in the slot
+            if entry.classroom in classrooms_in_use:
+                return False
+            classrooms_in_use.add(entry.classroom)
+            
+            # Check classroom capacity
+            total_students = sum(g.student_count for g in entry.groups)
+            if not entry.classroom.can_accommodate(total_students):
+                return False
         
         return True 
\ No newline at end of file
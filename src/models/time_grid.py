@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Tuple
+from .schedule import TimeSlot
+
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+def _ordinal(n: int) -> str:
+    """English ordinal of a positive number (1st, 2nd, 11th...)."""
+    if 10 <= n % 100 <= 20:
+        suffix = 'th'
+    else:
+        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
+@dataclass(frozen=True)
+class TimeGrid:
+    """Represents the weekly grid of time slots.
+    
+    Slots are addressed by dense integer indices, day by day:
+    ``index = day * periods_per_day + period``.
+    """
+    
+    days: int = 5
+    periods_per_day: int = 4
+    slot_hours: float = 1.5
+    max_daily_hours: float = 6.0
+    
+    @property
+    def slot_count(self) -> int:
+        """Number of slots in a week."""
+        return self.days * self.periods_per_day
+    
+    @cached_property
+    def slots(self) -> Tuple[TimeSlot, ...]:
+        """All time slots, in index order."""
+        return tuple(
+            TimeSlot(day=day, period=period)
+            for day in range(self.days)
+            for period in range(self.periods_per_day)
+        )
+    
+    def slot_index(self, slot: TimeSlot) -> int:
+        """Dense integer index of a time slot."""
+        return slot.day * self.periods_per_day + slot.period
+    
+    def slot_at(self, index: int) -> TimeSlot:
+        """Time slot of a dense integer index."""
+        return TimeSlot(day=index // self.periods_per_day, period=index % self.periods_per_day)
+    
+    @property
+    def day_names(self) -> List[str]:
+        """Display names of the days."""
+        return [DAY_NAMES[day] if day < len(DAY_NAMES) else f"Day {day + 1}" for day in range(self.days)]
+    
+    @property
+    def period_names(self) -> List[str]:
+        """Display names of the periods."""
+        return [f"{_ordinal(period + 1)} Period" for period in range(self.periods_per_day)]
+    
+    def validate(self) -> bool:
+        """Validate grid data."""
+        if self.days <= 0 or self.periods_per_day <= 0:
+            return False
+        if self.slot_hours <= 0 or self.max_daily_hours <= 0:
+            return False
+        return True
+
+DEFAULT_TIME_GRID = TimeGrid()
\ No newline at end of file
@@ -1,10 +1,15 @@
 import argparse
-import csv
-from pathlib import Path
-from datetime import datetime
+import cProfile
+import pstats
 from typing import Dict, List, Optional, Tuple
 from generators.mock_data import generate_mock_data
-from algorithms.genetic import GeneticScheduler
+from algorithms.genetic import GeneticScheduler, StoppingCriteria
+from algorithms.checkpoint import Checkpoint
+from algorithms.telemetry import JsonLinesTelemetry
+from algorithms.island import IslandScheduler
+from algorithms.local_search import LocalSearchScheduler, METHODS
+from utils.data_loader import load_data
+from utils.exporter import DEFAULT_VIEWS, EXPORT_FORMATS, VIEWS, export_schedule
 from utils.formatter import (
     format_schedule_table,
     format_violations,
@@ -12,12 +17,14 @@ from utils.formatter import (
     format_schedule_summary,
     print_header
 )
-from models.schedule import Schedule, TimeSlot
+from models.schedule import Schedule
 from models.subject import Subject
-from models.lecturer import Lecturer, LecturerConstraints
+from models.lecturer import Lecturer
 from models.group import Group
 from models.classroom import Classroom
+from models.time_grid import TimeGrid
 from rich.console import Console
+from rich.markup import escape
 
 console = Console()
 
@@ -29,153 +36,19 @@ def load_data_from_csv(input_dir: str) -> Tuple[List[Subject], List[Lecturer], L
     - lecturers.csv: lecturer_id,name,subjects,can_lecture,can_practice,max_hours
     - groups.csv: group_id,name,student_count,subjects,subgroups
     - classrooms.csv: classroom_id,name,capacity,is_lab,building,floor
-    """
-    input_path = Path(input_dir)
-    
-    # Load subjects
-    subjects: Dict[str, Subject] = {}
-    with open(input_path / "subjects.csv", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            subject = Subject(
-                subject_id=row["subject_id"],
-                name=row["name"],
-                lecture_hours=int(row["lecture_hours"]),
-                practical_hours=int(row["practical_hours"]),
-                requires_subgroups=row["requires_subgroups"].lower() == "true"
-            )
-            subjects[subject.subject_id] = subject
-    
-    # Load lecturers
-    lecturers: List[Lecturer] = []
-    with open(input_path / "lecturers.csv", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            lecturer = Lecturer(
-                lecturer_id=row["lecturer_id"],
-                name=row["name"]
-            )
-            
-            # Parse subject constraints
-            subject_list = row["subjects"].split(";")
-            can_lecture = row["can_lecture"].split(";")
-            can_practice = row["can_practice"].split(";")
-            max_hours = row["max_hours"].split(";")
-            
-            for i, subject_id in enumerate(subject_list):
-                if subject_id in subjects:
-                    constraints = LecturerConstraints(
-                        can_lecture=can_lecture[i].lower() == "true",
-                        can_practice=can_practice[i].lower() == "true",
-                        max_hours_per_week=int(max_hours[i])
-                    )
-                    lecturer.add_subject_constraint(subject_id, constraints)
-            
-            lecturers.append(lecturer)
-    
-    # Load groups
-    groups: List[Group] = []
-    with open(input_path / "groups.csv", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            group = Group(
-                group_id=row["group_id"],
-                name=row["name"],
-                student_count=int(row["student_count"])
-            )
-            
-            # Add subjects
-            subject_list = row["subjects"].split(";")
-            for subject_id in subject_list:
-                if subject_id in subjects:
-                    group.add_subject(subjects[subject_id])
-            
-            # Create subgroups if specified
-            if row["subgroups"]:
-                group.create_subgroups(int(row["subgroups"]))
-            
-            groups.append(group)
-    
-    # Load classrooms
-    classrooms: List[Classroom] = []
-    with open(input_path / "classrooms.csv", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            classroom = Classroom(
-                classroom_id=row["classroom_id"],
-                name=row["name"],
-                capacity=int(row["capacity"]),
-                is_lab=row["is_lab"].lower() == "true",
-                building=row["building"],
-                floor=int(row["floor"]) if row["floor"] else None
-            )
-            classrooms.append(classroom)
     
-    return list(subjects.values()), lecturers, groups, classrooms
+    See utils.data_loader.load_data for Parquet input, caching and the
+    integrity report.
+    """
+    data = load_data(input_dir)
+    return data.subjects, data.lecturers, data.groups, data.classrooms
 
-def save_schedule_to_csv(schedule: Schedule, groups: List, output_dir: str) -> None:
-    """Save schedule to CSV files."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = Path(output_dir) / timestamp
-    output_path.mkdir(parents=True, exist_ok=True)
-    
-    # Save main schedule
-    with open(output_path / "schedule.csv", "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "Day", "Period", "Subject", "Type", "Lecturer", 
-            "Groups", "Classroom", "Is Lab"
-        ])
-        
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-        for slot, entries in sorted(schedule.entries.items(), key=lambda x: (x[0].day, x[0].period)):
-            for entry in entries:
-                writer.writerow([
-                    days[slot.day],
-                    f"Period {slot.period + 1}",
-                    entry.subject.name,
-                    "Lecture" if entry.is_lecture else "Practical",
-                    entry.lecturer.name,
-                    ", ".join(g.name for g in entry.groups),
-                    entry.classroom.name,
-                    "Yes" if entry.classroom.is_lab else "No"
-                ])
-    
-    # Save group schedules
-    for group in groups:
-        with open(output_path / f"schedule_{group.name}.csv", "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["Time"] + days)
-            
-            for period in range(4):
-                row = [f"Period {period + 1}"]
-                for day in range(5):
-                    slot = TimeSlot(day=day, period=period)
-                    cell = ""
-                    if slot in schedule.entries:
-                        for entry in schedule.entries[slot]:
-                            if group in entry.groups:
-                                cell = (
-                                    f"{entry.subject.name}\n"
-                                    f"{entry.lecturer.name}\n"
-                                    f"{entry.classroom.name}\n"
-                                    f"({'Lecture' if entry.is_lecture else 'Practical'})"
-                                )
-                                break
-                    row.append(cell)
-                writer.writerow(row)
-    
-    # Save statistics
-    with open(output_path / "statistics.csv", "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Metric", "Value"])
-        total_slots = 20
-        used_slots = len(schedule.entries)
-        utilization = (used_slots / total_slots) * 100
-        
-        writer.writerow(["Total Time Slots", total_slots])
-        writer.writerow(["Used Time Slots", used_slots])
-        writer.writerow(["Schedule Utilization", f"{utilization:.1f}%"])
+def save_schedule_to_csv(schedule: Schedule, groups: List, output_dir: str, time_grid: TimeGrid) -> None:
+    """Save schedule to CSV files.
+    
+    See utils.exporter.export_schedule for the other formats.
+    """
+    export_schedule(schedule, output_dir, time_grid, "csv", groups=groups)
 
 def parse_args():
     """Parse command line arguments."""
@@ -192,10 +65,68 @@ def parse_args():
     data_group.add_argument(
         "--input-dir",
         type=str,
-        help="Directory containing input CSV files (subjects.csv, lecturers.csv, groups.csv, classrooms.csv)"
+        help="Directory containing input CSV files (subjects.csv, lecturers.csv, groups.csv, classrooms.csv); "
+             "a .parquet file is read instead of the CSV file of the same name (needs pyarrow, "
+             "see the parquet extra)"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse the input files again instead of using the cache of the last load, "
+             "kept in $XDG_CACHE_HOME/university-scheduler (default: ~/.cache/university-scheduler)"
+    )
+    
+    # Time grid
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=5,
+        help="Teaching days per week (default: 5)"
+    )
+    
+    parser.add_argument(
+        "--periods",
+        type=int,
+        default=4,
+        help="Periods per day (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--slot-hours",
+        type=float,
+        default=1.5,
+        help="Length of a period in hours (default: 1.5)"
+    )
+    
+    parser.add_argument(
+        "--max-daily-hours",
+        type=float,
+        default=6.0,
+        help="Daily hours above which a group's load is penalised (default: 6.0)"
     )
     
     # Algorithm parameters
+    parser.add_argument(
+        "--algorithm",
+        choices=("ga",) + METHODS,
+        default="ga",
+        help="Genetic algorithm, simulated annealing or tabu search (default: ga)"
+    )
+    
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=10000,
+        help="Iterations of simulated annealing or tabu search (default: 10000)"
+    )
+    
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        help="Wall-clock budget in seconds; the genetic algorithm checks it once per generation"
+    )
+    
     parser.add_argument(
         "--population",
         type=int,
@@ -210,6 +141,45 @@ def parse_args():
         help="Number of generations to evolve (default: 100)"
     )
     
+    parser.add_argument(
+        "--target-fitness",
+        type=float,
+        help="Stop evolving once the best fitness reaches this value"
+    )
+    
+    parser.add_argument(
+        "--patience",
+        type=int,
+        help="Stop evolving after this many generations without improvement"
+    )
+    
+    parser.add_argument(
+        "--max-evaluations",
+        type=int,
+        help="Stop evolving after this many fitness evaluations"
+    )
+    
+    # Checkpoint options
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=0,
+        help="Save the genetic algorithm state every this many generations (default: 0, never)"
+    )
+    
+    parser.add_argument(
+        "--checkpoint-file",
+        type=str,
+        default="checkpoint.npz",
+        help="Checkpoint file to save to and resume from (default: checkpoint.npz)"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the run saved in the checkpoint file; use the same data and options"
+    )
+    
     parser.add_argument(
         "--mutation-rate",
         type=float,
@@ -238,6 +208,90 @@ def parse_args():
         help="Crossover rate (default: 0.8)"
     )
     
+    parser.add_argument(
+        "--legacy-scoring",
+        action="store_true",
+        help="Count each violation once per entry of the affected resource (pre-deduplication scores)"
+    )
+    
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Score the whole population with batched NumPy operations"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes for fitness evaluation, single population only (default: none)"
+    )
+    
+    parser.add_argument(
+        "--parallel-offspring",
+        action="store_true",
+        help="Also create offspring in the worker processes"
+    )
+    
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Random seed for reproducible runs"
+    )
+    
+    parser.add_argument(
+        "--fitness-cache-size",
+        type=int,
+        default=10000,
+        help="Number of fitness values to cache by schedule hash, 0 to disable (default: 10000)"
+    )
+    
+    parser.add_argument(
+        "--no-repair",
+        action="store_true",
+        help="Reject offspring that break hard constraints instead of repairing them"
+    )
+    
+    parser.add_argument(
+        "--max-offspring-attempts",
+        type=int,
+        help="Maximum offspring created per generation (default: 10 x population)"
+    )
+    
+    parser.add_argument(
+        "--memetic-budget",
+        type=int,
+        default=0,
+        help="Moves evaluated per generation to hill-climb the elite schedules (default: 0, off)"
+    )
+    
+    # Island model options
+    parser.add_argument(
+        "--islands",
+        type=int,
+        help="Run this many independent populations in separate processes (island model)"
+    )
+    
+    parser.add_argument(
+        "--migration-interval",
+        type=int,
+        default=10,
+        help="Generations between migrations of the island model (default: 10)"
+    )
+    
+    parser.add_argument(
+        "--migration-size",
+        type=int,
+        default=2,
+        help="Number of best schedules each island sends per migration (default: 2)"
+    )
+    
+    parser.add_argument(
+        "--topology",
+        choices=["ring", "full"],
+        default="ring",
+        help="Migration topology of the island model (default: ring)"
+    )
+    
     # Output options
     parser.add_argument(
         "--show-lecturer-schedules",
@@ -254,21 +308,119 @@ def parse_args():
     parser.add_argument(
         "--output-dir",
         type=str,
-        help="Directory to save output CSV files"
+        help="Directory to save output files"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--export-format",
+        choices=EXPORT_FORMATS,
+        default="csv",
+        help="Format of the output files: CSV files, one XLSX workbook or Parquet files "
+             "(default: csv; parquet needs the parquet extra)"
+    )
+    
+    parser.add_argument(
+        "--export-views",
+        nargs="+",
+        choices=VIEWS,
+        default=list(DEFAULT_VIEWS),
+        help="Timetables to write: per group, per lecturer and/or per classroom (default: group)"
+    )
+    
+    parser.add_argument(
+        "--export-workers",
+        type=int,
+        help="Number of threads writing CSV output files (default: write them one by one)"
+    )
+    
+    # Instrumentation options
+    parser.add_argument(
+        "--telemetry",
+        type=str,
+        help="Write per-generation phase timings and statistics of the genetic algorithm "
+             "to this JSON Lines file (single population only)"
+    )
+    
+    parser.add_argument(
+        "--profile",
+        type=str,
+        help="Run the algorithm under cProfile and save the statistics to this pstats file"
+    )
+    
+    args = parser.parse_args()
+    
+    # Options only the single-population genetic algorithm uses
+    if args.algorithm != "ga" or args.islands:
+        mode = "--islands" if args.algorithm == "ga" else f"--algorithm {args.algorithm}"
+        for option, value in (("--telemetry", args.telemetry), ("--workers", args.workers),
+                              ("--parallel-offspring", args.parallel_offspring)):
+            if value:
+                parser.error(f"{option} cannot be used with {mode}, "
+                             "it only applies to the single-population genetic algorithm")
+    return args
+
+def print_evolution_stats(scheduler: GeneticScheduler) -> None:
+    """Print how a genetic algorithm run ended and what its operators did."""
+    result = scheduler.result
+    if result:
+        console.print(
+            f"Stopped after {result.generations} generations ({result.stop_reason.replace('_', ' ')}), "
+            f"{result.evaluations} evaluations in {result.seconds:.2f}s"
+        )
+    
+    stats = scheduler.offspring_stats
+    if stats.attempts:
+        console.print(
+            f"Offspring: {stats.attempts} attempts, {stats.repaired} repaired, "
+            f"{stats.rejected} rejected, {stats.filled} filled with clones"
+        )
+    
+    memetic_stats = scheduler.memetic_stats
+    if memetic_stats.evaluations:
+        console.print(
+            f"Memetic: {memetic_stats.evaluations} moves evaluated, "
+            f"{memetic_stats.improvements} improvements"
+        )
+    
+    cache = scheduler.fitness_cache
+    if cache.hits or cache.misses:
+        console.print(
+            f"Fitness cache: {cache.hits} hits, {cache.misses} misses "
+            f"({cache.hit_rate * 100:.1f}% hit rate)"
+        )
 
 def main():
     args = parse_args()
     print_header("University Schedule Generator")
     
+    time_grid = TimeGrid(
+        days=args.days,
+        periods_per_day=args.periods,
+        slot_hours=args.slot_hours,
+        max_daily_hours=args.max_daily_hours
+    )
+    if not time_grid.validate():
+        console.print("[red]Invalid time grid: days, periods and hours must be positive[/]")
+        return
+    
+    if (args.checkpoint_every or args.resume) and (args.algorithm != "ga" or args.islands):
+        console.print("[red]Checkpoints are only supported for the single-population genetic algorithm[/]")
+        return
+    
     # Generate or load data
     try:
         if args.input_dir:
             console.print(f"\n[cyan]Loading data from {args.input_dir}...[/]")
-            subjects, lecturers, groups, classrooms = load_data_from_csv(args.input_dir)
-            console.print("[green]Data loaded successfully![/]")
+            data = load_data(args.input_dir, use_cache=not args.no_cache)
+            subjects, lecturers, groups, classrooms = data.subjects, data.lecturers, data.groups, data.classrooms
+            source = " (from cache)" if data.from_cache else ""
+            console.print(f"[green]Data loaded successfully{source}![/]")
+            if not data.report.is_valid:
+                console.print(f"[yellow]{len(data.report.issues)} data issues found:[/]")
+                for issue in data.report.issues[:10]:
+                    console.print(f"  [yellow]{escape(str(issue))}[/]")
+                if len(data.report.issues) > 10:
+                    console.print(f"  [yellow]... and {len(data.report.issues) - 10} more[/]")
         else:
             console.print(f"\n[cyan]Generating {args.size} dataset...[/]")
             subjects, lecturers, groups, classrooms = generate_mock_data(args.size)
@@ -276,34 +428,151 @@ def main():
         console.print(f"[red]Error loading data: {str(e)}[/]")
         return
     
-    # Initialize genetic scheduler
-    scheduler = GeneticScheduler(
+    # Options of every scheduler, then those of the genetic algorithm
+    base_options = dict(
         subjects=subjects,
         lecturers=lecturers,
         groups=groups,
         classrooms=classrooms,
+        legacy_scoring=args.legacy_scoring,
+        seed=args.seed,
+        time_grid=time_grid
+    )
+    scheduler_options = dict(
+        base_options,
         population_size=args.population,
         elite_size=args.elite_size,
         mutation_rate=args.mutation_rate,
         crossover_rate=args.crossover_rate,
-        tournament_size=args.tournament_size
+        tournament_size=args.tournament_size,
+        vectorized=args.vectorized,
+        fitness_cache_size=args.fitness_cache_size,
+        repair_offspring=not args.no_repair,
+        max_offspring_attempts=args.max_offspring_attempts,
+        memetic_budget=args.memetic_budget
     )
     
-    # Generate initial population
-    console.print("\n[bold cyan]Generating initial population...[/]")
-    with console.status("[bold green]Creating initial schedules...") as status:
-        population = scheduler.generate_initial_population()
+    stopping = StoppingCriteria(
+        target_fitness=args.target_fitness,
+        patience=args.patience,
+        time_limit=args.time_limit,
+        max_evaluations=args.max_evaluations
+    )
+    
+    telemetry = JsonLinesTelemetry(args.telemetry) if args.telemetry else None
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
     
-    # Run genetic algorithm
-    console.print("\n[bold cyan]Running genetic algorithm...[/]")
-    with console.status("[bold green]Evolving schedules...") as status:
-        def progress_callback(gen: int, fitness: float):
-            status.update(f"Generation {gen + 1}/{args.generations} - Best Fitness: {fitness:.2f}")
+    if args.algorithm != "ga":
+        scheduler = LocalSearchScheduler(method=args.algorithm, **base_options)
+        
+        # Improve a single random schedule
+        name = "simulated annealing" if args.algorithm == "sa" else "tabu search"
+        console.print(f"\n[bold cyan]Running {name}...[/]")
+        with console.status("[bold green]Searching...") as status:
+            def search_progress_callback(iteration: int, fitness: float):
+                if iteration % 100 == 0:
+                    status.update(f"Iteration {iteration + 1}/{args.iterations} - Best Fitness: {fitness:.2f}")
+            
+            best_schedule = scheduler.search(
+                iterations=args.iterations,
+                time_limit=args.time_limit,
+                progress_callback=search_progress_callback
+            )
+        console.print(f"Completed {scheduler.iterations_done} iterations")
+    elif args.islands:
+        scheduler = IslandScheduler(
+            islands=args.islands,
+            migration_interval=args.migration_interval,
+            migration_size=args.migration_size,
+            topology=args.topology,
+            **scheduler_options
+        )
+        
+        # Run the islands; each one creates its own initial population
+        console.print(f"\n[bold cyan]Running genetic algorithm on {args.islands} islands...[/]")
+        with console.status("[bold green]Evolving schedules...") as status:
+            island_fitness: Dict[int, float] = {}
+            
+            def island_progress_callback(island: int, gen: int, fitness: float):
+                island_fitness[island] = fitness
+                islands_str = " | ".join(
+                    f"#{i + 1}: {f:.2f}" for i, f in sorted(island_fitness.items())
+                )
+                status.update(f"Generation {gen + 1}/{args.generations} - Island Best Fitness: {islands_str}")
+            
+            best_schedule = scheduler.evolve(
+                generations=args.generations,
+                progress_callback=island_progress_callback,
+                stopping=stopping
+            )
+        
+        for island, history in enumerate(scheduler.island_fitness_history):
+            console.print(f"Island {island + 1}: best fitness {max(history, default=0.0):.2f}")
+    else:
+        scheduler = GeneticScheduler(
+            workers=args.workers,
+            parallel_offspring=args.parallel_offspring,
+            telemetry=telemetry,
+            **scheduler_options
+        )
+        
+        checkpoint = None
+        population = []
+        if args.resume:
+            try:
+                checkpoint = Checkpoint.load(args.checkpoint_file)
+            except (OSError, ValueError) as e:
+                console.print(f"[red]Error loading checkpoint: {str(e)}[/]")
+                return
+            console.print(f"\n[cyan]Resuming from generation {checkpoint.generation + 1}...[/]")
+        else:
+            # Generate initial population
+            console.print("\n[bold cyan]Generating initial population...[/]")
+            with console.status("[bold green]Creating initial schedules...") as status:
+                population = scheduler.generate_initial_population()
+            
+            population_stats = scheduler.population_stats
+            console.print(
+                f"Initial population: {population_stats.accepted}/{population_stats.generated} accepted "
+                f"({population_stats.acceptance_rate * 100:.1f}%), "
+                f"{population_stats.seconds_per_individual * 1000:.1f} ms per valid schedule"
+            )
         
-        best_schedule = scheduler.evolve(
-            population=population,
-            generations=args.generations,
-            progress_callback=progress_callback
+        # Run genetic algorithm
+        console.print("\n[bold cyan]Running genetic algorithm...[/]")
+        with console.status("[bold green]Evolving schedules...") as status:
+            def progress_callback(gen: int, fitness: float):
+                status.update(f"Generation {gen + 1}/{args.generations} - Best Fitness: {fitness:.2f}")
+            
+            best_schedule = scheduler.evolve(
+                population=population,
+                generations=args.generations,
+                progress_callback=progress_callback,
+                stopping=stopping,
+                checkpoint_path=args.checkpoint_file if args.checkpoint_every else None,
+                checkpoint_every=args.checkpoint_every,
+                resume=checkpoint
+            )
+    
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        console.print(f"\n[cyan]Profile saved to {args.profile}; most expensive calls:[/]")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+    if telemetry:
+        telemetry.close()
+        console.print(f"[cyan]Telemetry written to {args.telemetry}[/]")
+    
+    if isinstance(scheduler, GeneticScheduler):
+        print_evolution_stats(scheduler)
+    
+    validator = scheduler.validator
+    if validator.checks or validator.skipped:
+        console.print(
+            f"Validation: {validator.checks} full checks, {validator.skipped} skipped "
+            f"({validator.skipped * 100 / (validator.checks + validator.skipped):.1f}% reused)"
         )
     
     # Print schedule views
@@ -311,12 +580,13 @@ def main():
         best_schedule,
         groups,
         lecturers if args.show_lecturer_schedules else [],
-        classrooms if args.show_classroom_schedules else []
+        classrooms if args.show_classroom_schedules else [],
+        time_grid
     )
     
     # Print schedule summary
     print_header("\nSchedule Statistics")
-    format_schedule_summary(best_schedule)
+    format_schedule_summary(best_schedule, time_grid)
     
     # Print violations if any
     violations = scheduler.get_violations(best_schedule)
@@ -328,12 +598,22 @@ def main():
     quality_score = scheduler.evaluate_schedule(best_schedule)
     format_quality_score(quality_score)
     
-    # Save output to CSV if requested
+    # Save output if requested
     if args.output_dir:
         try:
             console.print(f"\n[cyan]Saving results to {args.output_dir}...[/]")
-            save_schedule_to_csv(best_schedule, groups, args.output_dir)
-            console.print("[green]Results saved successfully![/]")
+            output_path = export_schedule(
+                best_schedule,
+                args.output_dir,
+                time_grid,
+                args.export_format,
+                groups=groups,
+                lecturers=lecturers,
+                classrooms=classrooms,
+                workers=args.export_workers,
+                views=args.export_views
+            )
+            console.print(f"[green]Results saved successfully to {output_path}![/]")
         except Exception as e:
             console.print(f"[red]Error saving results: {str(e)}[/]")
 
@@ -0,0 +1,379 @@
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+import pandas as pd
+from models.subject import Subject
+from models.lecturer import Lecturer, LecturerConstraints
+from models.group import Group
+from models.classroom import Classroom
+
+# Bump when parsing changes, so older cache files are not used
+LOADER_VERSION = 1
+
+# Directory of the load cache under the user cache directory
+CACHE_DIR_NAME = "university-scheduler"
+
+COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "subjects": ("subject_id", "name", "lecture_hours", "practical_hours", "requires_subgroups"),
+    "lecturers": ("lecturer_id", "name", "subjects", "can_lecture", "can_practice", "max_hours"),
+    "groups": ("group_id", "name", "student_count", "subjects", "subgroups"),
+    "classrooms": ("classroom_id", "name", "capacity", "is_lab", "building", "floor")
+}
+
+TRUE_VALUES = ("true", "1", "yes")
+FALSE_VALUES = ("false", "0", "no")
+
+@dataclass(frozen=True)
+class IntegrityIssue:
+    """A problem found in an input file.
+    
+    ``row`` is the 1-based data row (the header not counted), None for
+    problems with the whole file or between files.
+    """
+    file: str
+    row: Optional[int]
+    column: Optional[str]
+    message: str
+    
+    def __str__(self) -> str:
+        location = self.file if self.row is None else f"{self.file} row {self.row}"
+        if self.column:
+            location += f" [{self.column}]"
+        return f"{location}: {self.message}"
+
+@dataclass
+class IntegrityReport:
+    """All problems found while loading the input files."""
+    issues: List[IntegrityIssue] = field(default_factory=list)
+    
+    @property
+    def is_valid(self) -> bool:
+        return not self.issues
+    
+    def by_file(self) -> Dict[str, List[IntegrityIssue]]:
+        """Issues grouped by file."""
+        result: Dict[str, List[IntegrityIssue]] = {}
+        for issue in self.issues:
+            result.setdefault(issue.file, []).append(issue)
+        return result
+    
+    def add(self, file: str, rows: pd.Series, column: Optional[str], message: str) -> None:
+        """Add one issue per row of a boolean mask, indexed by row, that is set."""
+        for row in rows[rows].index.unique():
+            self.issues.append(IntegrityIssue(file, int(row) + 1, column, message))
+
+@dataclass
+class ProblemData:
+    """Entities of a scheduling problem and the issues found loading them."""
+    subjects: List[Subject]
+    lecturers: List[Lecturer]
+    groups: List[Group]
+    classrooms: List[Classroom]
+    report: IntegrityReport
+    from_cache: bool = False
+
+def _source(input_path: Path, name: str) -> Path:
+    """The Parquet file of a table if there is one, else its CSV file."""
+    parquet = input_path / f"{name}.parquet"
+    return parquet if parquet.exists() else input_path / f"{name}.csv"
+
+def _read(path: Path) -> pd.DataFrame:
+    """Read a table with every value as a string, blanks as ''."""
+    if path.suffix == ".parquet":
+        frame = pd.read_parquet(path).astype(object)
+        return frame.where(frame.notna(), "").map(str)
+    # Plain Python strings; pandas string arrays are slow to iterate over
+    return pd.read_csv(path, dtype=object, keep_default_na=False, skipinitialspace=True)
+
+def _integers(values: pd.Series, file: str, column: str, report: IntegrityReport,
+              minimum: int = 0, blank: bool = False) -> pd.Series:
+    """Parse integers; invalid values are reported and become NA."""
+    numbers = pd.to_numeric(values, errors="coerce")
+    invalid = numbers.isna() | (numbers % 1 != 0) | (numbers < minimum)
+    if blank:
+        invalid &= values != ""
+    report.add(file, invalid, column, f"expected an integer of at least {minimum}")
+    return numbers.where(~invalid).astype("Int64")
+
+def _booleans(values: pd.Series, file: str, column: str, report: IntegrityReport) -> pd.Series:
+    """Parse true/false values; anything else is reported and read as false."""
+    lowered = values.str.strip().str.lower()
+    report.add(file, ~lowered.isin(TRUE_VALUES + FALSE_VALUES), column, "expected true or false")
+    return lowered.isin(TRUE_VALUES)
+
+def _duplicates(frame: pd.DataFrame, file: str, column: str, report: IntegrityReport) -> pd.Series:
+    """Report repeated ids; returns the mask of rows to keep (first of each id)."""
+    duplicated = frame[column].duplicated()
+    report.add(file, duplicated, column, "duplicate id, row ignored")
+    blank = frame[column] == ""
+    report.add(file, blank, column, "missing id, row ignored")
+    return ~duplicated & ~blank
+
+def _split(values: pd.Series) -> pd.Series:
+    """Split semicolon-separated lists into one stripped item per row.
+    
+    The index of each item is that of its row, so items of a row keep
+    their positions across columns of the same length.
+    """
+    return values.str.split(";").explode().str.strip()
+
+def _rows(*columns) -> Iterator[tuple]:
+    """Iterate over aligned columns as plain Python values.
+    
+    Much faster than iterating over pandas objects item by item.
+    """
+    return zip(*(column.tolist() for column in columns))
+
+def _items(series: pd.Series) -> Iterator[tuple]:
+    """Pairs of row index and value of a series, as plain Python values."""
+    return _rows(series.index, series)
+
+def parse_tables(tables: Dict[str, pd.DataFrame]) -> ProblemData:
+    """Build the entities from raw tables, checking them in one pass.
+    
+    Rows with an invalid id or number are skipped; references to unknown
+    subjects are dropped. Everything is reported in the integrity report.
+    """
+    report = IntegrityReport()
+    for name, columns in COLUMNS.items():
+        missing = [c for c in columns if c not in tables[name].columns]
+        if missing:
+            report.issues.append(IntegrityIssue(name, None, None, f"missing columns: {', '.join(missing)}"))
+            tables[name] = tables[name].reindex(columns=list(columns), fill_value="")
+    
+    # Subjects
+    frame = tables["subjects"]
+    keep = _duplicates(frame, "subjects", "subject_id", report)
+    lecture_hours = _integers(frame["lecture_hours"], "subjects", "lecture_hours", report)
+    practical_hours = _integers(frame["practical_hours"], "subjects", "practical_hours", report)
+    requires_subgroups = _booleans(frame["requires_subgroups"], "subjects", "requires_subgroups", report)
+    keep &= lecture_hours.notna() & practical_hours.notna()
+    subjects: Dict[str, Subject] = {
+        subject_id: Subject(subject_id, name, int(lectures), int(practicals), bool(subgroups))
+        for subject_id, name, lectures, practicals, subgroups in _rows(
+            frame["subject_id"][keep], frame["name"][keep], lecture_hours[keep],
+            practical_hours[keep], requires_subgroups[keep]
+        )
+    }
+    
+    # Lecturers, with one row per (lecturer, subject) constraint
+    frame = tables["lecturers"]
+    keep = _duplicates(frame, "lecturers", "lecturer_id", report)
+    list_columns = ("subjects", "can_lecture", "can_practice", "max_hours")
+    items = {c: _split(frame[c][keep]) for c in list_columns}
+    # Number each item within its row, so items are matched by position
+    position = {c: items[c].groupby(level=0).cumcount() for c in list_columns}
+    lengths = pd.DataFrame({c: position[c].groupby(level=0).size() for c in list_columns})
+    mismatched = lengths.ne(lengths["subjects"], axis=0).any(axis=1)
+    report.add("lecturers", mismatched, "subjects",
+               "subjects, can_lecture, can_practice and max_hours differ in length; extra items ignored")
+    if mismatched.any():
+        shortest = lengths.min(axis=1)
+        for c in list_columns:
+            inside = position[c].to_numpy() < shortest.reindex(items[c].index).to_numpy()
+            items[c] = items[c][inside]
+    constraints = pd.DataFrame(items)
+    constraints = constraints[constraints["subjects"] != ""]
+    can_lecture = _booleans(constraints["can_lecture"], "lecturers", "can_lecture", report)
+    can_practice = _booleans(constraints["can_practice"], "lecturers", "can_practice", report)
+    max_hours = _integers(constraints["max_hours"], "lecturers", "max_hours", report)
+    known = constraints["subjects"].isin(subjects)
+    for row, subject_id in _items(constraints["subjects"][~known]):
+        report.issues.append(IntegrityIssue("lecturers", int(row) + 1, "subjects", f"unknown subject {subject_id}"))
+    
+    lecturers: Dict[int, Lecturer] = {
+        row: Lecturer(lecturer_id=lecturer_id, name=name)
+        for row, lecturer_id, name in _rows(frame.index[keep], frame["lecturer_id"][keep], frame["name"][keep])
+    }
+    valid = known & max_hours.notna()
+    for row, subject_id, lectures, practicals, hours in _rows(
+            constraints.index[valid], constraints["subjects"][valid], can_lecture[valid],
+            can_practice[valid], max_hours[valid]):
+        lecturers[row].add_subject_constraint(
+            subject_id, LecturerConstraints(bool(lectures), bool(practicals), int(hours))
+        )
+    
+    # Groups
+    frame = tables["groups"]
+    keep = _duplicates(frame, "groups", "group_id", report)
+    student_count = _integers(frame["student_count"], "groups", "student_count", report, minimum=1)
+    subgroups = _integers(frame["subgroups"], "groups", "subgroups", report, blank=True)
+    keep &= student_count.notna()
+    curricula = _split(frame["subjects"][keep])
+    curricula = curricula[curricula != ""]
+    known = curricula.isin(subjects)
+    for row, subject_id in _items(curricula[~known]):
+        report.issues.append(IntegrityIssue("groups", int(row) + 1, "subjects", f"unknown subject {subject_id}"))
+    curricula = curricula[known]
+    
+    groups: Dict[int, Group] = {
+        row: Group(group_id=group_id, name=name, student_count=int(count))
+        for row, group_id, name, count in _rows(
+            frame.index[keep], frame["group_id"][keep], frame["name"][keep], student_count[keep]
+        )
+    }
+    for row, subject_id in _items(curricula):
+        groups[row].add_subject(subjects[subject_id])
+    for row, count in _items(subgroups[keep].dropna()):
+        groups[row].create_subgroups(int(count))
+    
+    # Classrooms
+    frame = tables["classrooms"]
+    keep = _duplicates(frame, "classrooms", "classroom_id", report)
+    capacity = _integers(frame["capacity"], "classrooms", "capacity", report, minimum=1)
+    is_lab = _booleans(frame["is_lab"], "classrooms", "is_lab", report)
+    floor = _integers(frame["floor"], "classrooms", "floor", report, blank=True)
+    keep &= capacity.notna()
+    classrooms = [
+        Classroom(classroom_id, name, int(size), bool(lab), building, None if pd.isna(level) else int(level))
+        for classroom_id, name, size, lab, building, level in _rows(
+            frame["classroom_id"][keep], frame["name"][keep], capacity[keep],
+            is_lab[keep], frame["building"][keep], floor[keep]
+        )
+    ]
+    
+    # A later constraint of a lecturer on the same subject replaces the earlier one
+    assigned = constraints[valid].assign(can_lecture=can_lecture[valid].to_numpy(),
+                                         can_practice=can_practice[valid].to_numpy())
+    assigned = assigned.reset_index(names="row").drop_duplicates(["row", "subjects"], keep="last")
+    taught = {
+        True: set(assigned["subjects"][assigned["can_lecture"]].tolist()),
+        False: set(assigned["subjects"][assigned["can_practice"]].tolist())
+    }
+    needed = set(curricula.tolist())
+    _check_feasibility(subjects, taught, needed, list(groups.values()), classrooms, report)
+    return ProblemData(list(subjects.values()), list(lecturers.values()), list(groups.values()), classrooms, report)
+
+def _check_feasibility(subjects: Dict[str, Subject],
+                       taught: Dict[bool, Set[str]],
+                       needed: Set[str],
+                       groups: List[Group],
+                       classrooms: List[Classroom],
+                       report: IntegrityReport) -> None:
+    """Report classes that no lecturer can teach or no classroom can hold.
+    
+    ``taught`` maps lectures (True) and practicals (False) to the subjects
+    some lecturer can teach them for, ``needed`` holds the subjects taught
+    to some group.
+    """
+    for subject_id in sorted(needed):
+        subject = subjects[subject_id]
+        for is_lecture, hours in ((True, subject.lecture_hours), (False, subject.practical_hours)):
+            if hours and subject_id not in taught[is_lecture]:
+                kind = "lectures" if is_lecture else "practicals"
+                report.issues.append(IntegrityIssue("lecturers", None, None, f"no lecturer can teach {kind} of {subject_id}"))
+    
+    largest = max((c.capacity for c in classrooms), default=0)
+    largest_lab = max((c.capacity for c in classrooms if c.is_lab), default=0)
+    for group in groups:
+        if group.student_count > largest:
+            report.issues.append(IntegrityIssue(
+                "classrooms", None, None, f"no classroom holds the {group.student_count} students of {group.group_id}"
+            ))
+        # Practicals of subjects with subgroups are held in labs, per subgroup
+        students = max((sg.student_count for sg in group.subgroups), default=group.student_count)
+        if students > largest_lab and any(s.requires_subgroups and s.practical_hours for s in group.subjects.values()):
+            report.issues.append(IntegrityIssue(
+                "classrooms", None, None, f"no lab holds the {students} students of a practical of {group.group_id}"
+            ))
+
+@contextmanager
+def _gc_paused():
+    """Pause the garbage collector while building a large object graph.
+    
+    The loaded entities only reference each other without cycles to free,
+    but each allocation batch would trigger a scan of all of them.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def _content_hash(paths: List[Path]) -> str:
+    """Hash of the loader version and of the names and contents of files."""
+    digest = hashlib.blake2b(f"loader-{LOADER_VERSION}".encode(), digest_size=16)
+    for path in paths:
+        digest.update(path.name.encode())
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def default_cache_dir() -> Path:
+    """The user's cache directory for parsed inputs ($XDG_CACHE_HOME or ~/.cache)."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / CACHE_DIR_NAME
+
+def load_data(input_dir: str, use_cache: bool = True, cache_dir: Optional[str] = None) -> ProblemData:
+    """Load subjects, lecturers, groups and classrooms from an input directory.
+    
+    Each table is read from ``<name>.parquet`` when present, else from
+    ``<name>.csv``; the columns are those of COLUMNS. Parquet files need
+    pyarrow or fastparquet. With ``use_cache``, the parsed result is
+    pickled under ``cache_dir`` (by default ``default_cache_dir()``), keyed
+    by the input directory and a hash of its files, and reused while they
+    are unchanged. Nothing is written to ``input_dir``, and a cache that
+    cannot be written is skipped.
+    """
+    input_path = Path(input_dir)
+    sources = [_source(input_path, name) for name in COLUMNS]
+    for path in sources:
+        if not path.exists():
+            raise FileNotFoundError(f"Missing input file {path.stem}.csv or {path.stem}.parquet in {input_dir}")
+    
+    cache_path = None
+    if use_cache:
+        cache_root = Path(cache_dir) if cache_dir else default_cache_dir()
+        cache_path = cache_root / f"{_input_key(input_path)}-{_content_hash(sources)}.pickle"
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f, _gc_paused():
+                    data = pickle.load(f)
+                data.from_cache = True
+                return data
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+                pass  # Unreadable cache, parse again
+    
+    tables = {name: _read(path) for name, path in zip(COLUMNS, sources)}
+    with _gc_paused():
+        data = parse_tables(tables)
+    if cache_path:
+        _write_cache(cache_path, data)
+    return data
+
+def _input_key(input_path: Path) -> str:
+    """Short hash of an input directory's absolute path, naming its cache files."""
+    return hashlib.blake2b(str(input_path.resolve()).encode(), digest_size=8).hexdigest()
+
+def _write_cache(cache_path: Path, data: ProblemData) -> None:
+    """Replace the cache files of an input directory by one for ``data``, atomically.
+    
+    The cache is only an optimization: if it cannot be written, the inputs
+    are parsed again on the next load.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, _gc_paused():
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        
+        # Only the latest version of an input directory is kept
+        input_key = cache_path.name.split("-")[0]
+        for stale in cache_path.parent.glob(f"{input_key}-*.pickle"):
+            if stale != cache_path:
+                stale.unlink()
+    except OSError:
+        pass
\ No newline at end of file
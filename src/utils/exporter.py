@@ -0,0 +1,283 @@
+import csv
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from models.schedule import Schedule, ScheduleEntry
+from models.group import Group
+from models.lecturer import Lecturer
+from models.classroom import Classroom
+from models.time_grid import TimeGrid
+
+EXPORT_FORMATS = ("csv", "xlsx", "parquet")
+
+VIEWS = ("group", "lecturer", "classroom")
+
+# Views exported unless others are asked for, as before the other views existed
+DEFAULT_VIEWS = ("group",)
+
+ENTRY_COLUMNS = ["Day", "Period", "Subject", "Type", "Lecturer", "Groups", "Classroom", "Is Lab"]
+
+# Buffer size of the files written, in bytes
+BUFFER_SIZE = 1 << 16
+
+def _kind(entry: ScheduleEntry) -> str:
+    return "Lecture" if entry.is_lecture else "Practical"
+
+def _group_names(entry: ScheduleEntry) -> str:
+    return ", ".join(g.name for g in entry.groups)
+
+# Lines of a timetable cell of each view, after the subject
+CELL_LINES: Dict[str, Callable[[ScheduleEntry], Tuple[str, str]]] = {
+    "group": lambda entry: (entry.lecturer.name, entry.classroom.name),
+    "lecturer": lambda entry: (_group_names(entry), entry.classroom.name),
+    "classroom": lambda entry: (entry.lecturer.name, _group_names(entry))
+}
+
+@dataclass
+class Timetable:
+    """Weekly timetable of one group, lecturer or classroom.
+    
+    ``cells[period][day]`` is the entry of that slot, None when free. Like
+    the console tables, a slot with several entries shows the first one.
+    """
+    view: str
+    name: str
+    cells: List[List[Optional[ScheduleEntry]]]
+    
+    def rows(self, days: List[str]) -> List[List[str]]:
+        """Header and text rows, as in the CSV files."""
+        lines = CELL_LINES[self.view]
+        rows = [["Time"] + days]
+        for period, cells in enumerate(self.cells):
+            rows.append([f"Period {period + 1}"] + [
+                "" if entry is None else
+                "\n".join((entry.subject.name, *lines(entry), f"({_kind(entry)})"))
+                for entry in cells
+            ])
+        return rows
+
+@dataclass
+class ScheduleExport:
+    """Everything written by an export, built in one pass over the entries."""
+    days: List[str]
+    entries: List[List[Any]]
+    timetables: Dict[str, List[Timetable]] = field(default_factory=dict)
+    statistics: List[Tuple[str, Any]] = field(default_factory=list)
+
+def build_export(schedule: Schedule,
+                 time_grid: TimeGrid,
+                 groups: Optional[Sequence[Group]] = None,
+                 lecturers: Optional[Sequence[Lecturer]] = None,
+                 classrooms: Optional[Sequence[Classroom]] = None,
+                 views: Sequence[str] = VIEWS) -> ScheduleExport:
+    """Collect the entry rows and the timetables of a schedule.
+    
+    Timetables are made for each of ``views`` (names from VIEWS): for the
+    given groups, lecturers or classrooms, in their order, or when they are
+    left as None, for those with a class in the schedule, by name.
+    """
+    unknown = set(views) - set(VIEWS)
+    if unknown:
+        raise ValueError(f"Unknown views {', '.join(sorted(unknown))}, expected some of {', '.join(VIEWS)}")
+    
+    days = time_grid.day_names
+    given = {
+        view: owners
+        for view, owners in (("group", groups), ("lecturer", lecturers), ("classroom", classrooms))
+        if view in views
+    }
+    
+    def empty_cells() -> List[List[Optional[ScheduleEntry]]]:
+        return [[None] * time_grid.days for _ in range(time_grid.periods_per_day)]
+    
+    cells: Dict[str, Dict[Any, List[List[Optional[ScheduleEntry]]]]] = {
+        view: {owner: empty_cells() for owner in owners or ()} for view, owners in given.items()
+    }
+    
+    entries = []
+    for slot, slot_entries in sorted(schedule.entries.items(), key=lambda x: (x[0].day, x[0].period)):
+        for entry in slot_entries:
+            entries.append([
+                days[slot.day],
+                f"Period {slot.period + 1}",
+                entry.subject.name,
+                _kind(entry),
+                entry.lecturer.name,
+                _group_names(entry),
+                entry.classroom.name,
+                "Yes" if entry.classroom.is_lab else "No"
+            ])
+            for view, owners in (("group", entry.groups), ("lecturer", (entry.lecturer,)),
+                                 ("classroom", (entry.classroom,))):
+                if view not in cells:
+                    continue
+                for owner in owners:
+                    grid = cells[view].get(owner)
+                    if grid is None:
+                        if given[view] is not None:
+                            continue
+                        grid = cells[view][owner] = empty_cells()
+                    if grid[slot.period][slot.day] is None:
+                        grid[slot.period][slot.day] = entry
+    
+    timetables = {}
+    for view, grids in cells.items():
+        owners = list(grids) if given[view] is not None else sorted(grids, key=lambda owner: owner.name)
+        timetables[view] = [Timetable(view, owner.name, grids[owner]) for owner in owners]
+    
+    total_slots = time_grid.slot_count
+    used_slots = len(schedule.entries)
+    statistics = [
+        ("Total Time Slots", total_slots),
+        ("Used Time Slots", used_slots),
+        ("Schedule Utilization", f"{used_slots / total_slots * 100:.1f}%")
+    ]
+    return ScheduleExport(days, entries, timetables, statistics)
+
+def _file_name(name: str) -> str:
+    """A name made safe to use in a file name."""
+    return re.sub(r"[^\w\-. ]", "_", name)
+
+def _write_rows(path: Path, rows: Iterable[List[Any]]) -> None:
+    with open(path, "w", newline="", buffering=BUFFER_SIZE) as f:
+        csv.writer(f).writerows(rows)
+
+def write_csv(export: ScheduleExport, output_path: Path, workers: Optional[int] = None) -> None:
+    """Write schedule.csv, statistics.csv and one CSV file per timetable.
+    
+    Timetables of the exported views are written to ``schedule_<group>.csv``,
+    ``lecturer_<lecturer>.csv`` and ``classroom_<classroom>.csv``. With
+    ``workers``, files are written by that many threads, so at most that
+    many are open at once.
+    """
+    prefixes = {"group": "schedule", "lecturer": "lecturer", "classroom": "classroom"}
+    jobs = [
+        (output_path / "schedule.csv", lambda: [ENTRY_COLUMNS] + export.entries),
+        (output_path / "statistics.csv", lambda: [["Metric", "Value"]] + [list(s) for s in export.statistics])
+    ]
+    for view, timetables in export.timetables.items():
+        for timetable in timetables:
+            jobs.append((
+                output_path / f"{prefixes[view]}_{_file_name(timetable.name)}.csv",
+                lambda timetable=timetable: timetable.rows(export.days)
+            ))
+    
+    def write(job: Tuple[Path, Callable[[], List[List[Any]]]]) -> None:
+        path, rows = job
+        _write_rows(path, rows())
+    
+    if workers and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Consume the results so errors are raised
+            list(pool.map(write, jobs))
+    else:
+        for job in jobs:
+            write(job)
+
+def write_xlsx(export: ScheduleExport, path: Path) -> None:
+    """Write one workbook with a sheet of entries, one of statistics and one per exported view.
+    
+    The timetables of a view are stacked on its sheet, each under a row
+    with its name. Rows are streamed, so memory does not grow with the
+    number of timetables.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font
+    
+    workbook = Workbook(write_only=True)
+    bold = Font(bold=True)
+    wrap = Alignment(wrap_text=True, vertical="top")
+    
+    def styled(sheet, value: Any, **style) -> WriteOnlyCell:
+        cell = WriteOnlyCell(sheet, value=value)
+        for attribute, setting in style.items():
+            setattr(cell, attribute, setting)
+        return cell
+    
+    sheet = workbook.create_sheet("Schedule")
+    sheet.append([styled(sheet, column, font=bold) for column in ENTRY_COLUMNS])
+    for row in export.entries:
+        sheet.append(row)
+    
+    sheet = workbook.create_sheet("Statistics")
+    sheet.append([styled(sheet, "Metric", font=bold), styled(sheet, "Value", font=bold)])
+    for row in export.statistics:
+        sheet.append(list(row))
+    
+    for view, timetables in export.timetables.items():
+        sheet = workbook.create_sheet(f"{view.capitalize()}s")
+        for timetable in timetables:
+            header, *rows = timetable.rows(export.days)
+            sheet.append([styled(sheet, timetable.name, font=bold)])
+            sheet.append([styled(sheet, value, font=bold) for value in header])
+            for row in rows:
+                sheet.append([row[0]] + [styled(sheet, value, alignment=wrap) if value else None
+                                         for value in row[1:]])
+            sheet.append([])
+    
+    workbook.save(path)
+
+def write_parquet(export: ScheduleExport, output_path: Path) -> None:
+    """Write entries.parquet, statistics.parquet and a timetables dataset.
+    
+    The timetables dataset holds one row per class of a group, lecturer or
+    classroom and is partitioned by view (``timetables/view=group/...``).
+    Needs pyarrow or fastparquet (the ``parquet`` extra).
+    """
+    import pandas as pd
+    
+    pd.DataFrame(export.entries, columns=ENTRY_COLUMNS).to_parquet(output_path / "entries.parquet", index=False)
+    pd.DataFrame(
+        [(metric, str(value)) for metric, value in export.statistics], columns=["Metric", "Value"]
+    ).to_parquet(output_path / "statistics.parquet", index=False)
+    
+    records = [
+        (view, timetable.name, export.days[day], period + 1, entry.subject.name, _kind(entry),
+         entry.lecturer.name, _group_names(entry), entry.classroom.name)
+        for view, timetables in export.timetables.items()
+        for timetable in timetables
+        for period, cells in enumerate(timetable.cells)
+        for day, entry in enumerate(cells) if entry is not None
+    ]
+    pd.DataFrame(records, columns=[
+        "view", "name", "day", "period", "subject", "type", "lecturer", "groups", "classroom"
+    ]).to_parquet(output_path / "timetables", partition_cols=["view"], index=False)
+
+def export_schedule(schedule: Schedule,
+                    output_dir: str,
+                    time_grid: TimeGrid,
+                    export_format: str = "csv",
+                    groups: Optional[Sequence[Group]] = None,
+                    lecturers: Optional[Sequence[Lecturer]] = None,
+                    classrooms: Optional[Sequence[Classroom]] = None,
+                    workers: Optional[int] = None,
+                    views: Sequence[str] = DEFAULT_VIEWS) -> Path:
+    """Export a schedule to a new timestamped directory of ``output_dir``.
+    
+    ``export_format`` is one of EXPORT_FORMATS; ``workers`` only applies to
+    CSV. Timetables are written for ``views``, by default group timetables
+    only; see build_export. Returns the directory written to.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {export_format!r}, expected one of {', '.join(EXPORT_FORMATS)}")
+    
+    if export_format == "parquet" and not any(find_spec(engine) for engine in ("pyarrow", "fastparquet")):
+        raise ImportError("Parquet export needs pyarrow or fastparquet (pip install university-scheduler[parquet])")
+    
+    export = build_export(schedule, time_grid, groups, lecturers, classrooms, views)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = Path(output_dir) / timestamp
+    output_path.mkdir(parents=True, exist_ok=True)
+    
+    if export_format == "csv":
+        write_csv(export, output_path, workers)
+    elif export_format == "xlsx":
+        write_xlsx(export, output_path / "schedule.xlsx")
+    else:
+        write_parquet(export, output_path)
+    return output_path
\ No newline at end of file
@@ -11,6 +11,7 @@ from models.subject import Subject
 from models.lecturer import Lecturer
 from models.group import Group
 from models.classroom import Classroom
+from models.time_grid import TimeGrid, DEFAULT_TIME_GRID
 from algorithms.constraints import ConstraintViolation
 
 console = Console()
@@ -113,10 +114,12 @@ def format_classrooms_table(classrooms: List[Classroom]) -> None:
     
     console.print(table)
 
-def format_schedule_by_group(schedule: Schedule, group: Group) -> Table:
+def format_schedule_by_group(schedule: Schedule,
+                             group: Group,
+                             time_grid: TimeGrid = DEFAULT_TIME_GRID) -> Table:
     """Format schedule for a specific group."""
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-    periods = ['1st Period', '2nd Period', '3rd Period', '4th Period']
+    days = time_grid.day_names
+    periods = time_grid.period_names
     
     table = Table(
         title=f"Schedule for {group.name}",
@@ -159,10 +162,12 @@ def format_schedule_by_group(schedule: Schedule, group: Group) -> Table:
     
     return table
 
-def format_schedule_by_lecturer(schedule: Schedule, lecturer: Lecturer) -> Table:
+def format_schedule_by_lecturer(schedule: Schedule,
+                                lecturer: Lecturer,
+                                time_grid: TimeGrid = DEFAULT_TIME_GRID) -> Table:
     """Format schedule for a specific lecturer."""
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-    periods = ['1st Period', '2nd Period', '3rd Period', '4th Period']
+    days = time_grid.day_names
+    periods = time_grid.period_names
     
     table = Table(
         title=f"Schedule for {lecturer.name}",
@@ -206,10 +211,12 @@ def format_schedule_by_lecturer(schedule: Schedule, lecturer: Lecturer) -> Table
     
     return table
 
-def format_schedule_by_classroom(schedule: Schedule, classroom: Classroom) -> Table:
+def format_schedule_by_classroom(schedule: Schedule,
+                                 classroom: Classroom,
+                                 time_grid: TimeGrid = DEFAULT_TIME_GRID) -> Table:
     """Format schedule for a specific classroom."""
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-    periods = ['1st Period', '2nd Period', '3rd Period', '4th Period']
+    days = time_grid.day_names
+    periods = time_grid.period_names
     
     table = Table(
         title=f"Schedule for {classroom.name}",
@@ -253,31 +260,35 @@ def format_schedule_by_classroom(schedule: Schedule, classroom: Classroom) -> Ta
     
     return table
 
-def format_schedule_table(schedule: Schedule, groups: List[Group], lecturers: List[Lecturer], classrooms: List[Classroom]) -> None:
+def format_schedule_table(schedule: Schedule,
+                          groups: List[Group],
+                          lecturers: List[Lecturer],
+                          classrooms: List[Classroom],
+                          time_grid: TimeGrid = DEFAULT_TIME_GRID) -> None:
     """Print schedule with multiple views."""
     # Print group schedules
     print_header("Group Schedules")
     for group in groups:
-        console.print(format_schedule_by_group(schedule, group))
+        console.print(format_schedule_by_group(schedule, group, time_grid))
         console.print()
     
     # Print lecturer schedules
     if console.input("\n[yellow]Show lecturer schedules? (y/n): [/]").lower() == 'y':
         print_header("Lecturer Schedules")
         for lecturer in lecturers:
-            console.print(format_schedule_by_lecturer(schedule, lecturer))
+            console.print(format_schedule_by_lecturer(schedule, lecturer, time_grid))
             console.print()
     
     # Print classroom schedules
     if console.input("\n[yellow]Show classroom schedules? (y/n): [/]").lower() == 'y':
         print_header("Classroom Schedules")
         for classroom in classrooms:
-            console.print(format_schedule_by_classroom(schedule, classroom))
+            console.print(format_schedule_by_classroom(schedule, classroom, time_grid))
             console.print()
 
-def format_schedule_summary(schedule: Schedule) -> None:
+def format_schedule_summary(schedule: Schedule, time_grid: TimeGrid = DEFAULT_TIME_GRID) -> None:
     """Print a summary of the schedule."""
-    total_slots = 20  # 4 periods * 5 days
+    total_slots = time_grid.slot_count
     used_slots = len(schedule.entries)
     utilization = (used_slots / total_slots) * 100
     
@@ -0,0 +1,16 @@
+from typing import Callable
+import pytest
+from generators.mock_data import generate_mock_data
+from algorithms.genetic import GeneticScheduler
+
+@pytest.fixture
+def make_scheduler() -> Callable[..., GeneticScheduler]:
+    """Factory of seeded schedulers for the mock data of a size."""
+    def make(size: str = "small", **options) -> GeneticScheduler:
+        subjects, lecturers, groups, classrooms = generate_mock_data(size)
+        options.setdefault("population_size", 10)
+        options.setdefault("elite_size", 2)
+        options.setdefault("seed", 7)
+        return GeneticScheduler(subjects, lecturers, groups, classrooms, **options)
+    
+    return make
\ No newline at end of file
@@ -0,0 +1,56 @@
+import copy
+import json
+import pytest
+from generators.mock_data import generate_mock_data
+from benchmarks.instances import build_instance
+from benchmarks.suite import BENCHMARKS, compare_results, load_results, run_suite, save_results
+
+def _ids(items, attribute):
+    return [getattr(item, attribute) for item in items]
+
+@pytest.mark.parametrize("size", ["small", "medium"])
+def test_instances_match_mock_data(size):
+    instance = build_instance(size)
+    subjects, lecturers, groups, classrooms = generate_mock_data(size)
+    
+    assert _ids(instance.subjects, "subject_id") == _ids(subjects, "subject_id")
+    assert _ids(instance.lecturers, "lecturer_id") == _ids(lecturers, "lecturer_id")
+    assert _ids(instance.groups, "student_count") == _ids(groups, "student_count")
+    assert _ids(instance.classrooms, "capacity") == _ids(classrooms, "capacity")
+
+def test_run_suite_measures_every_benchmark(tmp_path):
+    results = run_suite(["small"], list(BENCHMARKS), repeat=2, population_size=4, generations=2)
+    
+    assert [(r["benchmark"], r["size"]) for r in results["results"]] == [(name, "small") for name in BENCHMARKS]
+    for result in results["results"]:
+        assert result["repeat"] == (1 if result["benchmark"] == "evolve" else 2)
+        assert 0 <= result["seconds_min"] <= result["seconds_median"] <= result["seconds_max"]
+        assert result["peak_memory_bytes"] > 0
+    
+    path = tmp_path / "results.json"
+    save_results(results, str(path))
+    assert load_results(str(path)) == results
+
+def test_load_results_rejects_other_versions(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps({"version": 0, "results": []}))
+    with pytest.raises(ValueError):
+        load_results(str(path))
+
+def test_compare_results_flags_growth_beyond_the_tolerance():
+    baseline = {"results": [
+        {"benchmark": "mutate", "size": "small", "seconds_min": 1.0, "peak_memory_bytes": 1000},
+        {"benchmark": "crossover", "size": "small", "seconds_min": 1.0, "peak_memory_bytes": 1000}
+    ]}
+    current = copy.deepcopy(baseline)
+    current["results"][0].update(seconds_min=1.1, peak_memory_bytes=1300)
+    current["results"][1]["size"] = "medium"
+    
+    comparisons = compare_results(baseline, current, time_tolerance=0.2, memory_tolerance=0.2)
+    
+    # Benchmarks missing from the baseline are skipped
+    assert [(c.benchmark, c.metric, c.regressed) for c in comparisons] == [
+        ("mutate", "seconds_min", False),
+        ("mutate", "peak_memory_bytes", True)
+    ]
+    assert comparisons[1].ratio == pytest.approx(1.3)
\ No newline at end of file
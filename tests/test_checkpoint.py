@@ -0,0 +1,68 @@
+import os
+import numpy as np
+import pytest
+from algorithms.checkpoint import Checkpoint
+from algorithms.genetic import StoppingCriteria
+
+def _outcome(scheduler, best):
+    return (
+        best.canonical_hash(),
+        [schedule.canonical_hash() for schedule in scheduler.final_population],
+        scheduler.best_fitness_history,
+        scheduler.evaluations,
+        scheduler.fitness_cache.hits,
+        scheduler.result.stop_reason
+    )
+
+@pytest.mark.parametrize("options, stopping", [
+    ({}, None),
+    ({"memetic_budget": 30}, None),
+    ({"fitness_cache_size": 5}, None),
+    ({}, StoppingCriteria(max_evaluations=60)),
+])
+def test_resumed_run_ends_like_uninterrupted_run(make_scheduler, tmp_path, options, stopping):
+    options = dict(options, mutation_rate=0.5)
+    path = str(tmp_path / "run.npz")
+    
+    scheduler = make_scheduler("small", **options)
+    best = scheduler.evolve(scheduler.generate_initial_population(), generations=15, stopping=stopping)
+    uninterrupted = _outcome(scheduler, best)
+    
+    # Interrupted after 5 generations, with a checkpoint every 5
+    scheduler = make_scheduler("small", **options)
+    scheduler.evolve(scheduler.generate_initial_population(), generations=5, stopping=stopping,
+                     checkpoint_path=path, checkpoint_every=5)
+    resumed = make_scheduler("small", **options)
+    best = resumed.evolve([], generations=15, stopping=stopping, resume=Checkpoint.load(path))
+    
+    assert _outcome(resumed, best) == uninterrupted
+
+def test_checkpointing_does_not_change_the_run(make_scheduler, tmp_path):
+    outcomes = []
+    for checkpoint_every in (0, 3):
+        scheduler = make_scheduler("small", mutation_rate=0.5)
+        best = scheduler.evolve(scheduler.generate_initial_population(), generations=10,
+                                checkpoint_path=str(tmp_path / "run.npz"), checkpoint_every=checkpoint_every)
+        outcomes.append(_outcome(scheduler, best))
+    
+    assert outcomes[0] == outcomes[1]
+
+def test_failed_save_keeps_previous_checkpoint(make_scheduler, tmp_path, monkeypatch):
+    path = tmp_path / "run.npz"
+    scheduler = make_scheduler()
+    scheduler.evolve(scheduler.generate_initial_population(), generations=4,
+                     checkpoint_path=str(path), checkpoint_every=2)
+    saved = path.read_bytes()
+    checkpoint = Checkpoint.load(str(path))
+    
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(np, "savez_compressed", fail)
+    checkpoint.generation += 1
+    with pytest.raises(OSError):
+        checkpoint.save(str(path))
+    
+    assert path.read_bytes() == saved
+    assert os.listdir(tmp_path) == ["run.npz"]
+    assert Checkpoint.load(str(path)).generation == checkpoint.generation - 1
\ No newline at end of file
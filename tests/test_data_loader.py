@@ -0,0 +1,138 @@
+import csv
+import shutil
+from pathlib import Path
+import pytest
+from generators.faculty_generator import FacultyGenerator, FacultyProfile
+from models.subject import Subject
+from models.lecturer import Lecturer, LecturerConstraints
+from models.group import Group
+from models.classroom import Classroom
+from utils.data_loader import load_data
+
+INPUT_DIR = Path(__file__).resolve().parent.parent / "input"
+
+def _reference_load(input_dir: Path):
+    """The row-by-row CSV loader that load_data replaced, for well-formed inputs."""
+    def rows(name):
+        with open(input_dir / f"{name}.csv", newline="") as f:
+            return list(csv.DictReader(f))
+    
+    subjects = {}
+    for row in rows("subjects"):
+        subjects[row["subject_id"]] = Subject(
+            subject_id=row["subject_id"],
+            name=row["name"],
+            lecture_hours=int(row["lecture_hours"]),
+            practical_hours=int(row["practical_hours"]),
+            requires_subgroups=row["requires_subgroups"].lower() == "true"
+        )
+    
+    lecturers = []
+    for row in rows("lecturers"):
+        lecturer = Lecturer(lecturer_id=row["lecturer_id"], name=row["name"])
+        can_lecture = row["can_lecture"].split(";")
+        can_practice = row["can_practice"].split(";")
+        max_hours = row["max_hours"].split(";")
+        for i, subject_id in enumerate(row["subjects"].split(";")):
+            if subject_id in subjects:
+                lecturer.add_subject_constraint(subject_id, LecturerConstraints(
+                    can_lecture=can_lecture[i].lower() == "true",
+                    can_practice=can_practice[i].lower() == "true",
+                    max_hours_per_week=int(max_hours[i])
+                ))
+        lecturers.append(lecturer)
+    
+    groups = []
+    for row in rows("groups"):
+        group = Group(group_id=row["group_id"], name=row["name"], student_count=int(row["student_count"]))
+        for subject_id in row["subjects"].split(";"):
+            if subject_id in subjects:
+                group.add_subject(subjects[subject_id])
+        if row["subgroups"]:
+            group.create_subgroups(int(row["subgroups"]))
+        groups.append(group)
+    
+    classrooms = [
+        Classroom(
+            classroom_id=row["classroom_id"],
+            name=row["name"],
+            capacity=int(row["capacity"]),
+            is_lab=row["is_lab"].lower() == "true",
+            building=row["building"],
+            floor=int(row["floor"]) if row["floor"] else None
+        )
+        for row in rows("classrooms")
+    ]
+    return list(subjects.values()), lecturers, groups, classrooms
+
+def _content(subjects, lecturers, groups, classrooms):
+    """Comparable content of loaded entities."""
+    return (
+        [vars(subject) for subject in subjects],
+        [(l.lecturer_id, l.name, {k: vars(v) for k, v in l.subject_constraints.items()}) for l in lecturers],
+        [(g.group_id, g.name, g.student_count, list(g.subjects), g.subgroups) for g in groups],
+        [vars(classroom) for classroom in classrooms]
+    )
+
+@pytest.fixture
+def faculty_dir(tmp_path: Path) -> Path:
+    input_dir = tmp_path / "faculty"
+    FacultyGenerator(FacultyProfile.for_groups(200), seed=1).write_csv(str(input_dir))
+    return input_dir
+
+@pytest.mark.parametrize("input_dir", ["repo", "faculty"])
+def test_load_data_matches_reference_loader(request, tmp_path, input_dir):
+    path = INPUT_DIR if input_dir == "repo" else request.getfixturevalue("faculty_dir")
+    data = load_data(str(path), cache_dir=str(tmp_path / "cache"))
+    
+    assert data.report.is_valid, [str(issue) for issue in data.report.issues]
+    assert _content(data.subjects, data.lecturers, data.groups, data.classrooms) == _content(*_reference_load(path))
+
+def test_cached_load_matches_parsed_load(faculty_dir, tmp_path):
+    cache_dir = tmp_path / "cache"
+    parsed = load_data(str(faculty_dir), cache_dir=str(cache_dir))
+    cached = load_data(str(faculty_dir), cache_dir=str(cache_dir))
+    
+    assert not parsed.from_cache and cached.from_cache
+    assert _content(cached.subjects, cached.lecturers, cached.groups, cached.classrooms) == \
+        _content(parsed.subjects, parsed.lecturers, parsed.groups, parsed.classrooms)
+    assert sorted(path.name for path in faculty_dir.iterdir()) == \
+        ["classrooms.csv", "groups.csv", "lecturers.csv", "subjects.csv"]
+
+def test_changed_input_replaces_only_its_own_cache(faculty_dir, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_data(str(INPUT_DIR), cache_dir=str(cache_dir))
+    load_data(str(faculty_dir), cache_dir=str(cache_dir))
+    with open(faculty_dir / "classrooms.csv", "a") as f:
+        f.write("\n")
+    
+    assert not load_data(str(faculty_dir), cache_dir=str(cache_dir)).from_cache
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+    assert load_data(str(INPUT_DIR), cache_dir=str(cache_dir)).from_cache
+
+def test_default_cache_is_in_the_user_cache_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    load_data(str(INPUT_DIR))
+    
+    assert load_data(str(INPUT_DIR)).from_cache
+    assert list((tmp_path / "university-scheduler").glob("*.pickle"))
+
+def test_unwritable_cache_is_skipped(tmp_path):
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory")
+    
+    data = load_data(str(INPUT_DIR), cache_dir=str(blocker))
+    assert not data.from_cache and data.report.is_valid
+
+def test_bad_values_are_reported(tmp_path):
+    input_dir = tmp_path / "input"
+    shutil.copytree(INPUT_DIR, input_dir)
+    subjects = (input_dir / "subjects.csv").read_text().splitlines()
+    subject_id, name, _, *rest = subjects[1].split(",")
+    subjects[1] = ",".join([subject_id, name, "x", *rest])
+    (input_dir / "subjects.csv").write_text("\n".join(subjects) + "\n")
+    
+    data = load_data(str(input_dir), use_cache=False)
+    issue = data.report.issues[0]
+    assert (issue.file, issue.row, issue.column) == ("subjects", 1, "lecture_hours")
+    assert subject_id not in {subject.subject_id for subject in data.subjects}
\ No newline at end of file
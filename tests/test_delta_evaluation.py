@@ -0,0 +1,69 @@
+import random
+import pytest
+
+@pytest.mark.parametrize("legacy_scoring", [False, True])
+def test_evaluate_move_matches_full_evaluation(make_scheduler, legacy_scoring):
+    scheduler = make_scheduler("medium", legacy_scoring=legacy_scoring)
+    evaluator = scheduler.evaluator
+    rng = random.Random(0)
+    
+    for schedule in scheduler.generate_initial_population():
+        breakdown = evaluator.breakdown(schedule)
+        for _ in range(20):
+            slot, entry = rng.choice(schedule.sorted_entries())
+            new_slot = rng.choice(scheduler.time_grid.slots)
+            if new_slot == slot:
+                continue
+            schedule.move_entry(entry, slot, new_slot)
+            
+            moved = evaluator.evaluate_move(schedule, breakdown, entry, slot, new_slot)
+            full = evaluator.breakdown(schedule)
+            assert moved.is_valid == full.is_valid
+            if not full.is_valid:
+                # Penalties of invalid schedules are not updated
+                schedule.move_entry(entry, new_slot, slot)
+                continue
+            
+            assert moved.total_penalty == pytest.approx(full.total_penalty)
+            assert moved.score == pytest.approx(full.score)
+            breakdown = moved
+
+def test_removing_an_entry_matches_full_evaluation(make_scheduler):
+    scheduler = make_scheduler("medium")
+    evaluator = scheduler.evaluator
+    
+    for schedule in scheduler.generate_initial_population():
+        breakdown = evaluator.breakdown(schedule)
+        slot, entry = schedule.sorted_entries()[0]
+        schedule.remove_entry(slot, entry)
+        
+        removed = evaluator.evaluate_move(schedule, breakdown, entry, slot, None)
+        assert removed.total_penalty == pytest.approx(evaluator.breakdown(schedule).total_penalty)
+
+def test_evaluate_moves_matches_full_evaluation_of_swaps(make_scheduler):
+    scheduler = make_scheduler("medium")
+    evaluator = scheduler.evaluator
+    schedule = scheduler.generate_initial_population()[0]
+    breakdown = evaluator.breakdown(schedule)
+    rng = random.Random(0)
+    
+    swaps = 0
+    while swaps < 10:
+        (slot1, entry1), (slot2, entry2) = rng.sample(schedule.sorted_entries(), 2)
+        if slot1 == slot2:
+            continue
+        moves = [(entry1, slot1, slot2), (entry2, slot2, slot1)]
+        schedule.move_entry(entry1, slot1, slot2)
+        schedule.move_entry(entry2, slot2, slot1)
+        
+        swapped = evaluator.evaluate_moves(schedule, breakdown, moves)
+        full = evaluator.breakdown(schedule)
+        assert swapped.is_valid == full.is_valid
+        if not full.is_valid:
+            schedule.move_entry(entry1, slot2, slot1)
+            schedule.move_entry(entry2, slot1, slot2)
+            continue
+        
+        assert swapped.total_penalty == pytest.approx(full.total_penalty)
+        breakdown = swapped
+        swaps += 1
\ No newline at end of file
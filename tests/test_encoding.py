@@ -0,0 +1,49 @@
+import random
+from dataclasses import replace
+import numpy as np
+import pytest
+from models.schedule import Schedule
+
+def test_round_trip_keeps_canonical_hash(make_scheduler):
+    scheduler = make_scheduler("medium")
+    encoder = scheduler.encoder
+    
+    for schedule in scheduler.generate_initial_population():
+        encoded = encoder.encode(schedule)
+        decoded = encoder.decode(encoded)
+        assert decoded.canonical_hash() == schedule.canonical_hash()
+        assert np.array_equal(encoder.encode(decoded).genes, encoded.genes)
+
+def test_round_trip_keeps_missing_and_surplus_classes(make_scheduler):
+    scheduler = make_scheduler("medium")
+    encoder = scheduler.encoder
+    rng = random.Random(0)
+    
+    for schedule in scheduler.generate_initial_population():
+        entries = schedule.sorted_entries()
+        for slot, entry in rng.sample(entries, 3):
+            schedule.remove_entry(slot, entry)
+        for _, entry in rng.sample(entries, 3):
+            schedule.add_entry(rng.choice(scheduler.time_grid.slots), entry)
+        
+        assert encoder.decode(encoder.encode(schedule)).canonical_hash() == schedule.canonical_hash()
+
+def test_encoding_does_not_depend_on_entry_order(make_scheduler):
+    scheduler = make_scheduler()
+    schedule = scheduler.generate_initial_population()[0]
+    reversed_schedule = Schedule()
+    for slot, entry in reversed(schedule.sorted_entries()):
+        reversed_schedule.add_entry(slot, entry)
+    
+    assert np.array_equal(scheduler.encoder.encode(reversed_schedule).genes,
+                          scheduler.encoder.encode(schedule).genes)
+
+def test_entries_of_several_groups_cannot_be_encoded(make_scheduler):
+    scheduler = make_scheduler()
+    schedule = scheduler.generate_initial_population()[0]
+    slot, entry = schedule.sorted_entries()[0]
+    schedule.remove_entry(slot, entry)
+    schedule.add_entry(slot, replace(entry, groups=scheduler.groups[:2]))
+    
+    with pytest.raises(ValueError):
+        scheduler.encoder.encode(schedule)
\ No newline at end of file
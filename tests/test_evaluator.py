@@ -0,0 +1,39 @@
+import pytest
+from algorithms.constraints import ScheduleConstraints
+from algorithms.evaluator import ScheduleEvaluator
+
+@pytest.mark.parametrize("size", ["small", "medium"])
+def test_legacy_scoring_matches_calculate_quality_score(make_scheduler, size):
+    scheduler = make_scheduler(size)
+    evaluator = ScheduleEvaluator(legacy_scoring=True, time_grid=scheduler.time_grid)
+    population = scheduler.generate_initial_population()
+    
+    for schedule in population:
+        expected = ScheduleConstraints.calculate_quality_score(schedule, scheduler.time_grid)
+        assert evaluator.calculate_score(schedule) == pytest.approx(expected)
+
+def test_default_scoring_reports_the_legacy_violations_once(make_scheduler):
+    scheduler = make_scheduler("medium")
+    legacy = ScheduleEvaluator(legacy_scoring=True, time_grid=scheduler.time_grid)
+    evaluator = ScheduleEvaluator(time_grid=scheduler.time_grid)
+    
+    for schedule in scheduler.generate_initial_population():
+        violations = evaluator.evaluate(schedule).violations
+        legacy_violations = legacy.evaluate(schedule).violations
+        assert {v.description for v in violations} == {v.description for v in legacy_violations}
+        assert len(violations) <= len(legacy_violations)
+        assert evaluator.calculate_score(schedule) >= legacy.calculate_score(schedule)
+
+def test_invalid_schedule_scores_zero(make_scheduler):
+    scheduler = make_scheduler()
+    schedule = scheduler.generate_initial_population()[0]
+    evaluator = ScheduleEvaluator(legacy_scoring=True, time_grid=scheduler.time_grid)
+    
+    # Put two entries of the same lecturer in one slot
+    (slot, entry), *others = schedule.sorted_entries()
+    other_slot = next(other for other, e in others if e.lecturer == entry.lecturer and other != slot)
+    schedule.move_entry(entry, slot, other_slot)
+    
+    assert not schedule.validate_hard_constraints()
+    assert evaluator.calculate_score(schedule) == 0.0
+    assert ScheduleConstraints.calculate_quality_score(schedule, scheduler.time_grid) == 0.0
\ No newline at end of file
@@ -0,0 +1,106 @@
+import pytest
+from models.schedule import TimeSlot
+from models.time_grid import TimeGrid
+from utils.exporter import ENTRY_COLUMNS, VIEWS, build_export, write_csv
+from utils.formatter import format_schedule_by_classroom, format_schedule_by_group, format_schedule_by_lecturer
+
+# Not the default 5 days of 4 periods, so Saturday and a fifth period are used
+TIME_GRID = TimeGrid(days=6, periods_per_day=5)
+
+@pytest.fixture
+def scheduled(make_scheduler):
+    """A valid medium schedule on TIME_GRID and its scheduler."""
+    scheduler = make_scheduler("medium", population_size=2, elite_size=1, time_grid=TIME_GRID)
+    return scheduler, scheduler.generate_initial_population()[0]
+
+def _owners(view, entry):
+    return {"group": entry.groups, "lecturer": [entry.lecturer], "classroom": [entry.classroom]}[view]
+
+def test_entries_are_listed_by_day_and_period(scheduled):
+    _, schedule = scheduled
+    export = build_export(schedule, TIME_GRID)
+    
+    assert export.days == TIME_GRID.day_names == ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+    expected = sorted(
+        (slot.day, slot.period + 1, entry.subject.name, entry.lecturer.name, entry.classroom.name)
+        for slot, entry in schedule.sorted_entries()
+    )
+    rows = [(export.days.index(row[0]), int(row[1].split()[1]), row[2], row[4], row[6]) for row in export.entries]
+    assert sorted(rows) == expected
+    assert [row[:2] for row in rows] == sorted(row[:2] for row in rows)
+    assert all(len(row) == len(ENTRY_COLUMNS) for row in export.entries)
+    assert dict(export.statistics)["Total Time Slots"] == 30
+
+@pytest.mark.parametrize("view", VIEWS)
+def test_timetables_hold_the_classes_of_their_owner(scheduled, view):
+    _, schedule = scheduled
+    export = build_export(schedule, TIME_GRID, views=[view])
+    assert list(export.timetables) == [view]
+    
+    # Without a given list, everyone with a class gets a timetable, by name
+    owners = {owner.name: owner for _, entry in schedule.sorted_entries() for owner in _owners(view, entry)}
+    timetables = export.timetables[view]
+    assert [timetable.name for timetable in timetables] == sorted(owners)
+    
+    for timetable in timetables:
+        owner = owners[timetable.name]
+        assert len(timetable.cells) == TIME_GRID.periods_per_day
+        assert all(len(cells) == TIME_GRID.days for cells in timetable.cells)
+        busy = set()
+        for period, cells in enumerate(timetable.cells):
+            for day, entry in enumerate(cells):
+                if entry is not None:
+                    assert entry in schedule.entries[TimeSlot(day, period)]
+                    assert owner in _owners(view, entry)
+                    busy.add((day, period))
+        assert busy == {(slot.day, slot.period) for slot, entry in schedule.sorted_entries()
+                        if owner in _owners(view, entry)}
+        
+        rows = timetable.rows(export.days)
+        assert rows[0] == ["Time"] + export.days
+        assert [row[0] for row in rows[1:]] == [f"Period {period}" for period in range(1, 6)]
+
+def test_given_owners_keep_their_order(scheduled):
+    scheduler, schedule = scheduled
+    groups = list(reversed(scheduler.groups))
+    export = build_export(schedule, TIME_GRID, groups=groups, lecturers=[], views=["group", "lecturer"])
+    
+    assert [timetable.name for timetable in export.timetables["group"]] == [group.name for group in groups]
+    assert export.timetables["lecturer"] == []
+
+def test_unknown_view_is_rejected(scheduled):
+    _, schedule = scheduled
+    with pytest.raises(ValueError):
+        build_export(schedule, TIME_GRID, views=["room"])
+
+def test_csv_files_do_not_depend_on_workers(scheduled, tmp_path):
+    _, schedule = scheduled
+    export = build_export(schedule, TIME_GRID)
+    
+    contents = []
+    for workers in (None, 4):
+        output_path = tmp_path / f"workers-{workers}"
+        output_path.mkdir()
+        write_csv(export, output_path, workers)
+        contents.append({path.name: path.read_bytes() for path in output_path.iterdir()})
+    
+    assert contents[0] == contents[1]
+    timetables = sum(len(timetables) for timetables in export.timetables.values())
+    assert len(contents[0]) == 2 + timetables
+    assert {"schedule.csv", "statistics.csv"} <= set(contents[0])
+
+@pytest.mark.parametrize("format_table, owners", [
+    (format_schedule_by_group, lambda scheduler: scheduler.groups),
+    (format_schedule_by_lecturer, lambda scheduler: scheduler.lecturers),
+    (format_schedule_by_classroom, lambda scheduler: scheduler.classrooms)
+])
+def test_console_tables_follow_the_time_grid(scheduled, format_table, owners):
+    scheduler, schedule = scheduled
+    saturday_classes = 0
+    for owner in owners(scheduler):
+        table = format_table(schedule, owner, TIME_GRID)
+        assert [column.header for column in table.columns] == ["Time"] + TIME_GRID.day_names
+        assert list(table.columns[0].cells) == TIME_GRID.period_names
+        saturday_classes += sum("No class" not in cell for cell in table.columns[6].cells)
+    
+    assert saturday_classes > 0
\ No newline at end of file
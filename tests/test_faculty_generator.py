@@ -0,0 +1,65 @@
+from collections import defaultdict
+from generators.faculty_generator import FacultyGenerator, FacultyProfile
+from models.time_grid import TimeGrid
+from utils.data_loader import load_data
+
+def _generator(seed=1, groups=60):
+    return FacultyGenerator(FacultyProfile.for_groups(groups), seed=seed, time_grid=TimeGrid(days=5, periods_per_day=6))
+
+def _key(subjects, lecturers, groups, classrooms):
+    """Comparable content of an instance."""
+    return (
+        [(s.subject_id, s.lecture_hours, s.practical_hours, s.requires_subgroups) for s in subjects],
+        [(l.lecturer_id, sorted((sid, c.can_lecture, c.can_practice, c.max_hours_per_week)
+                                for sid, c in l.subject_constraints.items())) for l in lecturers],
+        [(g.group_id, g.student_count, sorted(g.subjects), len(g.subgroups)) for g in groups],
+        [(c.classroom_id, c.capacity, c.is_lab) for c in classrooms]
+    )
+
+def test_written_csv_loads_as_the_generated_instance(tmp_path):
+    counts = _generator().write_csv(str(tmp_path))
+    data = load_data(str(tmp_path), use_cache=False)
+    instance = _generator().generate()
+    
+    assert data.report.is_valid, [str(issue) for issue in data.report.issues]
+    assert _key(data.subjects, data.lecturers, data.groups, data.classrooms) == _key(*instance)
+    assert counts == {"subjects": len(instance[0]), "lecturers": len(instance[1]),
+                      "groups": len(instance[2]), "classrooms": len(instance[3])}
+
+def test_same_seed_writes_the_same_files(tmp_path):
+    for name in ("first", "second"):
+        _generator().write_csv(str(tmp_path / name))
+    
+    for file in ("subjects.csv", "lecturers.csv", "groups.csv", "classrooms.csv"):
+        assert (tmp_path / "first" / file).read_bytes() == (tmp_path / "second" / file).read_bytes()
+
+def test_instance_has_a_realistic_structure():
+    generator = _generator(groups=200)
+    subjects, lecturers, groups, classrooms = generator.generate()
+    
+    assert 150 <= len(groups) <= 250
+    
+    # Groups of a cohort (same faculty, programme and year) follow one curriculum
+    cohorts = defaultdict(set)
+    for group in groups:
+        cohorts[group.group_id.rsplit("G", 1)[0]].add(tuple(sorted(group.subjects)))
+    assert all(len(curricula) == 1 for curricula in cohorts.values())
+    
+    # Qualified lecturers have the hours to teach every lecture and practical
+    subject_ids = {subject.subject_id for subject in subjects}
+    demand = defaultdict(float)
+    for group in groups:
+        assert set(group.subjects) <= subject_ids
+        for subject in group.subjects.values():
+            demand[(subject.subject_id, True)] += subject.lecture_hours * generator.time_grid.slot_hours
+            demand[(subject.subject_id, False)] += subject.practical_hours * generator.time_grid.slot_hours
+    for (subject_id, is_lecture), hours in demand.items():
+        assert sum(l.subject_constraints[subject_id].max_hours_per_week for l in lecturers
+                   if l.can_teach_subject(subject_id, is_lecture)) >= hours
+    
+    # Every group fits in a classroom, and in a lab when one of its lectures needs it
+    for group in groups:
+        assert any(c.can_accommodate(group.student_count) for c in classrooms)
+        if any(subject.requires_subgroups for subject in group.subjects.values()):
+            assert group.subgroups
+            assert any(c.is_lab and c.can_accommodate(group.student_count) for c in classrooms)
\ No newline at end of file
@@ -0,0 +1,27 @@
+import numpy as np
+from algorithms import parallel
+from algorithms.island import IslandScheduler, _island_epoch
+
+def test_island_epoch_does_not_depend_on_earlier_epochs(make_scheduler, monkeypatch):
+    scheduler = make_scheduler(mutation_rate=0.5)
+    monkeypatch.setattr(parallel, "_worker_scheduler", None)
+    parallel._init_worker(scheduler.subjects, scheduler.lecturers, scheduler.groups, scheduler.classrooms,
+                          scheduler.worker_options())
+    
+    # A worker process runs the same island twice, as it may run several islands
+    first = _island_epoch(None, 5, 11)
+    second = _island_epoch(None, 5, 11)
+    
+    assert all(np.array_equal(a, b) for a, b in zip(first[0], second[0]))
+    assert first[1:] == second[1:]
+
+def test_island_runs_are_deterministic(make_scheduler):
+    runs = []
+    for _ in range(2):
+        base = make_scheduler(mutation_rate=0.5)
+        scheduler = IslandScheduler(base.subjects, base.lecturers, base.groups, base.classrooms,
+                                    islands=3, migration_interval=3, population_size=6, elite_size=1, seed=7)
+        best = scheduler.evolve(generations=6)
+        runs.append((best.canonical_hash(), scheduler.best_fitness_history, scheduler.evaluations))
+    
+    assert runs[0] == runs[1]
\ No newline at end of file
@@ -0,0 +1,36 @@
+import pytest
+from generators.mock_data import generate_mock_data
+from algorithms.local_search import LocalSearchScheduler, METHODS
+
+def _scheduler(method):
+    return LocalSearchScheduler(*generate_mock_data("medium"), method=method, seed=7)
+
+@pytest.mark.parametrize("method", METHODS)
+def test_search_improves_a_valid_schedule(method):
+    scheduler = _scheduler(method)
+    initial = scheduler._generate_random_schedule()
+    initial_hash = initial.canonical_hash()
+    initial_fitness = scheduler.evaluator.breakdown(initial).score
+    
+    best = scheduler.search(initial, iterations=300)
+    
+    assert initial.canonical_hash() == initial_hash
+    assert best.validate_hard_constraints()
+    assert scheduler.best_fitness > initial_fitness
+    assert scheduler.evaluator.breakdown(best).score == pytest.approx(scheduler.best_fitness)
+    assert len(scheduler.best_fitness_history) == scheduler.iterations_done == 300
+    assert scheduler.best_fitness_history == sorted(scheduler.best_fitness_history)
+
+@pytest.mark.parametrize("method", METHODS)
+def test_search_is_deterministic(method):
+    results = []
+    for _ in range(2):
+        scheduler = _scheduler(method)
+        best = scheduler.search(iterations=100)
+        results.append((best.canonical_hash(), scheduler.best_fitness_history))
+    
+    assert results[0] == results[1]
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        _scheduler("hill-climbing")
\ No newline at end of file
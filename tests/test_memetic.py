@@ -0,0 +1,41 @@
+import pytest
+
+def _scored_population(scheduler):
+    population = scheduler.generate_initial_population()
+    breakdowns = {}
+    fitness = scheduler._evaluate_population(population, breakdowns)
+    population_fitness = sorted(zip(population, fitness), key=lambda x: x[1], reverse=True)
+    scheduler.best_fitness = population_fitness[0][1]
+    scheduler.best_schedule = population_fitness[0][0].copy()
+    return population_fitness, breakdowns
+
+def test_polish_elites_leaves_its_inputs_unchanged(make_scheduler):
+    scheduler = make_scheduler("medium", memetic_budget=400)
+    population_fitness, breakdowns = _scored_population(scheduler)
+    schedules = [schedule for schedule, _ in population_fitness]
+    hashes = [schedule.canonical_hash() for schedule in schedules]
+    best_fitness = scheduler.best_fitness
+    
+    scheduler._polish_elites(population_fitness, breakdowns)
+    
+    assert [schedule.canonical_hash() for schedule in schedules] == hashes
+    assert scheduler.memetic_stats.improvements > 0
+    assert scheduler.best_fitness > best_fitness
+    assert population_fitness[0][1] == scheduler.best_fitness
+    assert [fitness for _, fitness in population_fitness] == sorted(
+        (fitness for _, fitness in population_fitness), reverse=True)
+    
+    # Polished elites are new, valid schedules scored as a full evaluation would
+    polished = [schedule for schedule, _ in population_fitness if all(schedule is not s for s in schedules)]
+    assert polished
+    for schedule, fitness in population_fitness:
+        assert schedule.validate_hard_constraints()
+        assert scheduler.evaluator.breakdown(schedule).score == pytest.approx(fitness)
+
+def test_polish_elites_spends_at_most_the_budget(make_scheduler):
+    scheduler = make_scheduler("medium", memetic_budget=10)
+    population_fitness, breakdowns = _scored_population(scheduler)
+    
+    scheduler._polish_elites(population_fitness, breakdowns)
+    
+    assert 0 < scheduler.memetic_stats.evaluations <= 10
\ No newline at end of file
@@ -0,0 +1,39 @@
+from models.schedule import Schedule, ScheduleEntry, TimeSlot
+from models.time_grid import TimeGrid
+
+def test_repair_re_slots_an_entry_shared_by_several_groups(make_scheduler):
+    # One day of four periods leaves a single way to place every entry
+    scheduler = make_scheduler("medium", time_grid=TimeGrid(days=1))
+    first, second = sorted(scheduler.groups, key=lambda g: g.student_count)[:2]
+    rooms = sorted(scheduler.classrooms, key=lambda c: c.capacity, reverse=True)
+    lecturers = scheduler.lecturers
+    subject = scheduler.subjects[0]
+    
+    # A lecture for both groups clashes with a class of the second group,
+    # which is also busy next to the class of the first group. The lecture
+    # sorts last in its slot, so it is the entry reported and re-slotted
+    shared = ScheduleEntry(subject, lecturers[3], rooms[0], [first, second])
+    schedule = Schedule()
+    schedule.add_entry(TimeSlot(0, 0), shared)
+    schedule.add_entry(TimeSlot(0, 0), ScheduleEntry(subject, lecturers[0], rooms[1], [second]))
+    schedule.add_entry(TimeSlot(0, 1), ScheduleEntry(subject, lecturers[1], rooms[2], [first]))
+    schedule.add_entry(TimeSlot(0, 2), ScheduleEntry(subject, lecturers[2], rooms[3], [second]))
+    assert not scheduler.validator.is_valid(schedule)
+    
+    assert scheduler._repair(schedule)
+    assert schedule.validate_hard_constraints()
+    assert len(schedule.sorted_entries()) == 4
+    assert [entry.groups for entry in schedule.entries[TimeSlot(0, 3)]] == [[first, second]]
+
+def test_offspring_attempts_are_bounded(make_scheduler):
+    scheduler = make_scheduler(mutation_rate=1.0, repair_offspring=False, max_offspring_attempts=4)
+    population = scheduler.generate_initial_population()
+    scheduler.evolve(population, generations=5)
+    stats = scheduler.offspring_stats
+    
+    # Once the budget of a generation is spent, clones fill the population
+    assert stats.attempts <= 4 * 5
+    assert stats.filled > 0
+    assert stats.repaired == 0
+    assert len(scheduler.final_population) == scheduler.population_size
+    assert all(schedule.validate_hard_constraints() for schedule in scheduler.final_population)
\ No newline at end of file
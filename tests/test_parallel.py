@@ -0,0 +1,21 @@
+import pytest
+
+def _run(make_scheduler, workers, parallel_offspring):
+    scheduler = make_scheduler("small", workers=workers, parallel_offspring=parallel_offspring, mutation_rate=0.5)
+    population = scheduler.generate_initial_population()
+    initial = [schedule.canonical_hash() for schedule in population]
+    best = scheduler.evolve(population, generations=10)
+    return (initial, best.canonical_hash(), scheduler.best_fitness_history,
+            scheduler.evaluations, scheduler.fitness_cache.hits)
+
+@pytest.mark.parametrize("parallel_offspring", [False, True])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_same_seed_gives_same_result_for_any_worker_count(make_scheduler, workers, parallel_offspring):
+    assert _run(make_scheduler, workers, parallel_offspring) == _run(make_scheduler, None, parallel_offspring)
+
+def test_different_seeds_give_different_populations(make_scheduler):
+    hashes = [
+        {schedule.canonical_hash() for schedule in make_scheduler(seed=seed).generate_initial_population()}
+        for seed in (1, 2)
+    ]
+    assert hashes[0] != hashes[1]
\ No newline at end of file
@@ -0,0 +1,93 @@
+import random
+import pytest
+from models.schedule import Schedule, ScheduleEntry, TimeSlot
+
+def _expected_indexes(schedule):
+    """Occupancy of a schedule recomputed from its entries."""
+    lecturers, groups, classrooms = {}, {}, {}
+    slot_lecturers, slot_groups, slot_classrooms = {}, {}, {}
+    for slot, entries in schedule.entries.items():
+        for entry in entries:
+            lecturers.setdefault(entry.lecturer, set()).add(slot)
+            classrooms.setdefault(entry.classroom, set()).add(slot)
+            slot_lecturers.setdefault(slot, set()).add(entry.lecturer)
+            slot_classrooms.setdefault(slot, set()).add(entry.classroom)
+            for group in entry.groups:
+                groups.setdefault(group, set()).add(slot)
+                slot_groups.setdefault(slot, set()).add(group)
+    return lecturers, groups, classrooms, slot_lecturers, slot_groups, slot_classrooms
+
+def _assert_indexes_match(schedule, scheduler):
+    lecturers, groups, classrooms, slot_lecturers, slot_groups, slot_classrooms = _expected_indexes(schedule)
+    for lecturer in scheduler.lecturers:
+        assert set(schedule.get_lecturer_slots(lecturer)) == lecturers.get(lecturer, set())
+    for group in scheduler.groups:
+        assert set(schedule.get_group_slots(group)) == groups.get(group, set())
+    for classroom in scheduler.classrooms:
+        assert set(schedule.get_classroom_slots(classroom)) == classrooms.get(classroom, set())
+    for slot in scheduler.time_grid.slots:
+        assert set(schedule.get_slot_lecturers(slot)) == slot_lecturers.get(slot, set())
+        assert set(schedule.get_slot_groups(slot)) == slot_groups.get(slot, set())
+        assert set(schedule.get_slot_classrooms(slot)) == slot_classrooms.get(slot, set())
+
+def test_indexes_follow_add_remove_and_move(make_scheduler):
+    scheduler = make_scheduler()
+    schedule = scheduler.generate_initial_population()[0]
+    rng = random.Random(0)
+    
+    for _ in range(30):
+        slot, entry = rng.choice(schedule.sorted_entries())
+        action = rng.choice(["move", "remove", "add"])
+        if action == "move":
+            schedule.move_entry(entry, slot, rng.choice(scheduler.time_grid.slots))
+        elif action == "remove":
+            schedule.remove_entry(slot, entry)
+        else:
+            schedule.add_entry(rng.choice(scheduler.time_grid.slots), entry)
+        _assert_indexes_match(schedule, scheduler)
+
+def test_copies_do_not_change_each_other(make_scheduler):
+    scheduler = make_scheduler()
+    schedule = scheduler.generate_initial_population()[0]
+    before = schedule.canonical_hash()
+    clone = schedule.copy()
+    
+    slot, entry = clone.sorted_entries()[0]
+    clone.move_entry(entry, slot, TimeSlot(slot.day, (slot.period + 1) % scheduler.time_grid.periods_per_day))
+    clone.remove_entry(*clone.sorted_entries()[-1])
+    
+    schedule.clear_caches()
+    assert schedule.canonical_hash() == before
+    _assert_indexes_match(schedule, scheduler)
+    _assert_indexes_match(clone, scheduler)
+
+def test_views_handed_out_stay_live(make_scheduler):
+    scheduler = make_scheduler()
+    subject, lecturer, classroom, group = (
+        scheduler.subjects[0], scheduler.lecturers[0], scheduler.classrooms[0], scheduler.groups[0]
+    )
+    entry = ScheduleEntry(subject, lecturer, classroom, [group])
+    slot = TimeSlot(0, 0)
+    schedule = Schedule()
+    views = [
+        schedule.get_lecturer_slots(lecturer), schedule.get_group_slots(group),
+        schedule.get_classroom_slots(classroom)
+    ]
+    slot_views = [
+        schedule.get_slot_lecturers(slot), schedule.get_slot_groups(slot), schedule.get_slot_classrooms(slot)
+    ]
+    
+    schedule.add_entry(slot, entry)
+    assert [list(view) for view in views] == [[slot]] * 3
+    assert [list(view) for view in slot_views] == [[lecturer], [group], [classroom]]
+    
+    schedule.move_entry(entry, slot, TimeSlot(1, 2))
+    assert [list(view) for view in views] == [[TimeSlot(1, 2)]] * 3
+    assert all(not view for view in slot_views)
+
+def test_removing_a_missing_entry_raises(make_scheduler):
+    scheduler = make_scheduler()
+    schedule = scheduler.generate_initial_population()[0]
+    
+    with pytest.raises(ValueError):
+        schedule.remove_entry(TimeSlot(99, 99), schedule.sorted_entries()[0][1])
\ No newline at end of file
@@ -0,0 +1,39 @@
+import pytest
+from algorithms.genetic import STOP_REASONS, StoppingCriteria
+
+@pytest.mark.parametrize("criteria, expected", [
+    (StoppingCriteria(), None),
+    (StoppingCriteria(target_fitness=50.0), "target_fitness"),
+    (StoppingCriteria(target_fitness=60.0), None),
+    (StoppingCriteria(patience=3), "patience"),
+    (StoppingCriteria(patience=4), None),
+    (StoppingCriteria(time_limit=10.0), "time_limit"),
+    (StoppingCriteria(time_limit=10.5), None),
+    (StoppingCriteria(max_evaluations=100), "max_evaluations"),
+    (StoppingCriteria(max_evaluations=101), None),
+    (StoppingCriteria(target_fitness=50.0, patience=3, time_limit=10.0, max_evaluations=100), "target_fitness"),
+    (StoppingCriteria(patience=3, time_limit=10.0, max_evaluations=100), "patience"),
+    (StoppingCriteria(time_limit=10.0, max_evaluations=100), "time_limit"),
+])
+def test_reason(criteria, expected):
+    assert criteria.reason(best_fitness=50.0, stale_generations=3, seconds=10.0, evaluations=100) == expected
+
+@pytest.mark.parametrize("stopping, expected", [
+    (None, "generations"),
+    (StoppingCriteria(target_fitness=0.0), "target_fitness"),
+    (StoppingCriteria(patience=1), "patience"),
+    (StoppingCriteria(time_limit=0.0), "time_limit"),
+    (StoppingCriteria(max_evaluations=1), "max_evaluations"),
+])
+def test_evolve_records_why_it_stopped(make_scheduler, stopping, expected):
+    scheduler = make_scheduler(mutation_rate=0.5)
+    best = scheduler.evolve(scheduler.generate_initial_population(), generations=30, stopping=stopping)
+    result = scheduler.result
+    
+    assert expected in STOP_REASONS
+    assert result.stop_reason == expected
+    assert (result.generations == 30) == (expected == "generations")
+    assert result.generations == len(result.best_fitness_history)
+    assert result.best_schedule is best
+    assert result.best_fitness == scheduler.best_fitness
+    assert result.evaluations == scheduler.evaluations
\ No newline at end of file
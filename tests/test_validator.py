@@ -0,0 +1,65 @@
+import random
+from models.schedule import Schedule, ScheduleEntry, TimeSlot
+
+def _schedules(scheduler, count=30):
+    """Valid schedules of a population and invalid ones made by moving entries into busy slots."""
+    rng = random.Random(0)
+    population = scheduler.generate_initial_population()
+    schedules = list(population)
+    for _ in range(count):
+        schedule = rng.choice(population).copy()
+        for _ in range(3):
+            slot, entry = rng.choice(schedule.sorted_entries())
+            schedule.move_entry(entry, slot, rng.choice(list(schedule.entries)))
+        schedules.append(schedule)
+    return schedules
+
+def test_bitmask_validator_matches_validate_hard_constraints(make_scheduler):
+    scheduler = make_scheduler("medium")
+    results = set()
+    
+    for schedule in _schedules(scheduler):
+        schedule.clear_caches()
+        valid = scheduler.validator.is_valid(schedule)
+        schedule.clear_caches()
+        assert valid == schedule.validate_hard_constraints()
+        assert scheduler.validator.report(schedule).is_valid == valid
+        for slot in schedule.entries:
+            assert scheduler.validator.slot_valid(schedule, slot) == schedule.validate_slot(slot)
+        results.add(valid)
+    
+    assert results == {True, False}
+
+def test_schedule_without_reported_entries_is_valid(make_scheduler):
+    scheduler = make_scheduler("medium")
+    
+    for schedule in _schedules(scheduler):
+        for slot, entry in scheduler.validator.report(schedule).conflicting_entries():
+            schedule.remove_entry(slot, entry)
+        assert schedule.validate_hard_constraints()
+
+def test_report_does_not_depend_on_entry_order(make_scheduler):
+    scheduler = make_scheduler("medium")
+    
+    for schedule in _schedules(scheduler):
+        reversed_schedule = Schedule()
+        for slot, entry in reversed(schedule.sorted_entries()):
+            reversed_schedule.add_entry(slot, entry)
+        assert scheduler.validator.report(reversed_schedule) == scheduler.validator.report(schedule)
+
+def test_entry_shared_by_two_slots_is_reported_in_both(make_scheduler):
+    scheduler = make_scheduler()
+    subject, lecturer = scheduler.subjects[0], scheduler.lecturers[0]
+    first = ScheduleEntry(subject, lecturer, scheduler.classrooms[0], [scheduler.groups[0]])
+    second = ScheduleEntry(subject, lecturer, scheduler.classrooms[1], [scheduler.groups[1]])
+    slots = [TimeSlot(0, 0), TimeSlot(1, 0)]
+    
+    # The same two entry objects clash on their lecturer in both slots
+    schedule = Schedule()
+    for slot in slots:
+        schedule.add_entry(slot, first)
+        schedule.add_entry(slot, second)
+    
+    conflicting = scheduler.validator.report(schedule).conflicting_entries()
+    assert [slot for slot, _ in conflicting] == slots
+    assert conflicting[0][1] is conflicting[1][1]
\ No newline at end of file
@@ -0,0 +1,33 @@
+import random
+from dataclasses import replace
+import pytest
+from algorithms.evaluator import ScheduleEvaluator
+
+def _populations(scheduler):
+    """A valid population and children of it made by crossover, clashes and room changes."""
+    rng = random.Random(0)
+    population = scheduler.generate_initial_population()
+    children = [scheduler._crossover(*rng.sample(population, 2)) for _ in range(20)]
+    for _ in range(20):
+        child = rng.choice(population).copy()
+        slot, entry = rng.choice(child.sorted_entries())
+        child.remove_entry(slot, entry)
+        child.add_entry(rng.choice(list(child.entries)), replace(entry, classroom=rng.choice(scheduler.classrooms)))
+        children.append(child)
+    return population, children
+
+@pytest.mark.parametrize("legacy_scoring", [False, True])
+@pytest.mark.parametrize("size", ["small", "medium"])
+def test_population_evaluator_matches_schedule_evaluator(make_scheduler, size, legacy_scoring):
+    scheduler = make_scheduler(size, legacy_scoring=legacy_scoring)
+    evaluator = ScheduleEvaluator(legacy_scoring=legacy_scoring, time_grid=scheduler.time_grid)
+    population, children = _populations(scheduler)
+    
+    validity = set()
+    for schedules in (population, children):
+        scores = scheduler.population_evaluator.evaluate([scheduler.encoder.encode(s) for s in schedules])
+        for schedule, score in zip(schedules, scores.tolist()):
+            assert score == pytest.approx(evaluator.calculate_score(schedule))
+            validity.add(schedule.validate_hard_constraints())
+    
+    assert validity == {True, False}
\ No newline at end of file